@@ -49,21 +49,22 @@ class Vec:
         return self.n
 
 # Example: Real vector
-vec1 = Vec(float, 3, [1.0, 2.0, 3.0])
-vec2 = Vec(float, 3, [4.0, 5.0, 6.0])
+if __name__ == "__main__":
+    vec1 = Vec(float, 3, [1.0, 2.0, 3.0])
+    vec2 = Vec(float, 3, [4.0, 5.0, 6.0])
 
-print("vec1:", vec1)
-print("vec2:", vec2)
-print("Addition:", vec1 + vec2)
-print("Dot product:", vec1.dot(vec2))
-print("Magnitude of vec1:", vec1.magnitude())
+    print("vec1:", vec1)
+    print("vec2:", vec2)
+    print("Addition:", vec1 + vec2)
+    print("Dot product:", vec1.dot(vec2))
+    print("Magnitude of vec1:", vec1.magnitude())
 
-# Example: Complex vector
-vec3 = Vec(complex, 2, [1 + 2j, 3 + 4j])
-vec4 = Vec(complex, 2, [5 + 6j, 7 + 8j])
+    # Example: Complex vector
+    vec3 = Vec(complex, 2, [1 + 2j, 3 + 4j])
+    vec4 = Vec(complex, 2, [5 + 6j, 7 + 8j])
 
-print("vec3:", vec3)
-print("vec4:", vec4)
-print("Addition:", vec3 + vec4)
-print("Dot product:", vec3.dot(vec4))
-print("Magnitude of vec3:", vec3.magnitude())
+    print("vec3:", vec3)
+    print("vec4:", vec4)
+    print("Addition:", vec3 + vec4)
+    print("Dot product:", vec3.dot(vec4))
+    print("Magnitude of vec3:", vec3.magnitude())
@@ -38,23 +38,24 @@ class Matrix:
 
 
 # Example:
-try:
-    print("Create a real matrix (2x3):")
-    real_matrix = Matrix(field='real', n=2, m=3, values=[[1, 2, 3], [4, 5, 6]])
-    print(real_matrix)
-
-    print("\nCreate a complex matrix (2x2):")
-    complex_matrix = Matrix(field='complex', n=2, m=2, values=[[1+2j, 2-3j], [3+4j, 4-5j]])
-    print(complex_matrix)
-
-    print("\nSet an entry in the complex matrix:")
-    complex_matrix.set_entry(1, 1, 10+10j)
-    print(complex_matrix)
-
-    print("\nGet an entry from the real matrix:")
-    print(real_matrix.get_entry(0, 1)) 
-
-except ValueError as e:
-    print("\nError:", e)
-except IndexError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    try:
+        print("Create a real matrix (2x3):")
+        real_matrix = Matrix(field='real', n=2, m=3, values=[[1, 2, 3], [4, 5, 6]])
+        print(real_matrix)
+
+        print("\nCreate a complex matrix (2x2):")
+        complex_matrix = Matrix(field='complex', n=2, m=2, values=[[1+2j, 2-3j], [3+4j, 4-5j]])
+        print(complex_matrix)
+
+        print("\nSet an entry in the complex matrix:")
+        complex_matrix.set_entry(1, 1, 10+10j)
+        print(complex_matrix)
+
+        print("\nGet an entry from the real matrix:")
+        print(real_matrix.get_entry(0, 1)) 
+
+    except ValueError as e:
+        print("\nError:", e)
+    except IndexError as e:
+        print("\nError:", e)
@@ -51,6 +51,10 @@ class Mat:
         elif isinstance(other, Mat):  # Matrix multiplication
             if self.m != other.n or self.field_type != other.field_type:
                 raise ValueError("Matrix multiplication requires compatible dimensions and field types.")
+            if self.n == self.m == other.m and 2 <= self.n <= 4:
+                a = [entry for row in self.entries for entry in row]
+                b = [entry for row in other.entries for entry in row]
+                return Mat(self.field_type, self.n, self.n, Mat.multiply_small(a, b, self.n))
             result = []
             for i in range(self.n):
                 row = []
@@ -61,6 +65,73 @@ class Mat:
         else:
             raise TypeError("Can only multiply matrix by scalar or another matrix.")
 
+    @staticmethod
+    def multiply_small(a, b, size):
+        """
+        Multiply two square matrices of size 2 to 4 with unrolled kernels.
+
+        Args:
+        a (sequence): The size*size entries of the left matrix in row-major order.
+        b (sequence): The size*size entries of the right matrix in row-major order.
+        size (int): The number of rows (and columns) of each matrix.
+
+        Returns:
+        list: The entries of the product in row-major order.
+        """
+        if size == 2:
+            a0, a1, a2, a3 = a
+            b0, b1, b2, b3 = b
+            return [a0 * b0 + a1 * b2, a0 * b1 + a1 * b3,
+                    a2 * b0 + a3 * b2, a2 * b1 + a3 * b3]
+
+        if size == 3:
+            b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+            result = []
+            for o in (0, 3, 6):
+                x, y, z = a[o], a[o + 1], a[o + 2]
+                result += [x * b00 + y * b10 + z * b20,
+                           x * b01 + y * b11 + z * b21,
+                           x * b02 + y * b12 + z * b22]
+            return result
+
+        (b00, b01, b02, b03, b10, b11, b12, b13,
+         b20, b21, b22, b23, b30, b31, b32, b33) = b
+        result = []
+        for o in (0, 4, 8, 12):
+            w, x, y, z = a[o], a[o + 1], a[o + 2], a[o + 3]
+            result += [w * b00 + x * b10 + y * b20 + z * b30,
+                       w * b01 + x * b11 + y * b21 + z * b31,
+                       w * b02 + x * b12 + y * b22 + z * b32,
+                       w * b03 + x * b13 + y * b23 + z * b33]
+        return result
+
+    @staticmethod
+    def multiply_batch(packed_a, packed_b, size):
+        """
+        Multiply two batches of small square matrices pairwise in one call.
+
+        Args:
+        packed_a (list): N left matrices of size 2 to 4, concatenated in row-major order.
+        packed_b (list): N right matrices of the same size, concatenated in row-major order.
+        size (int): The number of rows (and columns) of each matrix.
+
+        Returns:
+        list: The N products, concatenated in row-major order.
+
+        Raises:
+        ValueError: If the size is unsupported or the batches do not match.
+        """
+        if size not in (2, 3, 4):
+            raise ValueError("Batched multiplication supports matrices from 2x2 to 4x4.")
+        stride = size * size
+        if len(packed_a) != len(packed_b) or len(packed_a) % stride != 0:
+            raise ValueError("Both batches must hold the same number of size x size matrices.")
+
+        result = []
+        for o in range(0, len(packed_a), stride):
+            result += Mat.multiply_small(packed_a[o:o + stride], packed_b[o:o + stride], size)
+        return result
+
     def transpose(self):
         transposed_entries = [self.entries[j][i] for i in range(self.m) for j in range(self.n)]
         return Mat(self.field_type, self.m, self.n, transposed_entries)
@@ -73,20 +144,21 @@ class Mat:
 
 
 # Example: Initializing matrix using column vectors
-vector1 = [1.0, 2.0, 3.0]
-vector2 = [4.0, 5.0, 6.0]
-vector3 = [7.0, 8.0, 9.0]
+if __name__ == "__main__":
+    vector1 = [1.0, 2.0, 3.0]
+    vector2 = [4.0, 5.0, 6.0]
+    vector3 = [7.0, 8.0, 9.0]
 
-mat_from_vectors = Mat(float, vectors=[vector1, vector2, vector3])
+    mat_from_vectors = Mat(float, vectors=[vector1, vector2, vector3])
 
-print("Matrix from column vectors:")
-print(mat_from_vectors)
+    print("Matrix from column vectors:")
+    print(mat_from_vectors)
 
-# Example: Real matrix initialized from entries
-mat1 = Mat(float, 3, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
-print("\nMatrix initialized from entries:")
-print(mat1)
+    # Example: Real matrix initialized from entries
+    mat1 = Mat(float, 3, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+    print("\nMatrix initialized from entries:")
+    print(mat1)
 
-# Example: Addition example
-print("\nAddition of two matrices:")
-print(mat_from_vectors + mat1)
+    # Example: Addition example
+    print("\nAddition of two matrices:")
+    print(mat_from_vectors + mat1)
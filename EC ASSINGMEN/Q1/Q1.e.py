@@ -79,44 +79,45 @@ class Matrix:
 
 
 # Example: Matrix initialization
-mat_a = Matrix(float, 2, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
-mat_b = Matrix(float, 2, 3, [7.0, 8.0, 9.0, 10.0, 11.0, 12.0])
-mat_c = Matrix(float, 3, 2, [1.0, 4.0, 2.0, 5.0, 3.0, 6.0])
-
-print("Matrix A:")
-print(mat_a)
-print("\nMatrix B:")
-print(mat_b)
-
-# Example: Addition
-try:
-    print("\nMatrix A + Matrix B:")
-    print(mat_a + mat_b)
-except (ValueError, TypeError) as e:
-    print(e)
-
-# Example: Scalar Multiplication
-scalar_value = 2.0
-print(f"\nMatrix A multiplied by scalar {scalar_value}:")
-print(mat_a * scalar_value)
-
-# Example: Matrix Multiplication
-try:
-    print("\nMatrix A * Matrix C:")
-    print(mat_a * mat_c)
-except (ValueError, TypeError) as e:
-    print(e)
-
-# Example: Error in Addition
-try:
-    print("\nAttempting to add Matrix A and Matrix C:")
-    print(mat_a + mat_c)
-except (ValueError, TypeError) as e:
-    print(e)
-
-# Example: Error in Multiplication
-try:
-    print("\nAttempting to multiply Matrix B and Matrix C:")
-    print(mat_b * mat_c)
-except (ValueError, TypeError) as e:
-    print(e)
+if __name__ == "__main__":
+    mat_a = Matrix(float, 2, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    mat_b = Matrix(float, 2, 3, [7.0, 8.0, 9.0, 10.0, 11.0, 12.0])
+    mat_c = Matrix(float, 3, 2, [1.0, 4.0, 2.0, 5.0, 3.0, 6.0])
+
+    print("Matrix A:")
+    print(mat_a)
+    print("\nMatrix B:")
+    print(mat_b)
+
+    # Example: Addition
+    try:
+        print("\nMatrix A + Matrix B:")
+        print(mat_a + mat_b)
+    except (ValueError, TypeError) as e:
+        print(e)
+
+    # Example: Scalar Multiplication
+    scalar_value = 2.0
+    print(f"\nMatrix A multiplied by scalar {scalar_value}:")
+    print(mat_a * scalar_value)
+
+    # Example: Matrix Multiplication
+    try:
+        print("\nMatrix A * Matrix C:")
+        print(mat_a * mat_c)
+    except (ValueError, TypeError) as e:
+        print(e)
+
+    # Example: Error in Addition
+    try:
+        print("\nAttempting to add Matrix A and Matrix C:")
+        print(mat_a + mat_c)
+    except (ValueError, TypeError) as e:
+        print(e)
+
+    # Example: Error in Multiplication
+    try:
+        print("\nAttempting to multiply Matrix B and Matrix C:")
+        print(mat_b * mat_c)
+    except (ValueError, TypeError) as e:
+        print(e)
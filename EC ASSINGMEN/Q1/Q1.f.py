@@ -72,23 +72,24 @@ class Matrix:
 
 
 # Example: Initialize a matrix
-example_matrix = Matrix(float, 3, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
+if __name__ == "__main__":
+    example_matrix = Matrix(float, 3, 3, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0])
 
-print("Matrix:")
-print(example_matrix)
+    print("Matrix:")
+    print(example_matrix)
 
-# Example: Retrieve a specific row
-print("\nRow 1 (0-indexed):")
-row_1 = example_matrix.get_row(1)
-print(row_1)
+    # Example: Retrieve a specific row
+    print("\nRow 1 (0-indexed):")
+    row_1 = example_matrix.get_row(1)
+    print(row_1)
 
-# Example: Retrieve a specific column
-print("\nColumn 2 (0-indexed):")
-column_2 = example_matrix.get_column(2)
-print(column_2)
+    # Example: Retrieve a specific column
+    print("\nColumn 2 (0-indexed):")
+    column_2 = example_matrix.get_column(2)
+    print(column_2)
 
-# Example: Matrix multiplication example
-multiplicand = Matrix(float, 3, 1, [1.0, 0.0, -1.0])
-print("\nMultiplying matrix by a 3x1 column vector:")
-result = example_matrix.multiply(multiplicand)
-print(result)
+    # Example: Matrix multiplication example
+    multiplicand = Matrix(float, 3, 1, [1.0, 0.0, -1.0])
+    print("\nMultiplying matrix by a 3x1 column vector:")
+    result = example_matrix.multiply(multiplicand)
+    print(result)
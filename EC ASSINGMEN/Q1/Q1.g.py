@@ -62,22 +62,23 @@ class Matrix:
 
 
 # Example: Initialize a complex matrix
-complex_matrix = Matrix(complex, 2, 2, [1 + 2j, 3 + 4j, 5 + 6j, 7 + 8j])
+if __name__ == "__main__":
+    complex_matrix = Matrix(complex, 2, 2, [1 + 2j, 3 + 4j, 5 + 6j, 7 + 8j])
 
-print("Original Matrix:")
-print(complex_matrix)
+    print("Original Matrix:")
+    print(complex_matrix)
 
-# Example: Transpose
-print("\nTranspose of the Matrix:")
-transpose_matrix = complex_matrix.calculate_transpose()
-print(transpose_matrix)
+    # Example: Transpose
+    print("\nTranspose of the Matrix:")
+    transpose_matrix = complex_matrix.calculate_transpose()
+    print(transpose_matrix)
 
-# Example: Conjugate
-print("\nConjugate of the Matrix:")
-conjugate_matrix = complex_matrix.calculate_conjugate()
-print(conjugate_matrix)
+    # Example: Conjugate
+    print("\nConjugate of the Matrix:")
+    conjugate_matrix = complex_matrix.calculate_conjugate()
+    print(conjugate_matrix)
 
-# Example: Conjugate Transpose
-print("\nConjugate Transpose of the Matrix:")
-conjugate_transpose_matrix = complex_matrix.calculate_conjugate_transpose()
-print(conjugate_transpose_matrix)
+    # Example: Conjugate Transpose
+    print("\nConjugate Transpose of the Matrix:")
+    conjugate_transpose_matrix = complex_matrix.calculate_conjugate_transpose()
+    print(conjugate_transpose_matrix)
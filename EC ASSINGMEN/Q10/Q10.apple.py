@@ -1,3 +1,15 @@
+import cmath
+import math
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixDecompositions:
     @staticmethod
     def transpose(matrix):
@@ -14,41 +26,485 @@ class MatrixDecompositions:
     def identity_matrix(size):
         return [[1 if i == j else 0 for j in range(size)] for i in range(size)]
 
+    @staticmethod
+    def conjugate_transpose(matrix):
+        return [[matrix[j][i].conjugate() for j in range(len(matrix))] for i in range(len(matrix[0]))]
+
+    @staticmethod
+    def frobenius_norm(matrix):
+        return math.sqrt(sum(abs(x) ** 2 for row in matrix for x in row))
+
     @staticmethod
     def inverse(matrix):
+        """
+        Invert a square matrix by Gauss-Jordan elimination with partial pivoting.
+
+        Args:
+        matrix (list of lists): The square matrix (real or complex).
+
+        Returns:
+        list of lists: The inverse.
+
+        Raises:
+        ValueError: If the matrix is singular.
+        """
         n = len(matrix)
-        identity = MatrixDecompositions.identity_matrix(n)
-        augmented = [matrix[i] + identity[i] for i in range(n)]
+        augmented = [list(matrix[i]) + [1 if i == j else 0 for j in range(n)] for i in range(n)]
+        scale = max((abs(x) for row in matrix for x in row), default=0)
 
         for i in range(n):
-            pivot = augmented[i][i]
-            if abs(pivot) < 1e-10:
+            p = max(range(i, n), key=lambda r: abs(augmented[r][i]))
+            if abs(augmented[p][i]) <= 1e-14 * scale or scale == 0:
                 raise ValueError("Matrix is singular and cannot be inverted.")
-            for j in range(2 * n):
-                augmented[i][j] /= pivot
+            augmented[i], augmented[p] = augmented[p], augmented[i]
+            row_i = augmented[i]
+            pivot = row_i[i]
+            for j in range(i, 2 * n):
+                row_i[j] /= pivot
             for k in range(n):
                 if k != i:
-                    factor = augmented[k][i]
-                    for j in range(2 * n):
-                        augmented[k][j] -= factor * augmented[i][j]
+                    row_k = augmented[k]
+                    factor = row_k[i]
+                    if factor:
+                        for j in range(i, 2 * n):
+                            row_k[j] -= factor * row_i[j]
 
         return [row[n:] for row in augmented]
 
+    # Padé coefficients and 1-norm thresholds for expm (Higham, 2005).
+    EXPM_PADE = {
+        3: [120, 60, 12, 1],
+        5: [30240, 15120, 3360, 420, 30, 1],
+        7: [17297280, 8648640, 1995840, 277200, 25200, 1512, 56, 1],
+        9: [17643225600, 8821612800, 2075673600, 302702400, 30270240, 2162160, 110880, 3960, 90, 1],
+        13: [64764752532480000, 32382376266240000, 7771770303897600, 1187353796428800,
+             129060195264000, 10559470521600, 670442572800, 33522128640, 1323241920,
+             40840800, 960960, 16380, 182, 1],
+    }
+    EXPM_THETA = {3: 1.495585217958292e-2, 5: 2.539398330063230e-1, 7: 9.504178996162932e-1,
+                  9: 2.097847961257068e0, 13: 5.371920351148152e0}
+
+    # 1-norm of A - I below which the degree-m Padé approximant of log(A) is accurate
+    # to unit roundoff (Al-Mohy and Higham, 2012).
+    LOGM_THETA = [1.59e-5, 2.31e-3, 1.94e-2, 6.21e-2, 1.28e-1, 2.06e-1, 2.88e-1, 3.67e-1,
+                  4.39e-1, 5.03e-1, 5.60e-1, 6.09e-1, 6.52e-1, 6.89e-1, 7.21e-1, 7.49e-1]
+
+    @staticmethod
+    def norm_1(matrix):
+        return max(sum(abs(row[j]) for row in matrix) for j in range(len(matrix[0])))
+
+    @staticmethod
+    def lu_factor(matrix):
+        """
+        Factor a square matrix as PA = LU with MatrixInverse.lu_factor.
+
+        Args:
+        matrix (list of lists): The input square matrix (real or complex).
+
+        Returns:
+        tuple: The packed LU matrix and the row permutation, for MatrixInverse.lu_solve.
+
+        Raises:
+        ValueError: If the matrix is singular.
+        """
+        factors = linalg.q5_apple.MatrixInverse.lu_factor(matrix)
+        if factors is None:
+            raise ValueError("Matrix is singular; LU factorization not possible.")
+        return factors
+
+    @staticmethod
+    def symmetric_function(matrix, f):
+        """
+        Apply a scalar function to a real symmetric matrix through its eigendecomposition.
+
+        Args:
+        matrix (list of lists): The real symmetric matrix.
+        f (callable): The scalar function, applied to each eigenvalue.
+
+        Returns:
+        list of lists: V diag(f(lambda)) V^T.
+        """
+        n = len(matrix)
+        values, V = linalg.q10_camera.MatrixDecompositions.eigen_decomposition(matrix)
+        fvalues = [f(x) for x in values]
+        return [[sum(V[i][k] * fvalues[k] * V[j][k] for k in range(n)) for j in range(n)]
+                for i in range(n)]
+
+    @staticmethod
+    def is_real_symmetric(matrix):
+        n = len(matrix)
+        return (all(not isinstance(x, complex) for row in matrix for x in row)
+                and all(matrix[i][j] == matrix[j][i] for i in range(n) for j in range(i + 1, n)))
+
+    @staticmethod
+    def relative_residual(A, B):
+        """Relative 1-norm distance ||A - B||_1 / ||B||_1."""
+        size = MatrixDecompositions.norm_1(B)
+        diff = [[a - b for a, b in zip(ra, rb)] for ra, rb in zip(A, B)]
+        return MatrixDecompositions.norm_1(diff) / size if size else 0.0
+
     @staticmethod
-    def matrix_square_root(matrix):
+    def triangular_square_root(T):
+        """
+        Principal square root of an upper triangular matrix by the Björck-Hammarling recurrence.
+
+        Args:
+        T (list of lists): The upper triangular matrix; a negative diagonal entry gives
+        a complex root.
+
+        Returns:
+        list of lists: The upper triangular square root R, with R^2 = T.
+
+        Raises:
+        ValueError: If two diagonal entries of T are zero (no square root is defined).
+        """
+        n = len(T)
+        R = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            d = T[i][i]
+            R[i][i] = cmath.sqrt(d) if isinstance(d, complex) or d < 0 else math.sqrt(d)
+        for j in range(1, n):
+            for i in range(j - 1, -1, -1):
+                denominator = R[i][i] + R[j][j]
+                numerator = T[i][j] - sum(R[i][k] * R[k][j] for k in range(i + 1, j))
+                if denominator == 0:
+                    if numerator != 0:
+                        raise ValueError("Matrix is singular and has no square root.")
+                    continue
+                R[i][j] = numerator / denominator
+        return R
+
+    @staticmethod
+    def matrix_square_root(matrix, tolerance=1e-12, max_iter=50, error=False):
+        """
+        Compute the principal square root of a square matrix.
+
+        Upper triangular matrices (such as Schur forms) use the Björck-Hammarling
+        recurrence and real symmetric matrices their eigendecomposition; any other
+        matrix uses the determinant-scaled product form of the Denman-Beavers iteration, which stops
+        once the auxiliary iterate M is within tolerance of the identity.
+
+        Args:
+        matrix (list of lists): The square matrix, with no eigenvalues on the closed
+        negative real axis unless it is triangular or real symmetric (then the root is
+        complex).
+        tolerance (float): Convergence tolerance on ||M - I||_1.
+        max_iter (int): Maximum number of iterations.
+        error (bool): If True, also return the relative residual ||X^2 - A||_1 / ||A||_1.
+
+        Returns:
+        list of lists or tuple: The square root X, with the error estimate if requested.
+
+        Raises:
+        ValueError: If the matrix is singular or the iteration does not converge.
+        """
         n = len(matrix)
-        identity = MatrixDecompositions.identity_matrix(n)
-        current_approx = identity[:]
+        if n == 0 or len(matrix[0]) != n:
+            raise ValueError("Matrix must be square.")
+
+        if all(matrix[i][j] == 0 for i in range(n) for j in range(i)):
+            X = MatrixDecompositions.triangular_square_root(matrix)
+        elif MatrixDecompositions.is_real_symmetric(matrix):
+            top = max(abs(x) for row in matrix for x in row)
+            X = MatrixDecompositions.symmetric_function(
+                matrix, lambda x: math.sqrt(max(x, 0.0)) if x > -1e-14 * top else cmath.sqrt(x))
+        else:
+            identity = MatrixDecompositions.identity_matrix(n)
+            M = [list(row) for row in matrix]
+            X = [list(row) for row in matrix]
+            scaling = True
+            for _ in range(max_iter):
+                try:
+                    lu, perm = MatrixDecompositions.lu_factor(M)
+                except ValueError:
+                    raise ValueError("Matrix is singular or has eigenvalues on the negative real axis; "
+                                     "its principal square root is not defined.")
+                M_inv = linalg.q5_apple.MatrixInverse.lu_solve(lu, perm, identity)
+                if scaling:
+                    log_det = sum(math.log(abs(lu[i][i])) for i in range(n))
+                    mu = math.exp(-log_det / (2 * n))
+                else:
+                    mu = 1.0
+                mu2 = mu * mu
+                X = [[0.5 * mu * (sum(X[i][k] * M_inv[k][j] for k in range(n)) / mu2 + X[i][j])
+                      for j in range(n)] for i in range(n)]
+                M = [[0.5 * ((1 if i == j else 0) + 0.5 * (mu2 * M[i][j] + M_inv[i][j] / mu2))
+                      for j in range(n)] for i in range(n)]
+                distance = MatrixDecompositions.norm_1(
+                    [[M[i][j] - (1 if i == j else 0) for j in range(n)] for i in range(n)])
+                if distance <= tolerance:
+                    break
+                if distance < 1e-2:
+                    scaling = False
+            else:
+                raise ValueError("Square root iteration did not converge; the matrix may have "
+                                 "eigenvalues on the negative real axis.")
+
+        if not error:
+            return X
+        return X, MatrixDecompositions.relative_residual(MatrixDecompositions.multiply_matrices(X, X), matrix)
+
+    @staticmethod
+    def expm(A, error=False):
+        """
+        Compute the matrix exponential by scaling and squaring with a Padé approximant.
+
+        The lowest Padé degree (3, 5, 7, 9 or 13) that reaches double precision for
+        ||A||_1 is used, so small matrices cost only a few products; larger norms are
+        scaled by 2^-s first and squared back s times.
+
+        Args:
+        A (list of lists): The square matrix (real or complex).
+        error (bool): If True, also return an estimate of the relative backward error
+        of the Padé approximation.
+
+        Returns:
+        list of lists or tuple: exp(A), with the error estimate if requested.
+
+        Raises:
+        ValueError: If A is not square.
+        """
+        n = len(A)
+        if n == 0 or len(A[0]) != n:
+            raise ValueError("Matrix must be square.")
+        eps = sys.float_info.epsilon / 2
+
+        if all(A[i][j] == 0 for i in range(n) for j in range(n) if i != j):
+            diagonal = [cmath.exp(A[i][i]) if isinstance(A[i][i], complex) else math.exp(A[i][i])
+                        for i in range(n)]
+            E = [[diagonal[i] if i == j else 0.0 for j in range(n)] for i in range(n)]
+            return (E, eps) if error else E
+
+        multiply = MatrixDecompositions.multiply_matrices
+        norm = MatrixDecompositions.norm_1(A)
+        s = 0
+        for m in (3, 5, 7, 9, 13):
+            if norm <= MatrixDecompositions.EXPM_THETA[m]:
+                break
+        else:
+            s = max(0, math.ceil(math.log2(norm / MatrixDecompositions.EXPM_THETA[13])))
+        if s:
+            A = [[x / 2 ** s for x in row] for row in A]
+        b = MatrixDecompositions.EXPM_PADE[m]
+
+        powers = [MatrixDecompositions.identity_matrix(n), multiply(A, A)]
+        if m == 13:
+            A2 = powers[1]
+            A4 = multiply(A2, A2)
+            A6 = multiply(A4, A2)
+
+            def combine(c6, c4, c2, c0=0):
+                return [[c6 * A6[i][j] + c4 * A4[i][j] + c2 * A2[i][j] + (c0 if i == j else 0)
+                         for j in range(n)] for i in range(n)]
+
+            U = multiply(A, [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(
+                multiply(A6, combine(b[13], b[11], b[9])), combine(b[7], b[5], b[3], b[1]))])
+            V = [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(
+                multiply(A6, combine(b[12], b[10], b[8])), combine(b[6], b[4], b[2], b[0]))]
+        else:
+            for _ in range(2, m // 2 + 1):
+                powers.append(multiply(powers[-1], powers[1]))
+            odd = [[sum(b[2 * k + 1] * powers[k][i][j] for k in range(len(powers)))
+                    for j in range(n)] for i in range(n)]
+            U = multiply(A, odd)
+            V = [[sum(b[2 * k] * powers[k][i][j] for k in range(len(powers)))
+                  for j in range(n)] for i in range(n)]
 
-        for _ in range(20):  
-            inv_approx = MatrixDecompositions.inverse(current_approx)
-            next_approx = MatrixDecompositions.multiply_matrices(
-                MatrixDecompositions.add_matrices(current_approx, inv_approx), 
-                MatrixDecompositions.scalar_multiply(identity, 0.5)
-            )
-            current_approx = next_approx
+        lu, perm = MatrixDecompositions.lu_factor(
+            [[v - u for v, u in zip(rv, ru)] for rv, ru in zip(V, U)])
+        E = linalg.q5_apple.MatrixInverse.lu_solve(
+            lu, perm, [[v + u for v, u in zip(rv, ru)] for rv, ru in zip(V, U)])
+        for _ in range(s):
+            E = multiply(E, E)
 
-        return current_approx
+        if not error:
+            return E
+        # Leading term of the backward error of the [m/m] Padé approximant at ||2^-s A||_1.
+        c = math.factorial(m) ** 2 / (math.factorial(2 * m) * math.factorial(2 * m + 1))
+        return E, max(eps, c * (norm / 2 ** s) ** (2 * m))
+
+    @staticmethod
+    def gauss_legendre(m):
+        """
+        Nodes and weights of the m-point Gauss-Legendre rule on [0, 1].
+
+        Args:
+        m (int): Number of nodes.
+
+        Returns:
+        tuple: The nodes and the weights.
+        """
+        nodes, weights = [], []
+        for i in range(1, m + 1):
+            x = math.cos(math.pi * (i - 0.25) / (m + 0.5))
+            for _ in range(100):
+                p0, p1 = 1.0, x
+                for k in range(2, m + 1):
+                    p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+                dp = m * (x * p1 - p0) / (x * x - 1) if m > 1 else 1.0
+                step = p1 / dp
+                x -= step
+                if abs(step) <= 1e-16:
+                    break
+            nodes.append((x + 1) / 2)
+            weights.append(1 / ((1 - x * x) * dp * dp))
+        return nodes, weights
+
+    @staticmethod
+    def logm(A, error=False, max_roots=64):
+        """
+        Compute the principal matrix logarithm by inverse scaling and squaring.
+
+        Square roots are taken until ||A^(1/2^k) - I||_1 is small enough for a Padé
+        approximant of degree at most 16, evaluated as a Gauss-Legendre partial fraction
+        sum with one LU solve per node; the result is scaled back by 2^k. Real symmetric
+        matrices use their eigendecomposition instead.
+
+        Args:
+        A (list of lists): The square matrix, with no eigenvalues on the closed negative
+        real axis unless it is real symmetric (then the logarithm is complex).
+        error (bool): If True, also return the relative residual ||exp(L) - A||_1 / ||A||_1.
+        max_roots (int): Maximum number of square roots.
+
+        Returns:
+        list of lists or tuple: log(A), with the error estimate if requested.
+
+        Raises:
+        ValueError: If A is singular or the square roots do not converge.
+        """
+        n = len(A)
+        if n == 0 or len(A[0]) != n:
+            raise ValueError("Matrix must be square.")
+
+        if MatrixDecompositions.is_real_symmetric(A):
+            def log(x):
+                if x == 0:
+                    raise ValueError("Matrix is singular; its logarithm is not defined.")
+                return math.log(x) if x > 0 else cmath.log(x)
+            L = MatrixDecompositions.symmetric_function(A, log)
+        else:
+            identity = MatrixDecompositions.identity_matrix(n)
+            X = [list(row) for row in A]
+            k = 0
+            while True:
+                E = [[X[i][j] - (1 if i == j else 0) for j in range(n)] for i in range(n)]
+                norm = MatrixDecompositions.norm_1(E)
+                if norm <= MatrixDecompositions.LOGM_THETA[-1]:
+                    break
+                if k == max_roots:
+                    raise ValueError("Logarithm did not converge; too many square roots needed.")
+                X = MatrixDecompositions.matrix_square_root(X)
+                k += 1
+
+            m = next(i + 1 for i, theta in enumerate(MatrixDecompositions.LOGM_THETA) if norm <= theta)
+            nodes, weights = MatrixDecompositions.gauss_legendre(m)
+            L = [[0.0] * n for _ in range(n)]
+            for x, w in zip(nodes, weights):
+                lu, perm = MatrixDecompositions.lu_factor(
+                    [[identity[i][j] + x * E[i][j] for j in range(n)] for i in range(n)])
+                term = linalg.q5_apple.MatrixInverse.lu_solve(lu, perm, E)
+                L = [[l + w * t for l, t in zip(rl, rt)] for rl, rt in zip(L, term)]
+            if k:
+                L = [[x * 2 ** k for x in row] for row in L]
+
+        if not error:
+            return L
+        return L, MatrixDecompositions.relative_residual(MatrixDecompositions.expm(L), A)
+
+    @staticmethod
+    def matrix_power(A, p, error=False):
+        """
+        Compute A^p for a real exponent p.
+
+        Integer powers use repeated squaring (with one LU inversion when p < 0), p = 1/2
+        uses matrix_square_root, real symmetric matrices use their eigendecomposition and
+        any other power is exp(p log(A)).
+
+        Args:
+        A (list of lists): The square matrix.
+        p (float): The exponent.
+        error (bool): If True, also return an estimate of the relative error in the
+        1-norm. It depends on A: q n u ||A||^q / ||A^q|| for an integer power q, plus
+        q n u kappa_1(A) for the inversion when p < 0; for symmetric A, the change in
+        lambda^p when each eigenvalue moves by n u max|lambda|; otherwise the
+        propagated error estimates of logm and expm.
+
+        Returns:
+        list of lists or tuple: A^p, with the error estimate if requested.
+
+        Raises:
+        ValueError: If A is not square, or is singular and p is not a nonnegative integer.
+        """
+        n = len(A)
+        if n == 0 or len(A[0]) != n:
+            raise ValueError("Matrix must be square.")
+        eps = sys.float_info.epsilon / 2
+
+        if p == int(p):
+            q = abs(int(p))
+            base = [list(row) for row in A]
+            if p < 0:
+                lu, perm = MatrixDecompositions.lu_factor(A)
+                base = linalg.q5_apple.MatrixInverse.lu_solve(lu, perm, MatrixDecompositions.identity_matrix(n))
+            norm_base = MatrixDecompositions.norm_1(base)
+            kappa = MatrixDecompositions.norm_1(A) * norm_base
+            P = MatrixDecompositions.identity_matrix(n)
+            remaining = q
+            while remaining:
+                if remaining & 1:
+                    P = MatrixDecompositions.multiply_matrices(P, base)
+                remaining >>= 1
+                if remaining:
+                    base = MatrixDecompositions.multiply_matrices(base, base)
+            if not error:
+                return P
+
+            # Rounding in the products is relative to ||A||^q, which exceeds ||A^q|| when
+            # the powers cancel; an inverted base adds its own kappa_1(A) n u error q times.
+            norm_P = MatrixDecompositions.norm_1(P)
+            if q == 0 or norm_base == 0:
+                return P, 0.0
+            if norm_P == 0:
+                return P, math.inf
+            try:
+                growth = math.exp(q * math.log(norm_base) - math.log(norm_P))
+            except OverflowError:
+                growth = math.inf
+            estimate = q * n * eps * growth
+            if p < 0:
+                estimate += q * n * eps * kappa
+            return P, estimate
+
+        if p == 0.5:
+            return MatrixDecompositions.matrix_square_root(A, error=error)
+
+        if MatrixDecompositions.is_real_symmetric(A):
+            values, V = linalg.q10_camera.MatrixDecompositions.eigen_decomposition(A)
+            # The eigensolver moves each eigenvalue by about n u max|lambda|, so a smaller
+            # one is zero to working accuracy and a negative power is not defined.
+            delta = n * eps * max(abs(x) for x in values)
+            if p < 0 and any(abs(x) <= delta for x in values):
+                raise ValueError("Matrix is singular; negative powers are not defined.")
+            fvalues = [x ** p if x >= 0 else cmath.exp(p * cmath.log(x)) for x in values]
+            P = [[sum(V[i][k] * fvalues[k] * V[j][k] for k in range(n)) for j in range(n)]
+                 for i in range(n)]
+            if not error:
+                return P
+
+            # V is orthogonal to working accuracy, so the error is that of the scalar powers.
+            largest = max(abs(x) for x in fvalues)
+            change = 0.0
+            for x in values:
+                for moved in (abs(x) - delta, abs(x) + delta):
+                    if moved > 0:
+                        change = max(change, abs(moved ** p - abs(x) ** p))
+                    elif p < 0 or abs(x) > 0:
+                        change = max(change, math.inf if p < 0 else abs(x) ** p)
+            return P, n * eps + (change / largest if largest else 0.0)
+
+        L, log_error = MatrixDecompositions.logm(A, error=True)
+        P, exp_error = MatrixDecompositions.expm([[p * x for x in row] for row in L], error=True)
+        return (P, abs(p) * log_error + exp_error) if error else P
 
     @staticmethod
     def add_matrices(A, B):
@@ -59,40 +515,190 @@ class MatrixDecompositions:
         return [[scalar * matrix[i][j] for j in range(len(matrix[0]))] for i in range(len(matrix))]
 
     @staticmethod
-    def polar_decomposition(A):
-       
-        if len(A) != len(A[0]):
+    def polar_newton(A, tolerance, max_iter):
+        """
+        Unitary polar factor by the scaled Newton iteration X <- (z X + X^-H / z) / 2.
+
+        The scale z = (||X^-1||_1 ||X^-1||_inf / (||X||_1 ||X||_inf))^(1/4) is used
+        until the iterates settle, after which plain Newton converges quadratically.
+
+        Args:
+        A (list of lists): A square nonsingular matrix.
+        tolerance (float): Stop when the relative change in the iterate drops below it.
+        max_iter (int): Maximum number of iterations.
+
+        Returns:
+        tuple: The unitary factor and the number of iterations used.
+
+        Raises:
+        ValueError: If A is singular or the iteration does not converge.
+        """
+        n = len(A)
+        X = [list(row) for row in A]
+        scaling = True
+
+        def norm_1_inf(M):
+            one = max(sum(abs(M[i][j]) for i in range(n)) for j in range(n))
+            inf = max(sum(abs(x) for x in row) for row in M)
+            return one * inf
+
+        for iteration in range(1, max_iter + 1):
+            X_inv = MatrixDecompositions.inverse(X)
+            if scaling:
+                z = (norm_1_inf(X_inv) / norm_1_inf(X)) ** 0.25
+            else:
+                z = 1.0
+            change = 0.0
+            size = 0.0
+            X_next = []
+            for i in range(n):
+                row = []
+                for j in range(n):
+                    x = 0.5 * (z * X[i][j] + X_inv[j][i].conjugate() / z)
+                    change += abs(x - X[i][j]) ** 2
+                    size += abs(x) ** 2
+                    row.append(x)
+                X_next.append(row)
+            X = X_next
+            relative = math.sqrt(change / size)
+            if relative <= tolerance:
+                return X, iteration
+            if relative < 1e-2:
+                scaling = False
+
+        raise ValueError("Polar decomposition did not converge.")
+
+    @staticmethod
+    def polar_newton_schulz(A, tolerance, max_iter):
+        """
+        Unitary polar factor by the inverse-free Newton-Schulz iteration X <- X (3I - X^H X) / 2.
+
+        Converges when every singular value of A lies in (0, sqrt(3)); it suits inputs
+        that are already close to unitary, such as slightly perturbed rotations.
+
+        Args:
+        A (list of lists): A square matrix close to unitary.
+        tolerance (float): Stop when the relative change in the iterate drops below it.
+        max_iter (int): Maximum number of iterations.
+
+        Returns:
+        tuple: The unitary factor and the number of iterations used.
+
+        Raises:
+        ValueError: If the iteration diverges or does not converge.
+        """
+        n = len(A)
+        X = [list(row) for row in A]
+        previous = math.inf
+
+        for iteration in range(1, max_iter + 1):
+            XH = MatrixDecompositions.conjugate_transpose(X)
+            G = MatrixDecompositions.multiply_matrices(XH, X)
+            for i in range(n):
+                for j in range(n):
+                    G[i][j] = (1.5 if i == j else 0.0) - 0.5 * G[i][j]
+            X_next = MatrixDecompositions.multiply_matrices(X, G)
+            change = sum(abs(X_next[i][j] - X[i][j]) ** 2 for i in range(n) for j in range(n))
+            size = sum(abs(x) ** 2 for row in X_next for x in row)
+            X = X_next
+            relative = math.sqrt(change / size) if size else math.inf
+            if not math.isfinite(relative) or (relative > previous and relative > 0.5):
+                raise ValueError("Newton-Schulz iteration diverged; the matrix is not close enough to unitary.")
+            if relative <= tolerance:
+                return X, iteration
+            previous = relative
+
+        raise ValueError("Polar decomposition did not converge.")
+
+    @staticmethod
+    def polar_decomposition(A, method="auto", tolerance=1e-12, max_iter=100):
+        """
+        Compute the polar decomposition A = U P of a square real or complex matrix.
+
+        Args:
+        A (list of lists): The square matrix; it must be nonsingular for method "newton".
+        method (str): "newton" (scaled Newton), "newton_schulz" (inverse-free, for
+        nearly unitary A) or "auto", which uses Newton-Schulz when ||I - A^H A||_F < 0.5.
+        tolerance (float): Relative change at which the iteration stops.
+        max_iter (int): Maximum number of iterations.
+
+        Returns:
+        tuple: U (unitary, orthogonal for real A) and P (Hermitian positive semidefinite).
+
+        Raises:
+        ValueError: If A is not square, is singular, or the iteration does not converge.
+        """
+        if not A or len(A) != len(A[0]):
             raise ValueError("Matrix must be square for polar decomposition.")
+        if method not in ("auto", "newton", "newton_schulz"):
+            raise ValueError(f"Unknown method '{method}'.")
+        n = len(A)
 
-        A_T = MatrixDecompositions.transpose(A)
-        ATA = MatrixDecompositions.multiply_matrices(A_T, A)
+        if method == "auto":
+            AHA = MatrixDecompositions.multiply_matrices(MatrixDecompositions.conjugate_transpose(A), A)
+            distance = math.sqrt(sum(abs((1 if i == j else 0) - AHA[i][j]) ** 2
+                                     for i in range(n) for j in range(n)))
+            method = "newton_schulz" if distance < 0.5 else "newton"
 
-        P = MatrixDecompositions.matrix_square_root(ATA)
+        if method == "newton_schulz":
+            U, _ = MatrixDecompositions.polar_newton_schulz(A, tolerance, max_iter)
+        else:
+            U, _ = MatrixDecompositions.polar_newton(A, tolerance, max_iter)
 
-        P_inv = MatrixDecompositions.inverse(P)
-        U = MatrixDecompositions.multiply_matrices(A, P_inv)
+        # P = U^H A, symmetrized to remove rounding in the skew part.
+        H = MatrixDecompositions.multiply_matrices(MatrixDecompositions.conjugate_transpose(U), A)
+        P = [[0.5 * (H[i][j] + H[j][i].conjugate()) for j in range(n)] for i in range(n)]
+        if all(isinstance(x, (int, float)) for row in A for x in row):
+            U = [[x.real if isinstance(x, complex) else x for x in row] for row in U]
+            P = [[x.real if isinstance(x, complex) else x for x in row] for row in P]
 
         return U, P
 
 
 # Example:
-A = [
-    [1, 2],
-    [3, 4]
-]
+if __name__ == "__main__":
+    A = [
+        [1, 2],
+        [3, 4]
+    ]
 
-try:
-    decomposition_solver = MatrixDecompositions()
+    try:
+        decomposition_solver = MatrixDecompositions()
+
+        U, P = decomposition_solver.polar_decomposition(A)
+
+        print("Unitary Matrix U:")
+        for row in U:
+            print(row)
+
+        print("\nPositive Semidefinite Matrix P:")
+        for row in P:
+            print(row)
+
+        # A complex matrix close to unitary takes the inverse-free path.
+        C = [[1.01j, 0.02], [0.01, 0.99j]]
+        U, P = decomposition_solver.polar_decomposition(C)
+        print("\nUnitary factor of a complex matrix:")
+        for row in U:
+            print(row)
+
+        B = [[4, 1], [2, 3]]
+        print("\nSquare root of B:")
+        for row in decomposition_solver.matrix_square_root(B):
+            print(row)
 
-    U, P = decomposition_solver.polar_decomposition(A)
+        E, estimate = decomposition_solver.expm(B, error=True)
+        print("\nExponential of B (error estimate {:.1e}):".format(estimate))
+        for row in E:
+            print(row)
 
-    print("Unitary Matrix U:")
-    for row in U:
-        print(row)
+        print("\nLogarithm of B:")
+        for row in decomposition_solver.logm(B):
+            print(row)
 
-    print("\nPositive Semidefinite Matrix P:")
-    for row in P:
-        print(row)
+        print("\nB to the power 1/3:")
+        for row in decomposition_solver.matrix_power(B, 1 / 3):
+            print(row)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
@@ -1,55 +1,448 @@
+import math
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixDecompositions:
     @staticmethod
-    def is_hermitian(matrix):
+    def is_hermitian(matrix, tolerance=0.0):
         n = len(matrix)
         for i in range(n):
-            for j in range(n):
-                if matrix[i][j] != matrix[j][i]:
+            if len(matrix[i]) != n:
+                return False
+            for j in range(i + 1):
+                if abs(matrix[i][j] - matrix[j][i].conjugate()) > tolerance:
                     return False
         return True
 
     @staticmethod
-    def cholesky_decomposition(A):
-      
-        n = len(A)
+    def cholesky_decomposition(A, overwrite=False, block_size=32, check=True):
+        """
+        Factor a Hermitian positive definite matrix as A = L L^H (blocked, right-looking).
 
-      
-        if not MatrixDecompositions.is_hermitian(A):
+        Only the lower triangle of A is read. Each step factors a diagonal block,
+        solves the panel below it and applies one rank-block_size update to the
+        trailing lower triangle.
+
+        Args:
+        A (list of lists): The real symmetric or complex Hermitian matrix.
+        overwrite (bool): If True, write L into the lower triangle of A and return A;
+        the strict upper triangle is left untouched.
+        block_size (int): Number of columns per panel.
+        check (bool): If True, verify that A is Hermitian first.
+
+        Returns:
+        list of lists: The lower triangular factor L. Without overwrite it is stored
+        packed, row i holding only L[i][0..i], so the copy takes n(n+1)/2 entries.
+
+        Raises:
+        ValueError: If A is not Hermitian or not positive definite.
+        """
+        n = len(A)
+        if check and not MatrixDecompositions.is_hermitian(A, 1e-12 * max(
+                (abs(x) for row in A for x in row), default=0)):
             raise ValueError("Matrix is not Hermitian.")
 
-       
-        L = [[0.0] * n for _ in range(n)]
+        a = A if overwrite else [list(row[:i + 1]) for i, row in enumerate(A)]
 
+        for k0 in range(0, n, block_size):
+            k1 = min(k0 + block_size, n)
+
+            # Diagonal block and the panel below it, column by column.
+            for j in range(k0, k1):
+                row_j = a[j]
+                value = row_j[j] - sum(abs(row_j[k]) ** 2 for k in range(k0, j))
+                value = value.real if isinstance(value, complex) else value
+                if value <= 0:
+                    raise ValueError("Matrix is not positive definite.")
+                d = math.sqrt(value)
+                row_j[j] = d
+                conj_j = [row_j[k].conjugate() for k in range(k0, j)]
+                for i in range(j + 1, n):
+                    row_i = a[i]
+                    s = row_i[j] - sum(x * y for x, y in zip(row_i[k0:j], conj_j))
+                    row_i[j] = s / d
+
+            # Trailing update A22 -= L21 L21^H on the lower triangle.
+            panel = [[x.conjugate() for x in a[j][k0:k1]] for j in range(n)]
+            for i in range(k1, n):
+                row_i = a[i]
+                li = row_i[k0:k1]
+                for j in range(k1, i + 1):
+                    row_i[j] -= sum(x * y for x, y in zip(li, panel[j]))
+
+        return a
+
+    @staticmethod
+    def cho_solve(L, B):
+        """
+        Solve A X = B from the Cholesky factor of A (only the lower triangle of L is read).
+
+        Args:
+        L (list of lists): The factor returned by cholesky_decomposition.
+        B (list): A right-hand side vector, or a matrix with one column per right-hand side.
+
+        Returns:
+        list: The solution, with the same shape as B.
+        """
+        n = len(L)
+        vector = not isinstance(B[0], list)
+        X = [[b] for b in B] if vector else [list(row) for row in B]
+
+        # Forward substitution L Y = B, then back substitution L^H X = Y, row by row.
         for i in range(n):
-            for j in range(i + 1):
-                sum_k = sum(L[i][k] * L[j][k] for k in range(j))
+            row, xi = L[i], X[i]
+            for k in range(i):
+                if row[k] != 0:
+                    f, xk = row[k], X[k]
+                    xi = [a - f * b for a, b in zip(xi, xk)]
+            d = row[i]
+            X[i] = [a / d for a in xi]
+        for i in range(n - 1, -1, -1):
+            xi = X[i]
+            for k in range(i + 1, n):
+                f = L[k][i]
+                if f != 0:
+                    f, xk = f.conjugate(), X[k]
+                    xi = [a - f * b for a, b in zip(xi, xk)]
+            d = L[i][i]
+            X[i] = [a / d for a in xi]
 
-                if i == j:  
-                    value = A[i][i] - sum_k
-                    if value <= 0:
-                        raise ValueError("Matrix is not positive definite.")
-                    L[i][j] = value ** 0.5
-                else:  
-                    L[i][j] = (A[i][j] - sum_k) / L[j][j]
+        return [row[0] for row in X] if vector else X
+
+    @staticmethod
+    def condition_estimate(L, norm=None):
+        """
+        Estimate the 1-norm condition number of A in O(n^2) from its Cholesky factor.
+
+        ||A^-1||_1 comes from PLUSolver.inverse_norm_estimate with cho_solve for both
+        solves, as A is Hermitian. Without norm, ||A||_1 is estimated the same way
+        from products with L L^H, so A itself is not needed.
+
+        Args:
+        L (list of lists): The factor returned by cholesky_decomposition.
+        norm (float, optional): ||A||_1, if known.
+
+        Returns:
+        float: An estimate of ||A||_1 ||A^-1||_1.
+        """
+        estimate = linalg.q4_f.PLUSolver.inverse_norm_estimate
+        n = len(L)
+
+        def solve(x):
+            return MatrixDecompositions.cho_solve(L, x)
+
+        def multiply(x):
+            y = [sum(L[i][j].conjugate() * x[i] for i in range(j, n)) for j in range(n)]
+            return [sum(L[i][j] * y[j] for j in range(i + 1)) for i in range(n)]
+
+        if norm is None:
+            norm = estimate(multiply, multiply, n)
+        return norm * estimate(solve, solve, n)
+
+    @staticmethod
+    def cholesky_update(L, x, downdate=False):
+        """
+        Update a Cholesky factor in place for A + x x^H, or A - x x^H when downdating.
+
+        Uses a sequence of (hyperbolic, for a downdate) rotations: O(n^2) work instead
+        of the O(n^3) of a new factorization.
+
+        Args:
+        L (list of lists): The lower triangular factor; overwritten.
+        x (list): The update vector (not modified).
+        downdate (bool): If True, remove x x^H instead of adding it.
+
+        Returns:
+        list of lists: L, updated.
+
+        Raises:
+        ValueError: If the downdated matrix is not positive definite.
+        """
+        n = len(L)
+        x = list(x)
+        sign = -1 if downdate else 1
+
+        for k in range(n):
+            lkk = L[k][k].real if isinstance(L[k][k], complex) else L[k][k]
+            value = lkk * lkk + sign * abs(x[k]) ** 2
+            if value <= 0:
+                raise ValueError("Downdated matrix is not positive definite.")
+            r = math.sqrt(value)
+            c = r / lkk
+            s = x[k] / lkk
+            s_conj = s.conjugate()
+            L[k][k] = r
+            for i in range(k + 1, n):
+                lik = (L[i][k] + sign * s_conj * x[i]) / c
+                L[i][k] = lik
+                x[i] = c * x[i] - s * lik
 
         return L
 
+    @staticmethod
+    def log_determinant(L):
+        """
+        Logarithm of det(A) from its Cholesky factor.
+
+        Args:
+        L (list of lists): The factor returned by cholesky_decomposition.
+
+        Returns:
+        float: log det(A) = 2 * sum(log L_ii).
+        """
+        return 2 * sum(math.log(L[i][i].real) for i in range(len(L)))
+
+    @staticmethod
+    def symmetric_swap(a, p, q):
+        """Swap rows and columns p < q of a symmetric matrix held in its lower triangle."""
+        a[p][:p], a[q][:p] = a[q][:p], a[p][:p]
+        a[p][p], a[q][q] = a[q][q], a[p][p]
+        for i in range(p + 1, q):
+            a[i][p], a[q][i] = a[q][i], a[i][p]
+        for i in range(q + 1, len(a)):
+            a[i][p], a[i][q] = a[i][q], a[i][p]
+
+    @staticmethod
+    def ldl_decomposition(A, overwrite=False):
+        """
+        Factor a symmetric (possibly indefinite) matrix as P A P^T = L D L^T with
+        Bunch-Kaufman pivoting.
+
+        Only the lower triangle of A is read and written. On return it holds D on the
+        diagonal (and on the subdiagonal of each 2x2 block) and the unit lower
+        triangular L below it.
+
+        Args:
+        A (list of lists): The real symmetric matrix.
+        overwrite (bool): If True, factor in the lower triangle of A and return A;
+        otherwise the factor is a new lower triangle, row i of length i + 1.
+
+        Returns:
+        tuple: The packed factor, the permutation perm (row i of P A P^T is row
+        perm[i] of A) and the list of diagonal block sizes (1 or 2) of D.
+        """
+        n = len(A)
+        a = A if overwrite else [list(row[:i + 1]) for i, row in enumerate(A)]
+        perm = list(range(n))
+        blocks = []
+        alpha = (1 + math.sqrt(17)) / 8
+
+        k = 0
+        while k < n:
+            akk = abs(a[k][k])
+            r, colmax = k, 0.0
+            for i in range(k + 1, n):
+                if abs(a[i][k]) > colmax:
+                    r, colmax = i, abs(a[i][k])
+
+            size = 1
+            if akk < alpha * colmax:
+                rowmax = max([abs(a[r][j]) for j in range(k, r)] + [abs(a[i][r]) for i in range(r + 1, n)])
+                if akk * rowmax >= alpha * colmax * colmax:
+                    pass
+                elif abs(a[r][r]) >= alpha * rowmax:
+                    MatrixDecompositions.symmetric_swap(a, k, r)
+                    perm[k], perm[r] = perm[r], perm[k]
+                else:
+                    size = 2
+                    if r != k + 1:
+                        MatrixDecompositions.symmetric_swap(a, k + 1, r)
+                        perm[k + 1], perm[r] = perm[r], perm[k + 1]
+
+            if size == 1:
+                d = a[k][k]
+                if d != 0:
+                    column = [a[i][k] for i in range(k + 1, n)]
+                    multipliers = [w / d for w in column]
+                    for i in range(k + 1, n):
+                        row_i = a[i]
+                        l = multipliers[i - k - 1]
+                        if l != 0:
+                            for j in range(k + 1, i + 1):
+                                row_i[j] -= l * column[j - k - 1]
+                        row_i[k] = l
+            else:
+                d11, d21, d22 = a[k][k], a[k + 1][k], a[k + 1][k + 1]
+                det = d11 * d22 - d21 * d21
+                w1 = [a[i][k] for i in range(k + 2, n)]
+                w2 = [a[i][k + 1] for i in range(k + 2, n)]
+                for i in range(k + 2, n):
+                    x1, x2 = w1[i - k - 2], w2[i - k - 2]
+                    l1 = (d22 * x1 - d21 * x2) / det
+                    l2 = (d11 * x2 - d21 * x1) / det
+                    row_i = a[i]
+                    for j in range(k + 2, i + 1):
+                        row_i[j] -= l1 * w1[j - k - 2] + l2 * w2[j - k - 2]
+                    row_i[k], row_i[k + 1] = l1, l2
+
+            blocks.append(size)
+            k += size
+
+        return a, perm, blocks
+
+    @staticmethod
+    def ldl_solve(LD, perm, blocks, B):
+        """
+        Solve A X = B from the factors returned by ldl_decomposition.
+
+        Args:
+        LD (list of lists): The packed factor.
+        perm (list): The symmetric permutation.
+        blocks (list): The diagonal block sizes of D.
+        B (list): A right-hand side vector, or a matrix with one column per right-hand side.
+
+        Returns:
+        list: The solution, with the same shape as B.
+
+        Raises:
+        ValueError: If D is singular.
+        """
+        n = len(LD)
+        vector = not isinstance(B[0], list)
+        X = [[B[p]] if vector else list(B[p]) for p in perm]
+        starts = []
+        k = 0
+        for size in blocks:
+            starts.append(k)
+            k += size
+
+        # L Y = P B, with the multipliers of a 2x2 block starting below it.
+        for k, size in zip(starts, blocks):
+            for i in range(k + size, n):
+                xi = X[i]
+                for c in range(k, k + size):
+                    f = LD[i][c]
+                    if f != 0:
+                        xc = X[c]
+                        xi = [a - f * b for a, b in zip(xi, xc)]
+                X[i] = xi
+
+        # D Z = Y, one block at a time.
+        for k, size in zip(starts, blocks):
+            if size == 1:
+                d = LD[k][k]
+                if d == 0:
+                    raise ValueError("Matrix is singular.")
+                X[k] = [a / d for a in X[k]]
+            else:
+                d11, d21, d22 = LD[k][k], LD[k + 1][k], LD[k + 1][k + 1]
+                det = d11 * d22 - d21 * d21
+                if det == 0:
+                    raise ValueError("Matrix is singular.")
+                y1, y2 = X[k], X[k + 1]
+                X[k] = [(d22 * a - d21 * b) / det for a, b in zip(y1, y2)]
+                X[k + 1] = [(d11 * b - d21 * a) / det for a, b in zip(y1, y2)]
+
+        # L^T W = Z.
+        for k, size in reversed(list(zip(starts, blocks))):
+            for c in range(k, k + size):
+                xc = X[c]
+                for i in range(k + size, n):
+                    f = LD[i][c]
+                    if f != 0:
+                        xi = X[i]
+                        xc = [a - f * b for a, b in zip(xc, xi)]
+                X[c] = xc
+
+        result = [None] * n
+        for i, p in enumerate(perm):
+            result[p] = X[i][0] if vector else X[i]
+        return result
+
+    @staticmethod
+    def ldl_inertia(LD, blocks, tolerance=None):
+        """
+        Count the positive, negative and zero eigenvalues of A from its LDL^T factor.
+
+        By Sylvester's law of inertia these are the counts for D: a 1x1 block
+        contributes its sign, a 2x2 block the signs of its two eigenvalues.
+
+        Args:
+        LD (list of lists): The packed factor from ldl_decomposition.
+        blocks (list): The diagonal block sizes of D.
+        tolerance (float, optional): Magnitude below which a pivot counts as zero;
+        defaults to n * eps * max|D|.
+
+        Returns:
+        tuple: (positive, negative, zero).
+        """
+        n = len(LD)
+        if tolerance is None:
+            largest = max((abs(LD[i][i]) for i in range(n)), default=0.0)
+            tolerance = n * sys.float_info.epsilon * largest
+        positive = negative = zero = 0
+        k = 0
+        for size in blocks:
+            if size == 1:
+                values = [LD[k][k]]
+            else:
+                d11, d21, d22 = LD[k][k], LD[k + 1][k], LD[k + 1][k + 1]
+                mean, radius = (d11 + d22) / 2, math.hypot((d11 - d22) / 2, d21)
+                values = [mean + radius, mean - radius]
+            for value in values:
+                if abs(value) <= tolerance:
+                    zero += 1
+                elif value > 0:
+                    positive += 1
+                else:
+                    negative += 1
+            k += size
+        return positive, negative, zero
+
 
 # Example:
-A = [
-    [25, 15, -5],
-    [15, 18,  0],
-    [-5,  0, 11]
-]
+if __name__ == "__main__":
+    A = [
+        [25, 15, -5],
+        [15, 18,  0],
+        [-5,  0, 11]
+    ]
 
-try:
-    decomposition_solver = MatrixDecompositions()
+    try:
+        decomposition_solver = MatrixDecompositions()
+
+        L = decomposition_solver.cholesky_decomposition(A)
+
+        print("Cholesky Decomposition (Lower Triangular Matrix L):")
+        for row in L:
+            print(row)
+
+        print("\nSolution of A X = B for two right-hand sides:")
+        for row in decomposition_solver.cho_solve(L, [[1, 0], [0, 1], [0, 0]]):
+            print(row)
+
+        print("\nlog det(A):", decomposition_solver.log_determinant(L))
+        print("Condition estimate of A:", decomposition_solver.condition_estimate(L))
+
+        decomposition_solver.cholesky_update(L, [1, 2, 3])
+        print("\nFactor of A + x x^T:")
+        for row in L:
+            print(row)
 
-    L = decomposition_solver.cholesky_decomposition(A)
+        K = [
+            [2, 0, 1],
+            [0, 3, 1],
+            [1, 1, 0]
+        ]
+        LD, perm, blocks = decomposition_solver.ldl_decomposition(K)
+        print("\nLDL^T solution of a symmetric indefinite system:",
+              decomposition_solver.ldl_solve(LD, perm, blocks, [3, 4, 2]))
+        print("Inertia (positive, negative, zero):", decomposition_solver.ldl_inertia(LD, blocks))
 
-    print("Cholesky Decomposition (Lower Triangular Matrix L):")
-    for row in L:
-        print(row)
+        H = [
+            [4, 1 - 2j],
+            [1 + 2j, 6]
+        ]
+        print("\nCholesky factor of a complex Hermitian matrix:")
+        for row in decomposition_solver.cholesky_decomposition(H):
+            print(row)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
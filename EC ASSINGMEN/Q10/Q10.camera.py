@@ -1,3 +1,16 @@
+import math
+import operator
+import os
+import random
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixDecompositions:
     @staticmethod
     def transpose(matrix):
@@ -15,71 +28,526 @@ class MatrixDecompositions:
         return [[1 if i == j else 0 for j in range(size)] for i in range(size)]
 
     @staticmethod
-    def eigen_decomposition(A):
-       
+    def tridiagonalize(A):
+        """
+        Reduce a symmetric or Hermitian matrix to real symmetric tridiagonal form.
+
+        The input is not modified. A = Z T Z^H, where T has diagonal d and
+        off-diagonal e and Z is stored by columns.
+
+        Args:
+        A (list of lists): The input symmetric or Hermitian matrix.
+
+        Returns:
+        tuple: The diagonal d, the off-diagonal e (length n - 1) and the columns of Z.
+        """
+        n = len(A)
+        a = [list(row) for row in A]
+        Z = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+        for k in range(n - 2):
+            x = [a[i][k] for i in range(k + 1, n)]
+            norm_x = math.sqrt(sum(abs(v) ** 2 for v in x))
+            if norm_x == 0 or norm_x == abs(x[0]):
+                continue
+
+            alpha = x[0]
+            phase = alpha / abs(alpha) if alpha != 0 else 1.0
+            beta = -phase * norm_x
+            x[0] -= beta
+            scale = math.sqrt(2) / math.sqrt(sum(abs(v) ** 2 for v in x))
+            u = [v * scale for v in x]
+            u_conj = [v.conjugate() for v in u]
+
+            p = [sum(map(operator.mul, a[i][k + 1:], u)) for i in range(k + 1, n)]
+            K = sum(map(operator.mul, u_conj, p)) / 2
+            q = [pi - K * ui for pi, ui in zip(p, u)]
+            q_conj = [v.conjugate() for v in q]
+            for r, i in enumerate(range(k + 1, n)):
+                ui, qi = u[r], q[r]
+                row = a[i]
+                row[k + 1:] = [value - ui * qc - qi * uc
+                               for value, qc, uc in zip(row[k + 1:], q_conj, u_conj)]
+
+            a[k + 1][k] = beta
+            a[k][k + 1] = beta.conjugate()
+            for i in range(k + 2, n):
+                a[i][k] = 0.0
+                a[k][i] = 0.0
+
+            for row in Z:
+                w = sum(map(operator.mul, row[k + 1:], u))
+                if w != 0:
+                    row[k + 1:] = [value - w * uc for value, uc in zip(row[k + 1:], u_conj)]
+
+        d = [float(a[i][i].real) for i in range(n)]
+        e = []
+        phases = [1.0] * n
+        for k in range(n - 1):
+            value = a[k + 1][k]
+            magnitude = abs(value)
+            phases[k + 1] = phases[k] * (value / magnitude) if magnitude != 0 else phases[k]
+            e.append(magnitude)
+
+        columns = [[Z[i][j] * phases[j] for i in range(n)] for j in range(n)]
+        return d, e, columns
+
+    @staticmethod
+    def tridiagonal_ql(d, e, Z=None, max_iter=60):
+        """
+        Diagonalize a symmetric tridiagonal matrix with the implicit-shift QL algorithm.
+
+        Args:
+        d (list): The diagonal; overwritten with the (unsorted) eigenvalues.
+        e (list): The off-diagonal, of length n - 1.
+        Z (list of lists, optional): Columns rotated along with T to accumulate eigenvectors.
+        max_iter (int): Maximum number of iterations per eigenvalue.
+
+        Returns:
+        list: The eigenvalues d.
+
+        Raises:
+        ValueError: If an eigenvalue does not converge.
+        """
+        n = len(d)
+        e = list(e) + [0.0]
+        eps = sys.float_info.epsilon
+
+        for l in range(n):
+            iterations = 0
+            while True:
+                m = l
+                while m < n - 1:
+                    if abs(e[m]) <= eps * (abs(d[m]) + abs(d[m + 1])):
+                        break
+                    m += 1
+                if m == l:
+                    break
+                iterations += 1
+                if iterations > max_iter:
+                    raise ValueError("The tridiagonal QL iteration did not converge.")
+
+                g = (d[l + 1] - d[l]) / (2 * e[l])
+                r = math.hypot(g, 1.0)
+                g = d[m] - d[l] + e[l] / (g + math.copysign(r, g))
+                s = c = 1.0
+                p = 0.0
+                i = m - 1
+                while i >= l:
+                    f = s * e[i]
+                    b = c * e[i]
+                    r = math.hypot(f, g)
+                    e[i + 1] = r
+                    if r == 0:
+                        d[i + 1] -= p
+                        e[m] = 0.0
+                        break
+                    s = f / r
+                    c = g / r
+                    g = d[i + 1] - p
+                    r = (d[i] - g) * s + 2 * c * b
+                    p = s * r
+                    d[i + 1] = g + p
+                    g = c * r - b
+                    if Z is not None:
+                        zi, zj = Z[i], Z[i + 1]
+                        Z[i + 1] = [s * a + c * b2 for a, b2 in zip(zi, zj)]
+                        Z[i] = [c * a - s * b2 for a, b2 in zip(zi, zj)]
+                    i -= 1
+                else:
+                    d[l] -= p
+                    e[l] = g
+                    e[m] = 0.0
+
+        return d
+
+    @staticmethod
+    def tridiagonal_inverse_iteration(d, e, eigenvalue, rng, iterations=3):
+        """
+        Compute an eigenvector of a symmetric tridiagonal matrix by inverse iteration.
+
+        Args:
+        d (list): The diagonal.
+        e (list): The off-diagonal, of length n - 1.
+        eigenvalue (float): An accurate eigenvalue of T.
+        rng (random.Random): Source of the random starting vector.
+        iterations (int): Number of inverse iteration steps.
+
+        Returns:
+        list: A unit eigenvector of T.
+        """
+        n = len(d)
+        norm_t = max(abs(v) for v in d + e) or 1.0
+        tiny = sys.float_info.epsilon * norm_t
+        diag = [v - eigenvalue for v in d]
+        sub = list(e)
+        sup = list(e)
+        sup2 = [0.0] * max(n - 2, 0)
+        swapped = [False] * n
+
+        for i in range(n - 1):
+            if abs(diag[i]) >= abs(sub[i]):
+                if diag[i] == 0:
+                    diag[i] = tiny
+                factor = sub[i] / diag[i]
+                sub[i] = factor
+                diag[i + 1] -= factor * sup[i]
+            else:
+                factor = diag[i] / sub[i]
+                diag[i] = sub[i]
+                sub[i] = factor
+                temp = sup[i]
+                sup[i] = diag[i + 1]
+                diag[i + 1] = temp - factor * diag[i + 1]
+                if i < n - 2:
+                    sup2[i] = sup[i + 1]
+                    sup[i + 1] = -factor * sup[i + 1]
+                swapped[i] = True
+        if diag[n - 1] == 0:
+            diag[n - 1] = tiny
+
+        x = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+        for _ in range(iterations):
+            for i in range(n - 1):
+                if swapped[i]:
+                    x[i], x[i + 1] = x[i + 1], x[i] - sub[i] * x[i + 1]
+                else:
+                    x[i + 1] -= sub[i] * x[i]
+            for i in range(n - 1, -1, -1):
+                value = x[i]
+                if i + 1 < n:
+                    value -= sup[i] * x[i + 1]
+                if i + 2 < n:
+                    value -= sup2[i] * x[i + 2]
+                x[i] = value / diag[i]
+            norm_x = math.sqrt(sum(v * v for v in x))
+            x = [v / norm_x for v in x]
+
+        return x
+
+    @staticmethod
+    def eigen_decomposition(A, subset=None, eigenvectors=True):
+        """
+        Compute eigenvalues and eigenvectors of a symmetric or Hermitian matrix.
+
+        The matrix is reduced to tridiagonal form by Householder reflections and then
+        diagonalized by implicit-shift QL. With a subset, only the selected eigenvectors
+        are computed, by inverse iteration on the tridiagonal matrix. A is not modified.
+
+        Args:
+        A (list of lists): The input symmetric or Hermitian matrix.
+        subset (tuple, optional): Inclusive index range (lo, hi) into the ascending eigenvalues.
+        eigenvectors (bool): If False, only the eigenvalues are returned.
+
+        Returns:
+        tuple: The eigenvalues in ascending order and the matrix whose columns are
+        the matching eigenvectors (None if eigenvectors is False).
+
+        Raises:
+        ValueError: If the matrix is not square or the subset is out of range.
+        """
         n = len(A)
-        eigenvalues = []
-        eigenvectors = MatrixDecompositions.identity_matrix(n)
+        if any(len(row) != n for row in A):
+            raise ValueError("The matrix must be square.")
+        lo, hi = subset if subset is not None else (0, n - 1)
+        if not 0 <= lo <= hi < n:
+            raise ValueError(f"The subset must satisfy 0 <= lo <= hi < {n}.")
+
+        d, e, Z = MatrixDecompositions.tridiagonalize(A)
 
-        for _ in range(n):
-            vector = [1.0] * n 
-            for _ in range(100): 
-                next_vector = MatrixDecompositions.multiply_matrices(A, [[v] for v in vector])
-                next_vector = [x[0] for x in next_vector]
-                norm = sum(x ** 2 for x in next_vector) ** 0.5
-                next_vector = [x / norm for x in next_vector]
-                vector = next_vector
+        if eigenvectors and subset is None:
+            values = MatrixDecompositions.tridiagonal_ql(d[:], e, Z)
+            order = sorted(range(n), key=lambda k: values[k])
+            columns = [Z[k] for k in order]
+            return [values[k] for k in order], MatrixDecompositions.transpose(columns)
 
-            eigenvalue = sum(vector[i] * (MatrixDecompositions.multiply_matrices(A, [[v] for v in vector])[i][0]) for i in range(n))
-            eigenvalues.append(eigenvalue)
+        values = sorted(MatrixDecompositions.tridiagonal_ql(d[:], e))[lo:hi + 1]
+        if not eigenvectors:
+            return values, None
 
-            for i in range(n):
-                for j in range(n):
-                    A[i][j] -= eigenvalue * vector[i] * vector[j]
+        rng = random.Random(0)
+        gap = 1e-3 * max(max(abs(v) for v in d + e), sys.float_info.min)
+        tridiagonal_vectors = []
+        columns = []
+        for idx, value in enumerate(values):
+            x = MatrixDecompositions.tridiagonal_inverse_iteration(d, e, value, rng)
+            for _ in range(2):
+                for prev_value, prev in zip(values, tridiagonal_vectors):
+                    if abs(prev_value - value) <= gap:
+                        c = sum(map(operator.mul, prev, x))
+                        x = [a - c * b for a, b in zip(x, prev)]
+                norm_x = math.sqrt(sum(v * v for v in x))
+                x = [v / norm_x for v in x]
+            tridiagonal_vectors.append(x)
 
-        return eigenvalues, eigenvectors
+            vector = [0.0] * n
+            for coeff, z in zip(x, Z):
+                if coeff != 0:
+                    vector = [a + coeff * b for a, b in zip(vector, z)]
+            columns.append(vector)
+
+        return values, MatrixDecompositions.transpose(columns)
 
     @staticmethod
-    def svd(A):
-        
-        A_T = MatrixDecompositions.transpose(A)
-        ATA = MatrixDecompositions.multiply_matrices(A_T, A)
-        AAT = MatrixDecompositions.multiply_matrices(A, A_T)
+    def complete_orthonormal(columns, dim, count):
+        """
+        Extend a set of orthonormal columns with unit vectors orthogonal to them.
 
-        eigenvalues_V, V = MatrixDecompositions.eigen_decomposition(ATA)
-        eigenvalues_U, U = MatrixDecompositions.eigen_decomposition(AAT)
+        Args:
+        columns (list of lists): Orthonormal vectors of length dim.
+        dim (int): The dimension of the space.
+        count (int): The number of vectors to add.
 
-        singular_values = [eigenvalue ** 0.5 for eigenvalue in eigenvalues_V]
-        Sigma = [[0] * len(A[0]) for _ in range(len(A))]
-        for i in range(len(singular_values)):
-            Sigma[i][i] = singular_values[i]
+        Returns:
+        list of lists: The count new orthonormal vectors.
+        """
+        basis = list(columns)
+        added = []
+        for i in range(dim):
+            if len(added) == count:
+                break
+            w = [1.0 if r == i else 0.0 for r in range(dim)]
+            for _ in range(2):
+                for q in basis:
+                    c = sum(map(operator.mul, q, w))
+                    w = [a - c * b for a, b in zip(w, q)]
+            norm_w = math.sqrt(sum(x * x for x in w))
+            if norm_w > 0.5:
+                w = [x / norm_w for x in w]
+                basis.append(w)
+                added.append(w)
+        return added
 
-        return U, Sigma, MatrixDecompositions.transpose(V)
+    @staticmethod
+    def jacobi_svd(A, full=False, tolerance=1e-15, max_sweeps=60):
+        """
+        Compute the SVD of a matrix with m >= n by QR preconditioning and one-sided Jacobi.
+
+        Args:
+        A (list of lists): The input m x n matrix, m >= n.
+        full (bool): If True, also complete U to an m x m orthogonal basis.
+        tolerance (float): Relative orthogonality threshold between column pairs.
+        max_sweeps (int): Maximum number of Jacobi sweeps.
+
+        Returns:
+        tuple: The columns of U, the singular values (descending) and the columns of V.
+        """
+        rows = len(A)
+        cols = len(A[0])
+        QR = linalg.q8_d.QRFactorization
+        reflectors, taus, R, _ = QR.householder_qr(A)
+        W = [[R[i][j] for i in range(cols)] for j in range(cols)]
+        V = [[1.0 if i == j else 0.0 for i in range(cols)] for j in range(cols)]
+
+        for _ in range(max_sweeps):
+            rotated = False
+            for i in range(cols - 1):
+                for j in range(i + 1, cols):
+                    wi, wj = W[i], W[j]
+                    alpha = sum(x * x for x in wi)
+                    beta = sum(x * x for x in wj)
+                    gamma = sum(map(operator.mul, wi, wj))
+                    if gamma == 0 or abs(gamma) <= tolerance * math.sqrt(alpha * beta):
+                        continue
+                    rotated = True
+                    zeta = (beta - alpha) / (2 * gamma)
+                    t = math.copysign(1.0, zeta) / (abs(zeta) + math.sqrt(1 + zeta * zeta))
+                    c = 1 / math.sqrt(1 + t * t)
+                    s = c * t
+                    W[i] = [c * a - s * b for a, b in zip(wi, wj)]
+                    W[j] = [s * a + c * b for a, b in zip(wi, wj)]
+                    vi, vj = V[i], V[j]
+                    V[i] = [c * a - s * b for a, b in zip(vi, vj)]
+                    V[j] = [s * a + c * b for a, b in zip(vi, vj)]
+            if not rotated:
+                break
+
+        sigma = [math.sqrt(sum(x * x for x in col)) for col in W]
+        order = sorted(range(cols), key=lambda k: -sigma[k])
+        sigma = [sigma[k] for k in order]
+        V = [V[k] for k in order]
+        cutoff = max(rows, cols) * sys.float_info.epsilon * (sigma[0] if sigma else 0.0)
+        rank = sum(1 for value in sigma if value > cutoff)
+
+        small_U = [[x / sigma[idx] for x in W[k]] for idx, k in enumerate(order[:rank])]
+        small_U += MatrixDecompositions.complete_orthonormal(small_U, cols, cols - rank)
+        for idx in range(rank, cols):
+            sigma[idx] = 0.0 if sigma[idx] <= cutoff else sigma[idx]
+
+        U = [QR.apply_q(reflectors, taus, u + [0.0] * (rows - cols)) for u in small_U]
+        if full:
+            for i in range(cols, rows):
+                e = [1.0 if r == i else 0.0 for r in range(rows)]
+                U.append(QR.apply_q(reflectors, taus, e))
+
+        return U, sigma, V
+
+    @staticmethod
+    def svd(A, mode="full", k=None):
+        """
+        Compute the singular value decomposition A = U Sigma V^T.
+
+        Args:
+        A (list of lists): The input m x n matrix.
+        mode (str): "full" (U is m x m, V^T is n x n), "thin" (r = min(m, n) triplets)
+        or "truncated" (the k largest triplets).
+        k (int, optional): The number of triplets kept in "truncated" mode.
+
+        Returns:
+        tuple: U, Sigma (as a matrix) and V^T.
+
+        Raises:
+        ValueError: If the mode is unknown or k is missing or out of range.
+        """
+        if mode not in ("full", "thin", "truncated"):
+            raise ValueError("Mode must be 'full', 'thin' or 'truncated'.")
+        rows = len(A)
+        cols = len(A[0])
+        r = min(rows, cols)
+        if mode == "truncated" and (k is None or not 1 <= k <= r):
+            raise ValueError(f"Truncated mode needs 1 <= k <= {r}.")
+
+        full = mode == "full"
+        if rows >= cols:
+            U_cols, sigma, V_cols = MatrixDecompositions.jacobi_svd(A, full=full)
+        else:
+            V_cols, sigma, U_cols = MatrixDecompositions.jacobi_svd(MatrixDecompositions.transpose(A), full=full)
+
+        if mode == "truncated":
+            U_cols, sigma, V_cols = U_cols[:k], sigma[:k], V_cols[:k]
+        elif mode == "thin":
+            U_cols, V_cols = U_cols[:r], V_cols[:r]
+
+        U = MatrixDecompositions.transpose(U_cols)
+        Sigma = [[0.0] * len(V_cols) for _ in range(len(U_cols))]
+        for i in range(len(sigma)):
+            Sigma[i][i] = sigma[i]
+
+        return U, Sigma, V_cols
+
+    @staticmethod
+    def dense_operator(A):
+        """
+        Wrap a dense matrix as the (matmat, rmatmat) pair used by randomized_svd.
+
+        Args:
+        A (list of lists): The input m x n matrix.
+
+        Returns:
+        tuple: matmat and rmatmat callables and the shape (m, n).
+        """
+        rows = len(A)
+        cols = len(A[0])
+
+        def matmat(vectors):
+            return [[sum(map(operator.mul, row, x)) for row in A] for x in vectors]
+
+        def rmatmat(vectors):
+            result = []
+            for y in vectors:
+                z = [0.0] * cols
+                for coeff, row in zip(y, A):
+                    if coeff != 0:
+                        z = [a + coeff * b for a, b in zip(z, row)]
+                result.append(z)
+            return result
+
+        return matmat, rmatmat, (rows, cols)
+
+    @staticmethod
+    def orthonormalize(vectors, tolerance=1e-12):
+        """Orthonormalize vectors with two passes of modified Gram-Schmidt, dropping dependent ones."""
+        basis = []
+        for v in vectors:
+            w = list(v)
+            norm_v = math.sqrt(sum(x * x for x in w))
+            for _ in range(2):
+                for q in basis:
+                    c = sum(map(operator.mul, q, w))
+                    w = [a - c * b for a, b in zip(w, q)]
+            norm_w = math.sqrt(sum(x * x for x in w))
+            if norm_w > tolerance * max(norm_v, 1.0):
+                basis.append([x / norm_w for x in w])
+        return basis
+
+    @staticmethod
+    def randomized_svd(matmat, rmatmat, shape, k, oversample=10, power_iterations=2, seed=None):
+        """
+        Approximate the k largest singular triplets with a randomized range finder.
+
+        A is only accessed through products with blocks of vectors, so dense,
+        sparse or memory-mapped inputs can all be supplied (see dense_operator).
+
+        Args:
+        matmat (callable): Maps a list of n-vectors x_j to the list of m-vectors A x_j.
+        rmatmat (callable): Maps a list of m-vectors y_j to the list of n-vectors A^T y_j.
+        shape (tuple): The dimensions (m, n) of A.
+        k (int): The number of singular triplets to return.
+        oversample (int): Extra random probe vectors beyond k.
+        power_iterations (int): Number of subspace iterations to sharpen the spectrum.
+        seed (int, optional): Seed for the random probe vectors.
+
+        Returns:
+        tuple: U (m x k), Sigma (k x k) and V^T (k x n).
+
+        Raises:
+        ValueError: If k is out of range.
+        """
+        rows, cols = shape
+        if not 1 <= k <= min(rows, cols):
+            raise ValueError(f"k must be between 1 and {min(rows, cols)}.")
+
+        rng = random.Random(seed)
+        width = min(k + oversample, rows, cols)
+        omega = [[rng.gauss(0.0, 1.0) for _ in range(cols)] for _ in range(width)]
+
+        Q = MatrixDecompositions.orthonormalize(matmat(omega))
+        for _ in range(power_iterations):
+            Z = MatrixDecompositions.orthonormalize(rmatmat(Q))
+            Q = MatrixDecompositions.orthonormalize(matmat(Z))
+
+        B_rows = rmatmat(Q)
+        B_T = [[b[i] for b in B_rows] for i in range(cols)]
+        right, sigma, left = MatrixDecompositions.jacobi_svd(B_T)
+
+        k = min(k, len(sigma))
+        U_cols = []
+        for j in range(k):
+            u = [0.0] * rows
+            for coeff, q in zip(left[j], Q):
+                if coeff != 0:
+                    u = [a + coeff * b for a, b in zip(u, q)]
+            U_cols.append(u)
+
+        U = MatrixDecompositions.transpose(U_cols)
+        Sigma = [[sigma[i] if i == j else 0.0 for j in range(k)] for i in range(k)]
+        return U, Sigma, right[:k]
 
 
 # Example:
-A = [
-    [1, 2],
-    [3, 4],
-    [5, 6]
-]
+if __name__ == "__main__":
+    A = [
+        [1, 2],
+        [3, 4],
+        [5, 6]
+    ]
 
-try:
-    decomposition_solver = MatrixDecompositions()
+    try:
+        decomposition_solver = MatrixDecompositions()
 
-    U, Sigma, V_T = decomposition_solver.svd(A)
+        U, Sigma, V_T = decomposition_solver.svd(A)
 
-    print("Matrix U:")
-    for row in U:
-        print(row)
+        print("Matrix U:")
+        for row in U:
+            print(row)
 
-    print("\nMatrix Sigma:")
-    for row in Sigma:
-        print(row)
+        print("\nMatrix Sigma:")
+        for row in Sigma:
+            print(row)
 
-    print("\nMatrix V^T:")
-    for row in V_T:
-        print(row)
+        print("\nMatrix V^T:")
+        for row in V_T:
+            print(row)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
@@ -0,0 +1,449 @@
+import math
+import operator
+import os
+import random
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
+class KrylovEigensolver:
+    @staticmethod
+    def dot(x, y):
+        """Compute the (unconjugated) inner product of two vectors."""
+        return sum(map(operator.mul, x, y))
+
+    @staticmethod
+    def combine(vectors, coefficients):
+        """Return the linear combination sum_i coefficients[i] * vectors[i]."""
+        result = [0.0] * len(vectors[0])
+        for coeff, vector in zip(coefficients, vectors):
+            if coeff != 0:
+                result = [a + coeff * b for a, b in zip(result, vector)]
+        return result
+
+    @staticmethod
+    def dense_matvec(A):
+        """
+        Wrap a dense matrix as a matvec callable.
+
+        Args:
+        A (list of lists): The input matrix.
+
+        Returns:
+        callable: A function mapping x to A x.
+        """
+        def matvec(x):
+            return [sum(map(operator.mul, row, x)) for row in A]
+
+        return matvec
+
+    @staticmethod
+    def shift_invert(A, sigma):
+        """
+        Build the shift-invert operator x -> (A - sigma I)^-1 x from one LU factorization.
+
+        Args:
+        A (list of lists): The input square matrix.
+        sigma (float or complex): The shift.
+
+        Returns:
+        callable: The shift-invert matvec.
+
+        Raises:
+        ValueError: If sigma is an eigenvalue of A.
+        """
+        MatrixInverse = linalg.q5_apple.MatrixInverse
+        n = len(A)
+        shifted = [[A[i][j] - (sigma if i == j else 0) for j in range(n)] for i in range(n)]
+        factors = MatrixInverse.lu_factor(shifted, overwrite=True)
+        if factors is None:
+            raise ValueError("A - sigma I is singular; sigma is an eigenvalue of A.")
+        lu, perm = factors
+
+        def matvec(x):
+            return [row[0] for row in MatrixInverse.lu_solve(lu, perm, [[v] for v in x])]
+
+        return matvec
+
+    @staticmethod
+    def general_eigen(H):
+        """
+        Compute eigenvalues and eigenvectors of a small dense real matrix.
+
+        Eigenvalues come from the Francis QR algorithm of MatrixDiagonalization; each
+        eigenvector from two steps of inverse iteration with the library LU.
+
+        Args:
+        H (list of lists): The input square matrix.
+
+        Returns:
+        tuple: The eigenvalues and the matching unit eigenvectors, as a list of columns.
+        """
+        MatrixInverse = linalg.q5_apple.MatrixInverse
+        n = len(H)
+        values = linalg.q9_e.MatrixDiagonalization.eigenvalues(H)
+        scale = max(1.0, max(abs(x) for row in H for x in row))
+        tiny = sys.float_info.epsilon * scale
+
+        def factor(shift):
+            shifted = [[H[i][j] - (shift if i == j else 0) for j in range(n)] for i in range(n)]
+            return MatrixInverse.lu_factor(shifted, overwrite=True)
+
+        vectors = []
+        for value in values:
+            # An exact eigenvalue can make the shifted matrix singular; nudge the shift.
+            factors, nudge = factor(value), tiny
+            while factors is None:
+                factors, nudge = factor(value + nudge), 16 * nudge
+            lu, perm = factors
+            x = [[1.0] for _ in range(n)]
+            for _ in range(2):
+                x = MatrixInverse.lu_solve(lu, perm, x)
+                norm_x = math.sqrt(sum(abs(row[0]) ** 2 for row in x))
+                x = [[row[0] / norm_x] for row in x]
+            vectors.append([row[0] for row in x])
+
+        return values, vectors
+
+    @staticmethod
+    def select(values, count, which):
+        """
+        Return the indices of the count wanted values, best first.
+
+        Args:
+        values (list): Real or complex values.
+        count (int): The number of indices to return.
+        which (str): "LM"/"SM" (largest/smallest magnitude), "LA"/"SA" or "LR"/"SR"
+        (largest/smallest real part), "LI"/"SI" (largest/smallest imaginary part).
+
+        Returns:
+        list: Indices into values.
+        """
+        keys = {
+            "LM": lambda v: -abs(v),
+            "SM": lambda v: abs(v),
+            "LA": lambda v: -v.real,
+            "SA": lambda v: v.real,
+            "LR": lambda v: -v.real,
+            "SR": lambda v: v.real,
+            "LI": lambda v: -v.imag,
+            "SI": lambda v: v.imag,
+        }
+        if which not in keys:
+            raise ValueError(f"Unknown selection '{which}'.")
+        return sorted(range(len(values)), key=lambda i: keys[which](values[i]))[:count]
+
+    @staticmethod
+    def orthogonalize(vector, basis, tolerance=1e-12):
+        """Orthogonalize vector against an orthonormal basis in two passes; None if it vanishes."""
+        w = list(vector)
+        norm_v = math.sqrt(sum(abs(x) ** 2 for x in w))
+        if norm_v == 0:
+            return None
+        for _ in range(2):
+            for q in basis:
+                c = KrylovEigensolver.dot(q, w)
+                if c != 0:
+                    w = [a - c * b for a, b in zip(w, q)]
+        norm_w = math.sqrt(sum(x * x for x in w))
+        if norm_w <= tolerance * norm_v:
+            return None
+        return [x / norm_w for x in w]
+
+    @staticmethod
+    def random_vector(basis, n, rng, attempts=5):
+        """Return a random unit vector orthogonal to an orthonormal basis, or None if none is found."""
+        for _ in range(attempts):
+            v = KrylovEigensolver.orthogonalize([rng.uniform(-1.0, 1.0) for _ in range(n)], basis)
+            if v is not None:
+                return v
+        return None
+
+    @staticmethod
+    def krylov_eigen(matvec, n, k, which, symmetric, ncv=None, tol=1e-10, max_restarts=300, v0=None, seed=None):
+        """
+        Compute k eigenpairs of a linear operator with a thick-restarted Krylov method.
+
+        The orthonormal basis V is kept in a Krylov-Schur decomposition
+        A V = V H + u g^T, with one more unit vector u orthogonal to V, so the Ritz
+        residuals come from H and g without storing A V. On restart the best Ritz
+        vectors are kept, which preserves the decomposition, and the basis grows
+        from u again (equivalent to implicit restarting). Converged pairs are
+        checked with one product each before they are returned.
+        A single starting vector finds only one copy of a repeated eigenvalue.
+
+        Args:
+        matvec (callable): Maps a real vector x of length n to A x.
+        n (int): The dimension of the operator.
+        k (int): The number of eigenpairs wanted.
+        which (str): The selection rule, see select.
+        symmetric (bool): If True, A is assumed symmetric (Lanczos); otherwise Arnoldi.
+        ncv (int, optional): Maximum basis size; defaults to max(2k + 1, 20), capped at n.
+        tol (float): Residual tolerance ||A x - lambda x|| <= tol * max|Ritz value|, so
+        eigenvalues at or near zero converge as well.
+        max_restarts (int): Maximum number of restarts.
+        v0 (list, optional): Starting vector.
+        seed (int, optional): Seed for random starting vectors.
+
+        Returns:
+        tuple: The eigenvalues, best first, and the matrix whose columns are the eigenvectors.
+
+        Raises:
+        ValueError: If k is out of range or the method does not converge.
+        """
+        if not 1 <= k <= n:
+            raise ValueError(f"k must be between 1 and {n}.")
+        m = min(n, ncv if ncv is not None else max(2 * k + 1, 20))
+        if m < k + 1 and m < n:
+            raise ValueError("ncv must be larger than k.")
+
+        dot = KrylovEigensolver.dot
+        rng = random.Random(seed)
+        V, H, g = [], [], []
+        u = KrylovEigensolver.orthogonalize(v0, []) if v0 is not None else None
+        if u is None:
+            u = KrylovEigensolver.random_vector([], n, rng)
+
+        def apply(x):
+            if not any(isinstance(v, complex) for v in x):
+                return matvec(x)
+            real_part = matvec([v.real for v in x])
+            imag_part = matvec([v.imag for v in x])
+            return [a + 1j * b for a, b in zip(real_part, imag_part)]
+
+        for restart in range(max_restarts + 1):
+            # Append u: A u = V h + beta u', so H gains column h and row g^T.
+            while len(V) < m and u is not None:
+                V.append(u)
+                w = matvec(u)
+                norm_w = math.sqrt(sum(x * x for x in w))
+                h = [0.0] * len(V)
+                for _ in range(2):
+                    for i, q in enumerate(V):
+                        c = dot(q, w)
+                        if c != 0:
+                            h[i] += c
+                            w = [a - c * b for a, b in zip(w, q)]
+                beta = math.sqrt(sum(x * x for x in w))
+                for i in range(len(V) - 1):
+                    H[i].append(h[i])
+                H.append(g + [h[-1]])
+                if beta > 1e-12 * norm_w:
+                    u = [x / beta for x in w]
+                    g = [0.0] * (len(V) - 1) + [beta]
+                else:
+                    # Invariant subspace: continue from a fresh direction (None once V spans R^n).
+                    u = KrylovEigensolver.random_vector(V, n, rng) if len(V) < n else None
+                    g = [0.0] * len(V)
+
+            size = len(V)
+            if symmetric:
+                S = [[(H[i][j] + H[j][i]) / 2 for j in range(size)] for i in range(size)]
+                values, vectors = linalg.q10_camera.MatrixDecompositions.eigen_decomposition(S)
+                Y = [list(column) for column in zip(*vectors)]
+            else:
+                values, Y = KrylovEigensolver.general_eigen(H)
+
+            # For x = V y: A x - theta x = V (H y - theta y) + u (g^T y).
+            wanted = KrylovEigensolver.select(values, k, which)
+            scale = max(abs(v) for v in values) or 1.0
+            residuals = []
+            for idx in wanted:
+                y, theta = Y[idx], values[idx]
+                r = [dot(row, y) - theta * b for row, b in zip(H, y)]
+                residuals.append(math.sqrt(sum(abs(v) ** 2 for v in r) + abs(dot(g, y)) ** 2))
+
+            if all(res <= tol * scale for res in residuals) or size == n:
+                vectors = []
+                for idx in wanted:
+                    x = KrylovEigensolver.combine(V, Y[idx])
+                    norm_x = math.sqrt(sum(abs(v) ** 2 for v in x))
+                    vectors.append([v / norm_x for v in x])
+                verified = size == n or all(
+                    math.sqrt(sum(abs(a - values[idx] * b) ** 2 for a, b in zip(apply(x), x))) <= tol * scale
+                    for idx, x in zip(wanted, vectors))
+                if verified:
+                    eigenvalues = [values[idx] for idx in wanted]
+                    return eigenvalues, [[vec[i] for vec in vectors] for i in range(n)]
+
+            if restart == max_restarts:
+                raise ValueError("The Krylov iteration did not converge within max_restarts.")
+
+            # Keep an orthonormal basis Y_k of the best Ritz vectors, never splitting a
+            # complex conjugate pair, so that A (V Y_k) = (V Y_k)(Y_k^T H Y_k) + u (Y_k^T g)^T.
+            keep = min(k + (size - k) // 2, size - 1)
+            kept = []
+            for idx in KrylovEigensolver.select(values, size, which):
+                if len(kept) >= keep:
+                    break
+                parts = [Y[idx]] if not isinstance(values[idx], complex) else [
+                    [v.real for v in Y[idx]], [v.imag for v in Y[idx]]]
+                if len(kept) + len(parts) > size - 1:
+                    break
+                for part in parts:
+                    y = KrylovEigensolver.orthogonalize(part, kept)
+                    if y is not None:
+                        kept.append(y)
+
+            HY = [[dot(H[i], y) for y in kept] for i in range(size)]
+            H = [[sum(ya[i] * HY[i][b] for i in range(size)) for b in range(len(kept))] for ya in kept]
+            g = [dot(g, y) for y in kept]
+            V = [KrylovEigensolver.combine(V, y) for y in kept]
+
+    @staticmethod
+    def lanczos(matvec, n, k=6, which="LA", ncv=None, tol=1e-10, max_restarts=300, v0=None, seed=None):
+        """
+        Compute k eigenpairs of a symmetric operator with thick-restarted Lanczos.
+
+        Args:
+        matvec (callable): Maps x to A x for a symmetric A.
+        n (int): The dimension of the operator.
+        k (int): The number of eigenpairs wanted.
+        which (str): "LA", "SA", "LM" or "SM".
+        ncv, tol, max_restarts, v0, seed: See krylov_eigen.
+
+        Returns:
+        tuple: The eigenvalues, best first, and the matrix whose columns are the eigenvectors.
+        """
+        if which not in ("LA", "SA", "LM", "SM"):
+            raise ValueError("which must be 'LA', 'SA', 'LM' or 'SM' for symmetric operators.")
+        return KrylovEigensolver.krylov_eigen(matvec, n, k, which, True, ncv, tol, max_restarts, v0, seed)
+
+    @staticmethod
+    def arnoldi(matvec, n, k=6, which="LM", ncv=None, tol=1e-10, max_restarts=300, v0=None, seed=None):
+        """
+        Compute k eigenpairs of a general real operator with thick-restarted Arnoldi.
+
+        Args:
+        matvec (callable): Maps x to A x.
+        n (int): The dimension of the operator.
+        k (int): The number of eigenpairs wanted.
+        which (str): "LM", "SM", "LR", "SR", "LI" or "SI".
+        ncv, tol, max_restarts, v0, seed: See krylov_eigen.
+
+        Returns:
+        tuple: The (possibly complex) eigenvalues, best first, and the matrix whose
+        columns are the eigenvectors.
+        """
+        return KrylovEigensolver.krylov_eigen(matvec, n, k, which, False, ncv, tol, max_restarts, v0, seed)
+
+    @staticmethod
+    def eigsh(A, k=6, which="LA", sigma=None, n=None, solve=None, **options):
+        """
+        Compute k eigenpairs of a symmetric matrix or operator.
+
+        With sigma, the eigenvalues closest to sigma are found by running Lanczos on
+        (A - sigma I)^-1. That operator is solve when given; otherwise A must be a
+        dense matrix, which is copied and factored with dense LU in O(n^3), so the
+        built-in shift-invert is only meant for small dense inputs.
+
+        Args:
+        A (list of lists or callable): A dense symmetric matrix or a matvec callable;
+        may be None when sigma and solve are given.
+        k (int): The number of eigenpairs wanted.
+        which (str): Selection rule when sigma is None.
+        sigma (float, optional): Shift for shift-invert mode.
+        n (int, optional): The dimension, required when A is not a dense matrix.
+        solve (callable, optional): Maps x to (A - sigma I)^-1 x, e.g. from a sparse
+        or banded factorization.
+        options: Passed on to lanczos.
+
+        Returns:
+        tuple: The eigenvalues and the matrix whose columns are the eigenvectors.
+        """
+        return KrylovEigensolver.solve_operator(A, k, which, sigma, n, solve, True, options)
+
+    @staticmethod
+    def eigs(A, k=6, which="LM", sigma=None, n=None, solve=None, **options):
+        """
+        Compute k eigenpairs of a general real matrix or operator.
+
+        Shift-invert works as in eigsh: pass solve for large or structured A; the
+        dense LU fallback is limited to small dense matrices.
+
+        Args:
+        A (list of lists or callable): A dense matrix or a matvec callable; may be
+        None when sigma and solve are given.
+        k (int): The number of eigenpairs wanted.
+        which (str): Selection rule when sigma is None.
+        sigma (float, optional): Real shift for shift-invert mode.
+        n (int, optional): The dimension, required when A is not a dense matrix.
+        solve (callable, optional): Maps x to (A - sigma I)^-1 x.
+        options: Passed on to arnoldi.
+
+        Returns:
+        tuple: The eigenvalues and the matrix whose columns are the eigenvectors.
+        """
+        return KrylovEigensolver.solve_operator(A, k, which, sigma, n, solve, False, options)
+
+    @staticmethod
+    def solve_operator(A, k, which, sigma, n, solve, symmetric, options):
+        """Dispatch eigsh and eigs to Lanczos or Arnoldi, with optional shift-invert."""
+        solver = KrylovEigensolver.lanczos if symmetric else KrylovEigensolver.arnoldi
+        dense = A is not None and not callable(A)
+        if n is None:
+            if not dense:
+                raise ValueError("The dimension n is required when A is not a dense matrix.")
+            n = len(A)
+
+        if sigma is None:
+            if A is None:
+                raise ValueError("A is required when sigma is not given.")
+            matvec = KrylovEigensolver.dense_matvec(A) if dense else A
+            return solver(matvec, n, k, which, **options)
+
+        if solve is None:
+            if not dense:
+                raise ValueError("Shift-invert mode needs solve, or A as a dense matrix.")
+            solve = KrylovEigensolver.shift_invert(A, sigma)
+        values, vectors = solver(solve, n, k, "LM", **options)
+        return [sigma + 1 / value for value in values], vectors
+
+
+# Example:
+if __name__ == "__main__":
+    n = 40
+    laplacian = [[2 if i == j else -1 if abs(i - j) == 1 else 0 for j in range(n)] for i in range(n)]
+
+    try:
+        values, vectors = KrylovEigensolver.eigsh(laplacian, k=3, which="SA", seed=0)
+        print("Three smallest eigenvalues of the path Laplacian (Lanczos):")
+        print(values)
+
+        values, vectors = KrylovEigensolver.eigsh(laplacian, k=3, sigma=0.0)
+        print("\nThree eigenvalues closest to 0 (shift-invert):")
+        print(values)
+
+        # Tridiagonal shift-invert without a dense copy: Thomas algorithm on L - 0.5 I.
+        def solve_shifted(d, shift=0.5):
+            c, x = [0.0] * n, [0.0] * n
+            for i in range(n):
+                pivot = 2 - shift - (c[i - 1] if i else 0.0)
+                c[i] = 1 / pivot
+                x[i] = (d[i] + (x[i - 1] if i else 0.0)) / pivot
+            for i in range(n - 2, -1, -1):
+                x[i] += c[i] * x[i + 1]
+            return x
+
+        values, vectors = KrylovEigensolver.eigsh(None, k=3, sigma=0.5, n=n, solve=solve_shifted, seed=0)
+        print("\nThree eigenvalues closest to 0.5 (shift-invert with a banded solve):")
+        print(values)
+
+        # Eigenvalue 0: a diagonal operator and the Laplacian of a 300-node cycle.
+        values, vectors = KrylovEigensolver.lanczos(lambda x: [i * v for i, v in enumerate(x)], 200, k=3, which="SA", seed=0)
+        print("\nThree smallest eigenvalues of diag(0, ..., 199):")
+        print(values)
+
+        m = 300
+        values, vectors = KrylovEigensolver.lanczos(
+            lambda x: [2 * x[i] - x[i - 1] - x[(i + 1) % m] for i in range(m)], m, k=2, which="SA", seed=0)
+        print("\nTwo smallest distinct eigenvalues of the cycle Laplacian:")
+        print(values)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -86,6 +86,36 @@ class MatrixProperties:
                     return False
         return True
 
+    def bandwidth(self):
+       
+        lower = upper = 0
+        for i, row in enumerate(self.matrix):
+            first = next((j for j, element in enumerate(row) if element != 0), None)
+            if first is None:
+                continue
+            last = max(j for j, element in enumerate(row) if element != 0)
+            lower = max(lower, i - first)
+            upper = max(upper, last - i)
+        return lower, upper
+
+    def is_banded(self, lower, upper):
+       
+        found_lower, found_upper = self.bandwidth()
+        return found_lower <= lower and found_upper <= upper
+
+    def is_tridiagonal(self):
+       
+        return self.is_square() and self.is_banded(1, 1)
+
+    def is_diagonally_dominant(self):
+       
+        if not self.is_square():
+            return False
+        for i, row in enumerate(self.matrix):
+            if abs(row[i]) < sum(abs(element) for j, element in enumerate(row) if j != i):
+                return False
+        return True
+
     def determinant(self, matrix):
        
         if len(matrix) == 1:
@@ -117,24 +147,27 @@ class MatrixProperties:
 
 
 # Example:
-matrix_example = [
-    [1, 2],
-    [2, 1]
-]
-matrix_checker = MatrixProperties(matrix_example)
-
-print("Matrix:")
-for row in matrix_example:
-    print(row)
-
-print("\nProperties:")
-print(f" zero: {matrix_checker.is_zero()}")
-print(f" symmetric: {matrix_checker.is_symmetric()}")
-print(f" Hermitian: {matrix_checker.is_hermitian()}")
-print(f" square: {matrix_checker.is_square()}")
-print(f" orthogonal: {matrix_checker.is_orthogonal()}")
-print(f" unitary: {matrix_checker.is_unitary()}")
-print(f" scalar: {matrix_checker.is_scalar()}")
-print(f" singular: {matrix_checker.is_singular()}")
-print(f" invertible: {matrix_checker.is_invertible()}")
-print(f" identity: {matrix_checker.is_identity()}")
+if __name__ == "__main__":
+    matrix_example = [
+        [1, 2],
+        [2, 1]
+    ]
+    matrix_checker = MatrixProperties(matrix_example)
+
+    print("Matrix:")
+    for row in matrix_example:
+        print(row)
+
+    print("\nProperties:")
+    print(f" zero: {matrix_checker.is_zero()}")
+    print(f" symmetric: {matrix_checker.is_symmetric()}")
+    print(f" Hermitian: {matrix_checker.is_hermitian()}")
+    print(f" square: {matrix_checker.is_square()}")
+    print(f" orthogonal: {matrix_checker.is_orthogonal()}")
+    print(f" unitary: {matrix_checker.is_unitary()}")
+    print(f" scalar: {matrix_checker.is_scalar()}")
+    print(f" singular: {matrix_checker.is_singular()}")
+    print(f" invertible: {matrix_checker.is_invertible()}")
+    print(f" identity: {matrix_checker.is_identity()}")
+    print(f" bandwidth (lower, upper): {matrix_checker.bandwidth()}")
+    print(f" tridiagonal: {matrix_checker.is_tridiagonal()}")
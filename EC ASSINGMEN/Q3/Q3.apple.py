@@ -77,25 +77,26 @@ class MatrixOperations:
 
 
 # Example:
-vector_example = [3, 4]
-matrix_example = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
-
-# Example: Vector length
-print("Vector:", vector_example)
-print("Length of vector:", MatrixOperations.vector_length(vector_example))
-
-# Example: Matrix size
-print("\nMatrix:")
-for row in matrix_example:
-    print(row)
-print("Size of matrix:", MatrixOperations.matrix_size(matrix_example))
-
-# Example: Matrix rank
-print("Rank of matrix:", MatrixOperations.matrix_rank(matrix_example))
-
-# Example: Matrix nullity
-print("Nullity of matrix:", MatrixOperations.matrix_nullity(matrix_example))
+if __name__ == "__main__":
+    vector_example = [3, 4]
+    matrix_example = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
+
+    # Example: Vector length
+    print("Vector:", vector_example)
+    print("Length of vector:", MatrixOperations.vector_length(vector_example))
+
+    # Example: Matrix size
+    print("\nMatrix:")
+    for row in matrix_example:
+        print(row)
+    print("Size of matrix:", MatrixOperations.matrix_size(matrix_example))
+
+    # Example: Matrix rank
+    print("Rank of matrix:", MatrixOperations.matrix_rank(matrix_example))
+
+    # Example: Matrix nullity
+    print("Nullity of matrix:", MatrixOperations.matrix_nullity(matrix_example))
@@ -87,19 +87,20 @@ class LinAl:
 
 
 # Example:
-matrix_example = [
-    [2, 1, -1, 8],
-    [-3, -1, 2, -11],
-    [-2, 1, 2, -3]
-]
-
-print("Original Matrix:")
-for row in matrix_example:
-    print(row)
-
-print("\nRREF of Matrix with Steps:")
-rref_result = LinAl.rref(matrix_example, show_steps=True)
-
-print("\nReduced Row Echelon Form:")
-for row in rref_result:
-    print(row)
+if __name__ == "__main__":
+    matrix_example = [
+        [2, 1, -1, 8],
+        [-3, -1, 2, -11],
+        [-2, 1, 2, -3]
+    ]
+
+    print("Original Matrix:")
+    for row in matrix_example:
+        print(row)
+
+    print("\nRREF of Matrix with Steps:")
+    rref_result = LinAl.rref(matrix_example, show_steps=True)
+
+    print("\nReduced Row Echelon Form:")
+    for row in rref_result:
+        print(row)
@@ -63,18 +63,19 @@ class LinearDependencyChecker:
 
 
 # Example: 
-vector_set = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
-
-checker = LinearDependencyChecker()
-
-print("Vectors:")
-for vector in vector_set:
-    print(vector)
-
-is_independent = checker.are_vectors_linearly_independent(vector_set)
-print("\nAre the vectors linearly independent?")
-print("Yes" if is_independent else "No")
+if __name__ == "__main__":
+    vector_set = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
+
+    checker = LinearDependencyChecker()
+
+    print("Vectors:")
+    for vector in vector_set:
+        print(vector)
+
+    is_independent = checker.are_vectors_linearly_independent(vector_set)
+    print("\nAre the vectors linearly independent?")
+    print("Yes" if is_independent else "No")
@@ -79,24 +79,25 @@ class SubspaceAnalyzer:
 
 
 # Example: 
-vector_set = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
-
-analyzer = SubspaceAnalyzer()
-
-print("Vectors:")
-for vector in vector_set:
-    print(vector)
-
-# Example: Compute the dimension of the subspace
-dimension = analyzer.dimension_of_span(vector_set)
-print("\nDimension of the subspace spanned by the vectors:", dimension)
-
-# Example: Compute a basis for the subspace
-basis = analyzer.basis_of_span(vector_set)
-print("\nBasis for the subspace spanned by the vectors:")
-for basis_vector in basis:
-    print(basis_vector)
+if __name__ == "__main__":
+    vector_set = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
+
+    analyzer = SubspaceAnalyzer()
+
+    print("Vectors:")
+    for vector in vector_set:
+        print(vector)
+
+    # Example: Compute the dimension of the subspace
+    dimension = analyzer.dimension_of_span(vector_set)
+    print("\nDimension of the subspace spanned by the vectors:", dimension)
+
+    # Example: Compute a basis for the subspace
+    basis = analyzer.basis_of_span(vector_set)
+    print("\nBasis for the subspace spanned by the vectors:")
+    for basis_vector in basis:
+        print(basis_vector)
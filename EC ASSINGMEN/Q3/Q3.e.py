@@ -72,30 +72,31 @@ class RankFactorization:
 
 
 # Example: 
-matrix_example = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
-
-print("Original Matrix:")
-for row in matrix_example:
-    print(row)
-
-# Computing rank factorization
-rank_factorizer = RankFactorization()
-U, V = rank_factorizer.rank_factorization(matrix_example)
-
-print("\nMatrix U (Basis for Column Space):")
-for row in U:
-    print(row)
-
-print("\nMatrix V (Basis for Row Space):")
-for row in V:
-    print(row)
-
-# Verification
-print("\nVerification (U * V):")
-reconstructed_matrix = [[sum(U[i][k] * V[k][j] for k in range(len(V))) for j in range(len(V[0]))] for i in range(len(U))]
-for row in reconstructed_matrix:
-    print(row)
+if __name__ == "__main__":
+    matrix_example = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
+
+    print("Original Matrix:")
+    for row in matrix_example:
+        print(row)
+
+    # Computing rank factorization
+    rank_factorizer = RankFactorization()
+    U, V = rank_factorizer.rank_factorization(matrix_example)
+
+    print("\nMatrix U (Basis for Column Space):")
+    for row in U:
+        print(row)
+
+    print("\nMatrix V (Basis for Row Space):")
+    for row in V:
+        print(row)
+
+    # Verification
+    print("\nVerification (U * V):")
+    reconstructed_matrix = [[sum(U[i][k] * V[k][j] for k in range(len(V))) for j in range(len(V[0]))] for i in range(len(U))]
+    for row in reconstructed_matrix:
+        print(row)
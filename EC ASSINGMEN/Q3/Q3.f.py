@@ -40,33 +40,34 @@ class LUDecomposition:
 
 
 # Example: 
-matrix_example = [
-    [4, 3],
-    [6, 3]
-]
+if __name__ == "__main__":
+    matrix_example = [
+        [4, 3],
+        [6, 3]
+    ]
 
-print("Original Matrix:")
-for row in matrix_example:
-    print(row)
+    print("Original Matrix:")
+    for row in matrix_example:
+        print(row)
 
-try:
-    # Performing LU decomposition
-    lu = LUDecomposition()
-    L, U = lu.lu_decomposition(matrix_example)
+    try:
+        # Performing LU decomposition
+        lu = LUDecomposition()
+        L, U = lu.lu_decomposition(matrix_example)
 
-    print("\nMatrix L (Lower Triangular):")
-    for row in L:
-        print(row)
+        print("\nMatrix L (Lower Triangular):")
+        for row in L:
+            print(row)
 
-    print("\nMatrix U (Upper Triangular):")
-    for row in U:
-        print(row)
+        print("\nMatrix U (Upper Triangular):")
+        for row in U:
+            print(row)
 
-    # Verification
-    print("\nVerification (L * U):")
-    reconstructed_matrix = [[sum(L[i][k] * U[k][j] for k in range(len(U))) for j in range(len(U[0]))] for i in range(len(L))]
-    for row in reconstructed_matrix:
-        print(row)
+        # Verification
+        print("\nVerification (L * U):")
+        reconstructed_matrix = [[sum(L[i][k] * U[k][j] for k in range(len(U))) for j in range(len(U[0]))] for i in range(len(L))]
+        for row in reconstructed_matrix:
+            print(row)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
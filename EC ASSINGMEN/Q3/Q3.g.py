@@ -50,39 +50,40 @@ class PLUDecomposition:
 
 
 # Example: 
-matrix_example = [
-    [2, 1, 1],
-    [4, -6, 0],
-    [-2, 7, 2]
-]
-
-print("Original Matrix:")
-for row in matrix_example:
-    print(row)
-
-try:
-    # Performing PLU decomposition
-    plu = PLUDecomposition()
-    P, L, U = plu.plu_decomposition(matrix_example)
-
-    print("\nMatrix P (Permutation Matrix):")
-    for row in P:
+if __name__ == "__main__":
+    matrix_example = [
+        [2, 1, 1],
+        [4, -6, 0],
+        [-2, 7, 2]
+    ]
+
+    print("Original Matrix:")
+    for row in matrix_example:
         print(row)
 
-    print("\nMatrix L (Lower Triangular Matrix):")
-    for row in L:
-        print(row)
+    try:
+        # Performing PLU decomposition
+        plu = PLUDecomposition()
+        P, L, U = plu.plu_decomposition(matrix_example)
 
-    print("\nMatrix U (Upper Triangular Matrix):")
-    for row in U:
-        print(row)
+        print("\nMatrix P (Permutation Matrix):")
+        for row in P:
+            print(row)
 
-    # Verification
-    print("\nVerification (P * L * U):")
-    PL = [[sum(P[i][k] * L[k][j] for k in range(len(L))) for j in range(len(L[0]))] for i in range(len(P))]
-    reconstructed_matrix = [[sum(PL[i][k] * U[k][j] for k in range(len(U))) for j in range(len(U[0]))] for i in range(len(PL))]
-    for row in reconstructed_matrix:
-        print(row)
+        print("\nMatrix L (Lower Triangular Matrix):")
+        for row in L:
+            print(row)
+
+        print("\nMatrix U (Upper Triangular Matrix):")
+        for row in U:
+            print(row)
+
+        # Verification
+        print("\nVerification (P * L * U):")
+        PL = [[sum(P[i][k] * L[k][j] for k in range(len(L))) for j in range(len(L[0]))] for i in range(len(P))]
+        reconstructed_matrix = [[sum(PL[i][k] * U[k][j] for k in range(len(U))) for j in range(len(U[0]))] for i in range(len(PL))]
+        for row in reconstructed_matrix:
+            print(row)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
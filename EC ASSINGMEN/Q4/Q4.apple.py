@@ -38,17 +38,18 @@ class LinearSystem:
 
 
 # Example: 
-try:
-    
-    A = [
-        [2, 1],
-        [1, -1]
-    ]
-    b = [5, -1]
-
-  
-    system = LinearSystem(A, b)
-    print(system)
-
-except ValueError as e:
-    print("Error:", e)
+if __name__ == "__main__":
+    try:
+
+        A = [
+            [2, 1],
+            [1, -1]
+        ]
+        b = [5, -1]
+
+
+        system = LinearSystem(A, b)
+        print(system)
+
+    except ValueError as e:
+        print("Error:", e)
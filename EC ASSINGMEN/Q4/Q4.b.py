@@ -97,22 +97,23 @@ class LinearSystem:
 
 
 # Example:
-try:
-    A = [
-        [2, 1, -1],
-        [-3, -1, 2],
-        [-2, 1, 2]
-    ]
-    b = [8, -11, -3]
-
-    
-    system = LinearSystem(A, b)
-    print(system)
-
-  
-    consistent = system.is_consistent()
-    print("\nIs the system consistent?")
-    print("Yes" if consistent else "No")
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    try:
+        A = [
+            [2, 1, -1],
+            [-3, -1, 2],
+            [-2, 1, 2]
+        ]
+        b = [8, -11, -3]
+
+
+        system = LinearSystem(A, b)
+        print(system)
+
+
+        consistent = system.is_consistent()
+        print("\nIs the system consistent?")
+        print("Yes" if consistent else "No")
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -138,24 +138,25 @@ class LinearSystemSolver:
 
 
 # Example:
-try:
-    A = [
-        [2, 1, -1],
-        [-3, -1, 2],
-        [-2, 1, 2]
-    ]
-    b = [8, -11, -3]
-
-    
-    solver = LinearSystemSolver(A, b)
-    print("System of Linear Equations:")
-    for row in A:
-        print(row, "|", b)
-
-   
-    solution = solver.solve()
-    print("\nSolution of the system:")
-    print(solution)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    try:
+        A = [
+            [2, 1, -1],
+            [-3, -1, 2],
+            [-2, 1, 2]
+        ]
+        b = [8, -11, -3]
+
+
+        solver = LinearSystemSolver(A, b)
+        print("System of Linear Equations:")
+        for row in A:
+            print(row, "|", b)
+
+
+        solution = solver.solve()
+        print("\nSolution of the system:")
+        print(solution)
+
+    except ValueError as e:
+        print("\nError:", e)
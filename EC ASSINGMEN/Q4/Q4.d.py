@@ -82,22 +82,23 @@ class SubspaceChecker:
 
 
 # Example: 
-try:
-    S1 = [
-        [1, 2, 3],
-        [4, 5, 6]
-    ]
-    S2 = [
-        [1, 0, 0],
-        [0, 1, 0],
-        [0, 0, 1]
-    ]
-
-    checker = SubspaceChecker()
-    is_subspace = checker.is_subspace(S1, S2)
-
-    print("Is the span of S1 a subspace of the span of S2?")
-    print("Yes" if is_subspace else "No")
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    try:
+        S1 = [
+            [1, 2, 3],
+            [4, 5, 6]
+        ]
+        S2 = [
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1]
+        ]
+
+        checker = SubspaceChecker()
+        is_subspace = checker.is_subspace(S1, S2)
+
+        print("Is the span of S1 a subspace of the span of S2?")
+        print("Yes" if is_subspace else "No")
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -90,20 +90,21 @@ class LinearSystemSolution:
 
 
 # Example: 
-A = [
-    [1, 2, -1, 2],
-    [2, 4, -1, 6],
-    [1, 2, 1, 4]
-]
-b = [5, 9, 6]
-
-try:
-    
-    solver = LinearSystemSolution()
-    solution = solver.solution_set(A, b)
-
-    print("Solution set expressed in terms of free variables:")
-    print(solution)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [1, 2, -1, 2],
+        [2, 4, -1, 6],
+        [1, 2, 1, 4]
+    ]
+    b = [5, 9, 6]
+
+    try:
+
+        solver = LinearSystemSolution()
+        solution = solver.solution_set(A, b)
+
+        print("Solution set expressed in terms of free variables:")
+        print(solution)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -0,0 +1,356 @@
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
+class BandedMatrix:
+    def __init__(self, n, lower, upper, rows=None):
+        """
+        Create an n x n matrix that stores only its bands.
+
+        Row i holds the entries in columns i - lower through i + upper (clipped to
+        the matrix), so storage is O(n * (lower + upper + 1)).
+
+        Args:
+        n (int): The matrix size.
+        lower (int): Number of subdiagonals.
+        upper (int): Number of superdiagonals.
+        rows (list of lists, optional): The band rows; zeros if omitted.
+
+        Raises:
+        ValueError: If a band row has the wrong length.
+        """
+        self.n = n
+        self.lower = lower
+        self.upper = upper
+        if rows is None:
+            rows = [[0.0] * (min(n - 1, i + upper) - max(0, i - lower) + 1) for i in range(n)]
+        for i, row in enumerate(rows):
+            if len(row) != min(n - 1, i + upper) - max(0, i - lower) + 1:
+                raise ValueError(f"Band row {i} has the wrong length.")
+        self.rows = rows
+
+    @classmethod
+    def from_dense(cls, matrix, lower=None, upper=None):
+        """
+        Build a banded matrix from a dense square matrix.
+
+        Only the entries inside the bands are copied, into O(n * (lower + upper + 1))
+        storage; the dense matrix is not kept.
+
+        Args:
+        matrix (list of lists): The dense matrix.
+        lower (int, optional): Number of subdiagonals to keep; detected if omitted.
+        upper (int, optional): Number of superdiagonals to keep; detected if omitted.
+
+        Returns:
+        BandedMatrix: The banded matrix (entries outside the bands are dropped).
+        """
+        n = len(matrix)
+        if lower is None or upper is None:
+            found_lower, found_upper = linalg.q2_apple.MatrixProperties(matrix).bandwidth()
+            lower = found_lower if lower is None else lower
+            upper = found_upper if upper is None else upper
+        rows = [list(matrix[i][max(0, i - lower):min(n - 1, i + upper) + 1]) for i in range(n)]
+        return cls(n, lower, upper, rows)
+
+    @classmethod
+    def from_diagonals(cls, sub, diag, sup):
+        """Build a tridiagonal matrix from its sub-, main and superdiagonal."""
+        n = len(diag)
+        rows = [([sub[i - 1]] if i > 0 else []) + [diag[i]] + ([sup[i]] if i < n - 1 else [])
+                for i in range(n)]
+        return cls(n, 1, 1, rows)
+
+    def get(self, i, j):
+        if j < i - self.lower or j > i + self.upper:
+            return 0
+        return self.rows[i][j - max(0, i - self.lower)]
+
+    def to_dense(self):
+        return [[self.get(i, j) for j in range(self.n)] for i in range(self.n)]
+
+    def matvec(self, x):
+        result = []
+        for i, row in enumerate(self.rows):
+            first = max(0, i - self.lower)
+            result.append(sum(a * b for a, b in zip(row, x[first:first + len(row)])))
+        return result
+
+    @staticmethod
+    def thomas(sub, diag, sup, d):
+        """
+        Solve a tridiagonal system with the Thomas algorithm (no pivoting) in O(n).
+
+        Stable for diagonally dominant or symmetric positive definite matrices.
+
+        Args:
+        sub (list): The subdiagonal (length n - 1).
+        diag (list): The main diagonal (length n).
+        sup (list): The superdiagonal (length n - 1).
+        d (list): The right-hand side.
+
+        Returns:
+        list: The solution vector.
+
+        Raises:
+        ValueError: If a zero pivot is met.
+        """
+        n = len(diag)
+        c = [0.0] * n
+        x = [0.0] * n
+        pivot = diag[0]
+        if pivot == 0:
+            raise ValueError("Zero pivot in the Thomas algorithm; use the banded LU solver.")
+        c[0] = sup[0] / pivot if n > 1 else 0.0
+        x[0] = d[0] / pivot
+        for i in range(1, n):
+            pivot = diag[i] - sub[i - 1] * c[i - 1]
+            if pivot == 0:
+                raise ValueError("Zero pivot in the Thomas algorithm; use the banded LU solver.")
+            if i < n - 1:
+                c[i] = sup[i] / pivot
+            x[i] = (d[i] - sub[i - 1] * x[i - 1]) / pivot
+        for i in range(n - 2, -1, -1):
+            x[i] -= c[i] * x[i + 1]
+        return x
+
+    def lu_factor(self):
+        """
+        Factor the matrix as PA = LU with partial pivoting, keeping the band structure.
+
+        Row interchanges can widen U to lower + upper superdiagonals; L keeps at most
+        lower multipliers per column. Work is O(n * lower * (lower + upper)).
+
+        Returns:
+        tuple: The rows of U (each as its first column and values), the multipliers
+        of L for each column, and the pivot row chosen at each step.
+
+        Raises:
+        ValueError: If the matrix is singular.
+        """
+        n, lower = self.n, self.lower
+        work = [[max(0, i - lower), list(row)] for i, row in enumerate(self.rows)]
+        multipliers = []
+        pivots = []
+
+        for k in range(n):
+            last = min(n - 1, k + lower)
+            p = max(range(k, last + 1),
+                    key=lambda i: abs(work[i][1][k - work[i][0]]) if work[i][0] <= k else 0)
+            first, values = work[p]
+            if first > k or values[k - first] == 0:
+                raise ValueError("Matrix is singular; banded LU factorization not possible.")
+            work[k], work[p] = work[p], work[k]
+            pivots.append(p)
+
+            first, values = work[k]
+            pivot_values = values[k - first:]
+            work[k] = [k, pivot_values]
+            pivot = pivot_values[0]
+            column = []
+            for i in range(k + 1, last + 1):
+                first_i, values_i = work[i]
+                if first_i > k:
+                    column.append(0.0)
+                    continue
+                values_i = values_i[k - first_i:]
+                l = values_i[0] / pivot
+                column.append(l)
+                if len(values_i) < len(pivot_values):
+                    values_i = values_i + [0.0] * (len(pivot_values) - len(values_i))
+                if l != 0:
+                    for j in range(1, len(pivot_values)):
+                        values_i[j] -= l * pivot_values[j]
+                work[i] = [k + 1, values_i[1:]]
+            multipliers.append(column)
+
+        return work, multipliers, pivots
+
+    @staticmethod
+    def lu_solve(factors, B):
+        """
+        Solve A X = B from the factors of lu_factor.
+
+        Args:
+        factors (tuple): The result of lu_factor.
+        B (list): A right-hand side vector, or a matrix with one column per right-hand side.
+
+        Returns:
+        list: The solution, with the same shape as B.
+        """
+        U, multipliers, pivots = factors
+        n = len(U)
+        vector = not isinstance(B[0], list)
+        X = [[b] for b in B] if vector else [list(row) for row in B]
+
+        for k in range(n):
+            p = pivots[k]
+            if p != k:
+                X[k], X[p] = X[p], X[k]
+            xk = X[k]
+            for offset, l in enumerate(multipliers[k]):
+                if l != 0:
+                    i = k + 1 + offset
+                    X[i] = [a - l * b for a, b in zip(X[i], xk)]
+        for k in range(n - 1, -1, -1):
+            _, values = U[k]
+            xk = X[k]
+            for offset in range(1, len(values)):
+                f = values[offset]
+                if f != 0:
+                    xk = [a - f * b for a, b in zip(xk, X[k + offset])]
+            X[k] = [a / values[0] for a in xk]
+
+        return [row[0] for row in X] if vector else X
+
+    def cholesky(self):
+        """
+        Factor a symmetric positive definite banded matrix as A = L L^T in O(n * lower^2).
+
+        Returns:
+        list of lists: Row i of L, holding columns i - lower through i.
+
+        Raises:
+        ValueError: If the bandwidth is not symmetric or the matrix is not positive definite.
+        """
+        n, w = self.n, self.lower
+        if self.upper != w:
+            raise ValueError("Banded Cholesky needs equal lower and upper bandwidths.")
+        L = []
+        for i in range(n):
+            first = max(0, i - w)
+            row = list(self.rows[i][:i - first + 1])
+            for j in range(first, i + 1):
+                row_j, first_j = L[j] if j < i else row, max(0, j - w)
+                start = max(first, first_j)
+                s = row[j - first] - sum(row[k - first] * row_j[k - first_j] for k in range(start, j))
+                if j < i:
+                    row[j - first] = s / row_j[j - first_j]
+                else:
+                    if s <= 0:
+                        raise ValueError("Matrix is not positive definite.")
+                    row[j - first] = s ** 0.5
+            L.append(row)
+        return L
+
+    def cholesky_solve(self, L, B):
+        """
+        Solve A X = B from the banded Cholesky factor.
+
+        Args:
+        L (list of lists): The factor returned by cholesky.
+        B (list): A right-hand side vector, or a matrix with one column per right-hand side.
+
+        Returns:
+        list: The solution, with the same shape as B.
+        """
+        n, w = self.n, self.lower
+        vector = not isinstance(B[0], list)
+        X = [[b] for b in B] if vector else [list(row) for row in B]
+
+        for i in range(n):
+            first = max(0, i - w)
+            xi = X[i]
+            for k in range(first, i):
+                f = L[i][k - first]
+                if f != 0:
+                    xi = [a - f * b for a, b in zip(xi, X[k])]
+            X[i] = [a / L[i][i - first] for a in xi]
+        for i in range(n - 1, -1, -1):
+            xi = X[i]
+            for k in range(i + 1, min(n, i + w + 1)):
+                f = L[k][i - max(0, k - w)]
+                if f != 0:
+                    xi = [a - f * b for a, b in zip(xi, X[k])]
+            X[i] = [a / L[i][i - max(0, i - w)] for a in xi]
+
+        return [row[0] for row in X] if vector else X
+
+    def is_symmetric(self):
+        return self.lower == self.upper and all(
+            self.get(i, j) == self.get(j, i) for i in range(self.n) for j in range(i + 1, min(self.n, i + self.upper + 1)))
+
+    def is_diagonally_dominant(self):
+        for i, row in enumerate(self.rows):
+            diagonal = abs(self.get(i, i))
+            if diagonal < sum(abs(x) for x in row) - diagonal:
+                return False
+        return True
+
+    def solve(self, B, method="auto"):
+        """
+        Solve A X = B for a vector or several right-hand sides.
+
+        Args:
+        B (list): A right-hand side vector, or a matrix with one column per right-hand side.
+        method (str): "thomas", "cholesky", "lu" or "auto". Auto uses Thomas for
+        diagonally dominant tridiagonal matrices, Cholesky for symmetric matrices
+        with a positive diagonal (falling back to LU if that fails) and LU otherwise.
+
+        Returns:
+        list: The solution, with the same shape as B.
+
+        Raises:
+        ValueError: If the matrix is singular or the method does not apply.
+        """
+        if method == "auto":
+            if self.lower == self.upper == 1 and self.is_diagonally_dominant():
+                method = "thomas"
+            elif self.is_symmetric() and all(self.get(i, i) > 0 for i in range(self.n)):
+                try:
+                    return self.cholesky_solve(self.cholesky(), B)
+                except ValueError:
+                    method = "lu"
+            else:
+                method = "lu"
+
+        if method == "thomas":
+            if self.lower > 1 or self.upper > 1:
+                raise ValueError("The Thomas algorithm needs a tridiagonal matrix.")
+            n = self.n
+            sub = [self.get(i + 1, i) for i in range(n - 1)]
+            diag = [self.get(i, i) for i in range(n)]
+            sup = [self.get(i, i + 1) for i in range(n - 1)]
+            if not isinstance(B[0], list):
+                return BandedMatrix.thomas(sub, diag, sup, B)
+            columns = [BandedMatrix.thomas(sub, diag, sup, [row[c] for row in B]) for c in range(len(B[0]))]
+            return [list(row) for row in zip(*columns)]
+        if method == "cholesky":
+            return self.cholesky_solve(self.cholesky(), B)
+        if method == "lu":
+            return BandedMatrix.lu_solve(self.lu_factor(), B)
+        raise ValueError(f"Unknown method '{method}'.")
+
+
+# Example:
+if __name__ == "__main__":
+    # Second-difference matrix of a 1-D Poisson problem.
+    n = 6
+    A = BandedMatrix.from_diagonals([-1] * (n - 1), [2] * n, [-1] * (n - 1))
+    b = [1] * n
+
+    try:
+        print("Tridiagonal system (Thomas algorithm):")
+        print(A.solve(b))
+
+        print("\nSame system with banded Cholesky:")
+        print(A.solve(b, method="cholesky"))
+
+        P = BandedMatrix.from_dense([
+            [0, 2, 1, 0, 0],
+            [1, 1, 3, 1, 0],
+            [4, 1, 0, 2, 5],
+            [0, 3, 1, 1, 2],
+            [0, 0, 2, 1, 3]
+        ])
+        print("\nPentadiagonal system with banded LU (bandwidths {}, {}):".format(P.lower, P.upper))
+        print(P.solve([3, 6, 12, 7, 6]))
+
+    except ValueError as e:
+        print("\nError:", e)
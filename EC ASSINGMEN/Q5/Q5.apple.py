@@ -1,3 +1,14 @@
+import math
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixInverse:
     @staticmethod
     def is_square(matrix):
@@ -75,21 +86,318 @@ class MatrixInverse:
         return inverse_matrix
 
     @staticmethod
-    def inverse(matrix):
+    def lu_factor(matrix, overwrite=False):
+        """
+        Factor a square matrix as PA = LU using partial pivoting.
+
+        L (unit diagonal, not stored) and U are packed into a single matrix.
+
+        Args:
+        matrix (list of lists): The input square matrix.
+        overwrite (bool): If True, the rows of matrix are reused to hold the factors.
+
+        Returns:
+        tuple: The packed LU matrix and the row permutation, or None if the matrix is singular.
+        """
+        n = len(matrix)
+        lu = matrix if overwrite else [row[:] for row in matrix]
+        perm = list(range(n))
+
+        for k in range(n):
+            pivot_row = max(range(k, n), key=lambda r: abs(lu[r][k]))
+            if lu[pivot_row][k] == 0:
+                return None
+
+            if pivot_row != k:
+                lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+                perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+
+            pivot = lu[k]
+            pivot_tail = pivot[k + 1:]
+            for row_idx in range(k + 1, n):
+                row = lu[row_idx]
+                factor = row[k] / pivot[k]
+                row[k] = factor
+                if factor != 0:
+                    row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], pivot_tail)]
+
+        return lu, perm
+
+    @staticmethod
+    def lu_solve(lu, perm, B, start=0):
+        """
+        Solve AX = B for a block of right-hand sides using a packed LU factorization.
+
+        Args:
+        lu (list of lists): The packed LU matrix from lu_factor.
+        perm (list): The row permutation from lu_factor.
+        B (list of lists): The right-hand sides, one row per equation.
+        start (int): The first row of PB that may be nonzero; earlier rows are skipped.
+
+        Returns:
+        list of lists: The solution matrix X.
+        """
+        n = len(lu)
+        X = [B[p][:] for p in perm]
+
+        for i in range(start + 1, n):
+            row = lu[i]
+            x_i = X[i]
+            for k in range(start, i):
+                factor = row[k]
+                if factor != 0:
+                    x_i = [a - factor * b for a, b in zip(x_i, X[k])]
+            X[i] = x_i
+
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            x_i = X[i]
+            for k in range(i + 1, n):
+                factor = row[k]
+                if factor != 0:
+                    x_i = [a - factor * b for a, b in zip(x_i, X[k])]
+            X[i] = [a / row[i] for a in x_i]
+
+        return X
+
+    @staticmethod
+    def lu_solve_adjoint(lu, perm, b):
+        """
+        Solve A^H x = b for one right-hand side using a packed LU factorization.
+
+        Args:
+        lu (list of lists): The packed LU matrix from lu_factor.
+        perm (list): The row permutation from lu_factor.
+        b (list): The right-hand side vector.
+
+        Returns:
+        list: The solution vector x.
+        """
+        n = len(lu)
+        # A^H = U^H L^H P: solve with U^H (lower), then L^H (unit upper), then undo P.
+        w = list(b)
+        for i in range(n):
+            w[i] = (w[i] - sum(lu[k][i].conjugate() * w[k] for k in range(i))) / lu[i][i].conjugate()
+        for i in range(n - 1, -1, -1):
+            w[i] -= sum(lu[k][i].conjugate() * w[k] for k in range(i + 1, n))
+        x = [0.0] * n
+        for i, p in enumerate(perm):
+            x[p] = w[i]
+        return x
+
+    @staticmethod
+    def condition_estimate(matrix, factors=None):
+        """
+        Estimate the 1-norm condition number of a matrix in O(n^2) from its LU factors.
+
+        Args:
+        matrix (list of lists): The input square matrix.
+        factors (tuple, optional): The packed LU matrix and permutation from lu_factor;
+        computed if omitted.
+
+        Returns:
+        float: An estimate of ||A||_1 ||A^-1||_1 (inf if the matrix is singular).
         """
-        Compute the inverse of a square matrix by row reduction.
+        n = len(matrix)
+        if factors is None:
+            factors = MatrixInverse.lu_factor(matrix)
+            if factors is None:
+                return math.inf
+        lu, perm = factors
+
+        def solve(x):
+            return [row[0] for row in MatrixInverse.lu_solve(lu, perm, [[v] for v in x])]
+
+        norm = max((sum(abs(row[j]) for row in matrix) for j in range(n)), default=0.0)
+        return norm * linalg.q4_f.PLUSolver.inverse_norm_estimate(
+            solve, lambda x: MatrixInverse.lu_solve_adjoint(lu, perm, x), n)
+
+    @staticmethod
+    def inverse_lu(matrix, overwrite=False, block_size=64):
+        """
+        Compute the inverse of a square matrix from a single LU factorization.
+
+        The identity is solved in panels of block_size columns, skipping the
+        leading zero rows of each permuted panel during forward substitution.
 
         Args:
         matrix (list of lists): The input square matrix.
+        overwrite (bool): If True, the input is overwritten with its inverse.
+        block_size (int): The number of unit columns solved per panel.
 
         Returns:
         list of lists: The inverse matrix if invertible, else None.
+
+        Raises:
+        ValueError: If the matrix is not square.
         """
         if not MatrixInverse.is_square(matrix):
             raise ValueError("The matrix is not square and cannot be inverted.")
 
-        augmented_matrix = MatrixInverse.augment_with_identity(matrix)
-        inverse_matrix = MatrixInverse.row_reduce_to_inverse(augmented_matrix)
+        factors = MatrixInverse.lu_factor(matrix, overwrite)
+        if factors is None:
+            return None
+        lu, perm = factors
+
+        n = len(lu)
+        position = [0] * n
+        for i, p in enumerate(perm):
+            position[p] = i
+
+        inverse_matrix = [[] for _ in range(n)]
+        for c0 in range(0, n, block_size):
+            c1 = min(c0 + block_size, n)
+            panel = [[1.0 if r == c else 0.0 for c in range(c0, c1)] for r in range(n)]
+            start = min(position[c] for c in range(c0, c1))
+            X = MatrixInverse.lu_solve(lu, perm, panel, start)
+            for i in range(n):
+                inverse_matrix[i].extend(X[i])
+
+        if overwrite:
+            for i in range(n):
+                matrix[i][:] = inverse_matrix[i]
+            return matrix
+
+        return inverse_matrix
+
+    @staticmethod
+    def inverse_in_place(matrix, block_size=64):
+        """
+        Overwrite a square matrix with its inverse.
+
+        Args:
+        matrix (list of lists): The input square matrix.
+        block_size (int): The number of unit columns solved per panel.
+
+        Returns:
+        list of lists: The input matrix holding its inverse, or None if singular.
+        """
+        return MatrixInverse.inverse_lu(matrix, overwrite=True, block_size=block_size)
+
+    @staticmethod
+    def inverse_small(values, size):
+        """
+        Invert a matrix of size 1 to 4 in closed form.
+
+        Args:
+        values (sequence): The size*size entries of the matrix in row-major order.
+        size (int): The number of rows (and columns) of the matrix.
+
+        Returns:
+        list: The entries of the inverse in row-major order, or None if singular.
+        """
+        if size == 1:
+            return None if values[0] == 0 else [1 / values[0]]
+
+        if size == 2:
+            a, b, c, d = values
+            det = a * d - b * c
+            if det == 0:
+                return None
+            return [d / det, -b / det, -c / det, a / det]
+
+        if size == 3:
+            a, b, c, d, e, f, g, h, i = values
+            c00 = e * i - f * h
+            c01 = f * g - d * i
+            c02 = d * h - e * g
+            det = a * c00 + b * c01 + c * c02
+            if det == 0:
+                return None
+            inv_det = 1 / det
+            return [
+                c00 * inv_det, (c * h - b * i) * inv_det, (b * f - c * e) * inv_det,
+                c01 * inv_det, (a * i - c * g) * inv_det, (c * d - a * f) * inv_det,
+                c02 * inv_det, (b * g - a * h) * inv_det, (a * e - b * d) * inv_det,
+            ]
+
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = values
+        s0 = a00 * a11 - a01 * a10
+        s1 = a00 * a12 - a02 * a10
+        s2 = a00 * a13 - a03 * a10
+        s3 = a01 * a12 - a02 * a11
+        s4 = a01 * a13 - a03 * a11
+        s5 = a02 * a13 - a03 * a12
+        c0 = a20 * a31 - a21 * a30
+        c1 = a20 * a32 - a22 * a30
+        c2 = a20 * a33 - a23 * a30
+        c3 = a21 * a32 - a22 * a31
+        c4 = a21 * a33 - a23 * a31
+        c5 = a22 * a33 - a23 * a32
+        det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+        if det == 0:
+            return None
+        inv_det = 1 / det
+        return [
+            (a11 * c5 - a12 * c4 + a13 * c3) * inv_det,
+            (-a01 * c5 + a02 * c4 - a03 * c3) * inv_det,
+            (a31 * s5 - a32 * s4 + a33 * s3) * inv_det,
+            (-a21 * s5 + a22 * s4 - a23 * s3) * inv_det,
+            (-a10 * c5 + a12 * c2 - a13 * c1) * inv_det,
+            (a00 * c5 - a02 * c2 + a03 * c1) * inv_det,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * inv_det,
+            (a20 * s5 - a22 * s2 + a23 * s1) * inv_det,
+            (a10 * c4 - a11 * c2 + a13 * c0) * inv_det,
+            (-a00 * c4 + a01 * c2 - a03 * c0) * inv_det,
+            (a30 * s4 - a31 * s2 + a33 * s0) * inv_det,
+            (-a20 * s4 + a21 * s2 - a23 * s0) * inv_det,
+            (-a10 * c3 + a11 * c1 - a12 * c0) * inv_det,
+            (a00 * c3 - a01 * c1 + a02 * c0) * inv_det,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * inv_det,
+            (a20 * s3 - a21 * s1 + a22 * s0) * inv_det,
+        ]
+
+    @staticmethod
+    def inverse_batch(packed, size):
+        """
+        Invert a batch of small matrices in one call.
+
+        Args:
+        packed (list): N matrices of size 1 to 4, concatenated in row-major order.
+        size (int): The number of rows (and columns) of each matrix.
+
+        Returns:
+        list: The N inverses, concatenated in row-major order.
+
+        Raises:
+        ValueError: If the size is unsupported or any matrix in the batch is singular.
+        """
+        if size not in (1, 2, 3, 4):
+            raise ValueError("Batched inverses support matrices up to 4x4.")
+        stride = size * size
+        if len(packed) % stride != 0:
+            raise ValueError("The packed array length must be a multiple of size * size.")
+
+        result = []
+        for o in range(0, len(packed), stride):
+            inverse_values = MatrixInverse.inverse_small(packed[o:o + stride], size)
+            if inverse_values is None:
+                raise ValueError(f"Matrix {o // stride} in the batch is not invertible.")
+            result.extend(inverse_values)
+        return result
+
+    @staticmethod
+    def inverse(matrix):
+        """
+        Compute the inverse of a square matrix using LU factorization.
+
+        Matrices up to 4x4 are inverted with closed-form kernels instead.
+
+        Args:
+        matrix (list of lists): The input square matrix.
+
+        Returns:
+        list of lists: The inverse matrix if invertible, else None.
+        """
+        n = len(matrix)
+        if 1 <= n <= 4 and MatrixInverse.is_square(matrix):
+            inverse_values = MatrixInverse.inverse_small([x for row in matrix for x in row], n)
+            inverse_matrix = None
+            if inverse_values is not None:
+                inverse_matrix = [inverse_values[i * n:(i + 1) * n] for i in range(n)]
+        else:
+            inverse_matrix = MatrixInverse.inverse_lu(matrix)
 
         if inverse_matrix is None:
             print("The matrix is not invertible.")
@@ -99,18 +407,20 @@ class MatrixInverse:
 
 
 # Example: 
-A = [
-    [2, 1, 1],
-    [1, 3, 2],
-    [1, 0, 0]
-]
+if __name__ == "__main__":
+    A = [
+        [2, 1, 1],
+        [1, 3, 2],
+        [1, 0, 0]
+    ]
 
-try:
-    inverse = MatrixInverse.inverse(A)
-    if inverse:
-        print("Inverse of the matrix:")
-        for row in inverse:
-            print(row)
-
-except ValueError as e:
-    print("\nError:", e)
+    try:
+        inverse = MatrixInverse.inverse(A)
+        if inverse:
+            print("Inverse of the matrix:")
+            for row in inverse:
+                print(row)
+            print("Condition number estimate:", MatrixInverse.condition_estimate(A))
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -56,11 +56,60 @@ class MatrixInverseAdjoint:
         adj = [[MatrixInverseAdjoint.cofactor(matrix, i, j) for i in range(n)] for j in range(n)]
         return adj
 
+    @staticmethod
+    def inverse_using_lu(matrix):
+        """
+        Compute the inverse of a square matrix from a single PLU factorization.
+
+        Args:
+        matrix (list of lists): The input square matrix.
+
+        Returns:
+        list of lists: The inverse matrix if invertible, else None.
+        """
+        n = len(matrix)
+        lu = [row[:] for row in matrix]
+        perm = list(range(n))
+
+        for k in range(n):
+            pivot_row = max(range(k, n), key=lambda r: abs(lu[r][k]))
+            if lu[pivot_row][k] == 0:
+                return None
+            if pivot_row != k:
+                lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+                perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+
+            pivot = lu[k]
+            for row_idx in range(k + 1, n):
+                row = lu[row_idx]
+                factor = row[k] / pivot[k]
+                row[k] = factor
+                if factor != 0:
+                    row[k + 1:] = [a - factor * b for a, b in zip(row[k + 1:], pivot[k + 1:])]
+
+        X = [[1.0 if p == c else 0.0 for c in range(n)] for p in perm]
+        for i in range(1, n):
+            for k in range(i):
+                factor = lu[i][k]
+                if factor != 0:
+                    X[i] = [a - factor * b for a, b in zip(X[i], X[k])]
+        for i in range(n - 1, -1, -1):
+            for k in range(i + 1, n):
+                factor = lu[i][k]
+                if factor != 0:
+                    X[i] = [a - factor * b for a, b in zip(X[i], X[k])]
+            X[i] = [a / lu[i][i] for a in X[i]]
+
+        return X
+
     @staticmethod
     def inverse_using_adjoint(matrix):
         """
         Compute the inverse of a square matrix using the adjoint method.
 
+        Matrices larger than 3x3 are inverted through PLU factorization instead,
+        since the cofactor expansion grows factorially with the size.
+
         Args:
         matrix (list of lists): The input square matrix.
 
@@ -73,6 +122,12 @@ class MatrixInverseAdjoint:
         if any(len(row) != n for row in matrix):
             raise ValueError("The matrix is not square and cannot be inverted.")
 
+        if n > 3:
+            inverse = MatrixInverseAdjoint.inverse_using_lu(matrix)
+            if inverse is None:
+                print("The matrix is not invertible.")
+            return inverse
+
         det = MatrixInverseAdjoint.determinant(matrix)
         if det == 0:
             print("The matrix is not invertible.")
@@ -84,18 +139,19 @@ class MatrixInverseAdjoint:
 
 
 # Example: 
-A = [
-    [2, 1, 1],
-    [1, 3, 2],
-    [1, 0, 0]
-]
-
-try:
-    inverse = MatrixInverseAdjoint.inverse_using_adjoint(A)
-    if inverse:
-        print("Inverse of the matrix (using adjoint method):")
-        for row in inverse:
-            print(row)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [2, 1, 1],
+        [1, 3, 2],
+        [1, 0, 0]
+    ]
+
+    try:
+        inverse = MatrixInverseAdjoint.inverse_using_adjoint(A)
+        if inverse:
+            print("Inverse of the matrix (using adjoint method):")
+            for row in inverse:
+                print(row)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -77,19 +77,20 @@ class LinearSpanChecker:
 
 
 # Example: 
-S = [
-    [1, 0, 0],
-    [0, 1, 0],
-    [0, 0, 1]
-]
-v = [1, 1, 1]
-
-try:
-    checker = LinearSpanChecker()
-    is_in_span = checker.is_in_linear_span(S, v)
-
-    print("Is the vector v in the linear span of S?")
-    print("Yes" if is_in_span else "No")
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    S = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1]
+    ]
+    v = [1, 1, 1]
+
+    try:
+        checker = LinearSpanChecker()
+        is_in_span = checker.is_in_linear_span(S, v)
+
+        print("Is the vector v in the linear span of S?")
+        print("Yes" if is_in_span else "No")
+
+    except ValueError as e:
+        print("\nError:", e)
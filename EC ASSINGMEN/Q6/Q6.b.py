@@ -88,19 +88,20 @@ class LinearCombinationFinder:
 
 
 # Example: 
-S = [
-    [1, 0, 0],
-    [0, 1, 0],
-    [0, 0, 1]
-]
-v = [2, 3, 4]
-
-try:
-    finder = LinearCombinationFinder()
-    coefficients = finder.express_in_span(S, v)
-
-    print("Representation of vector v as a linear combination of vectors in S:")
-    print("v =", " + ".join(f"{coeff}*S{i+1}" for i, coeff in enumerate(coefficients)))
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    S = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1]
+    ]
+    v = [2, 3, 4]
+
+    try:
+        finder = LinearCombinationFinder()
+        coefficients = finder.express_in_span(S, v)
+
+        print("Representation of vector v as a linear combination of vectors in S:")
+        print("v =", " + ".join(f"{coeff}*S{i+1}" for i, coeff in enumerate(coefficients)))
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -95,24 +95,25 @@ class SubspaceComparer:
 
 
 # Example:
-S1 = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
-
-S2 = [
-    [1, 0, -1],
-    [0, 1, 1],
-    [1, 1, 0]
-]
-
-try:
-    comparer = SubspaceComparer()
-    are_equal = comparer.is_span_equal(S1, S2)
-
-    print("Do S1 and S2 span the same subspace?")
-    print("Yes" if are_equal else "No")
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    S1 = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
+
+    S2 = [
+        [1, 0, -1],
+        [0, 1, 1],
+        [1, 1, 0]
+    ]
+
+    try:
+        comparer = SubspaceComparer()
+        are_equal = comparer.is_span_equal(S1, S2)
+
+        print("Do S1 and S2 span the same subspace?")
+        print("Yes" if are_equal else "No")
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -109,24 +109,25 @@ class BasisCoordinate:
 
 
 # Example:
-B = [
-    [1, 0, 0],
-    [0, 1, 0],
-    [0, 0, 1]
-]
-v = [2, 3, 4]
-
-try:
-  
-    finder = BasisCoordinate()
-    coordinates = finder.compute_coordinates(B, v)
-    print("Coordinates of v in basis B:")
-    print(coordinates)
+if __name__ == "__main__":
+    B = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1]
+    ]
+    v = [2, 3, 4]
 
-    
-    reconstructed_vector = finder.reconstruct_vector(B, coordinates)
-    print("\nReconstructed vector from coordinates:")
-    print(reconstructed_vector)
+    try:
+
+        finder = BasisCoordinate()
+        coordinates = finder.compute_coordinates(B, v)
+        print("Coordinates of v in basis B:")
+        print(coordinates)
+
+
+        reconstructed_vector = finder.reconstruct_vector(B, coordinates)
+        print("\nReconstructed vector from coordinates:")
+        print(reconstructed_vector)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
@@ -109,24 +109,25 @@ class ChangeOfBasis:
 
 
 # Example:
-B1 = [
-    [1, 0, 0],
-    [0, 1, 0],
-    [0, 0, 1]
-]
-B2 = [
-    [2, 1, 0],
-    [1, 3, 0],
-    [0, 0, 1]
-]
-
-try:
-    cob_finder = ChangeOfBasis()
-    cob_matrix = cob_finder.change_of_basis_matrix(B1, B2)
-
-    print("Change of basis matrix from B1 to B2:")
-    for row in cob_matrix:
-        print(row)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    B1 = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1]
+    ]
+    B2 = [
+        [2, 1, 0],
+        [1, 3, 0],
+        [0, 0, 1]
+    ]
+
+    try:
+        cob_finder = ChangeOfBasis()
+        cob_matrix = cob_finder.change_of_basis_matrix(B1, B2)
+
+        print("Change of basis matrix from B1 to B2:")
+        for row in cob_matrix:
+            print(row)
+
+    except ValueError as e:
+        print("\nError:", e)
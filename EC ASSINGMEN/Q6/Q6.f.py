@@ -127,24 +127,25 @@ class BasisChange:
 
 
 # Example:
-B1 = [
-    [1, 0, 0],
-    [0, 1, 0],
-    [0, 0, 1]
-]
-B2 = [
-    [2, 1, 0],
-    [1, 3, 0],
-    [0, 0, 1]
-]
-v_coords_B1 = [3, 2, 1]
-
-try:
-    basis_changer = BasisChange()
-    v_coords_B2 = basis_changer.change_coordinates(v_coords_B1, B1, B2)
-
-    print("Coordinates of v in basis B2:")
-    print(v_coords_B2)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    B1 = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1]
+    ]
+    B2 = [
+        [2, 1, 0],
+        [1, 3, 0],
+        [0, 0, 1]
+    ]
+    v_coords_B1 = [3, 2, 1]
+
+    try:
+        basis_changer = BasisChange()
+        v_coords_B2 = basis_changer.change_coordinates(v_coords_B1, B1, B2)
+
+        print("Coordinates of v in basis B2:")
+        print(v_coords_B2)
+
+    except ValueError as e:
+        print("\nError:", e)
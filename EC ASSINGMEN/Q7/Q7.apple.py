@@ -47,16 +47,17 @@ class DeterminantCofactor:
 
 
 # Example:
-A = [
-    [3, 2, -1],
-    [2, -2, 4],
-    [-1, 0.5, -1]
-]
-
-try:
-    det = DeterminantCofactor.determinant(A)
-    print("Determinant of the matrix (using cofactor expansion):")
-    print(det)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [3, 2, -1],
+        [2, -2, 4],
+        [-1, 0.5, -1]
+    ]
+
+    try:
+        det = DeterminantCofactor.determinant(A)
+        print("Determinant of the matrix (using cofactor expansion):")
+        print(det)
+
+    except ValueError as e:
+        print("\nError:", e)
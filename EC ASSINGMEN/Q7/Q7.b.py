@@ -46,18 +46,100 @@ class DeterminantPLU:
 
         return P, L, U, num_swaps
 
+    @staticmethod
+    def determinant_small(values, size):
+        """
+        Compute the determinant of a matrix of size 1 to 4 in closed form.
+
+        Args:
+        values (sequence): The size*size entries of the matrix in row-major order.
+        size (int): The number of rows (and columns) of the matrix.
+
+        Returns:
+        float: The determinant of the matrix.
+        """
+        if size == 1:
+            return values[0]
+        if size == 2:
+            a, b, c, d = values
+            return a * d - b * c
+        if size == 3:
+            a, b, c, d, e, f, g, h, i = values
+            return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = values
+        s0 = a00 * a11 - a01 * a10
+        s1 = a00 * a12 - a02 * a10
+        s2 = a00 * a13 - a03 * a10
+        s3 = a01 * a12 - a02 * a11
+        s4 = a01 * a13 - a03 * a11
+        s5 = a02 * a13 - a03 * a12
+        c0 = a20 * a31 - a21 * a30
+        c1 = a20 * a32 - a22 * a30
+        c2 = a20 * a33 - a23 * a30
+        c3 = a21 * a32 - a22 * a31
+        c4 = a21 * a33 - a23 * a31
+        c5 = a22 * a33 - a23 * a32
+        return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+    @staticmethod
+    def determinant_batch(packed, size):
+        """
+        Compute the determinants of a batch of small matrices in one call.
+
+        Args:
+        packed (list): N matrices of size 1 to 4, concatenated in row-major order.
+        size (int): The number of rows (and columns) of each matrix.
+
+        Returns:
+        list: The N determinants, in order.
+
+        Raises:
+        ValueError: If the size is unsupported or does not divide the packed length.
+        """
+        if size not in (1, 2, 3, 4):
+            raise ValueError("Batched determinants support matrices up to 4x4.")
+        stride = size * size
+        if len(packed) % stride != 0:
+            raise ValueError("The packed array length must be a multiple of size * size.")
+
+        if size == 1:
+            return list(packed)
+        if size == 2:
+            return [packed[o] * packed[o + 3] - packed[o + 1] * packed[o + 2]
+                    for o in range(0, len(packed), 4)]
+        return [DeterminantPLU.determinant_small(packed[o:o + stride], size)
+                for o in range(0, len(packed), stride)]
+
     @staticmethod
     def determinant(matrix):
         """
         Compute the determinant of a square matrix using PLU decomposition.
 
+        Matrices up to 4x4 are evaluated with closed-form kernels instead. A singular
+        matrix has determinant 0.0 at every size.
+
         Args:
         matrix (list of lists): The input square matrix.
 
         Returns:
         float: The determinant of the matrix.
+
+        Raises:
+        ValueError: If the matrix is not square.
         """
-        _, _, U, num_swaps = DeterminantPLU.plu_decomposition(matrix)
+        n = len(matrix)
+        if any(len(row) != n for row in matrix):
+            raise ValueError("The matrix must be square to compute its determinant.")
+        if 1 <= n <= 4:
+            return DeterminantPLU.determinant_small([x for row in matrix for x in row], n)
+
+        try:
+            _, _, U, num_swaps = DeterminantPLU.plu_decomposition(matrix)
+        except ValueError:
+            # plu_decomposition stops at a zero pivot column, so the matrix is singular.
+            return 0.0
 
         det = (-1) ** num_swaps
         for i in range(len(U)):
@@ -67,16 +149,17 @@ class DeterminantPLU:
 
 
 # Example:
-A = [
-    [3, 2, -1],
-    [2, -2, 4],
-    [-1, 0.5, -1]
-]
-
-try:
-    det = DeterminantPLU.determinant(A)
-    print("Determinant of the matrix (using PLU decomposition):")
-    print(det)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [3, 2, -1],
+        [2, -2, 4],
+        [-1, 0.5, -1]
+    ]
+
+    try:
+        det = DeterminantPLU.determinant(A)
+        print("Determinant of the matrix (using PLU decomposition):")
+        print(det)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -62,16 +62,17 @@ class DeterminantRREF:
 
 
 # Example:
-A = [
-    [3, 2, -1],
-    [2, -2, 4],
-    [-1, 0.5, -1]
-]
-
-try:
-    det = DeterminantRREF.determinant(A)
-    print("Determinant of the matrix (using RREF and elementary operations):")
-    print(det)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [3, 2, -1],
+        [2, -2, 4],
+        [-1, 0.5, -1]
+    ]
+
+    try:
+        det = DeterminantRREF.determinant(A)
+        print("Determinant of the matrix (using RREF and elementary operations):")
+        print(det)
+
+    except ValueError as e:
+        print("\nError:", e)
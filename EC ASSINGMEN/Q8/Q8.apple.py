@@ -21,14 +21,15 @@ class InnerProduct:
 
 
 # Example:
-v1 = [1, 2, 3]
-v2 = [4, 5, 6]
-
-try:
-    calculator = InnerProduct()
-    result = calculator.inner_product(v1, v2)
-    print("Inner product of v1 and v2:")
-    print(result)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    v1 = [1, 2, 3]
+    v2 = [4, 5, 6]
+
+    try:
+        calculator = InnerProduct()
+        result = calculator.inner_product(v1, v2)
+        print("Inner product of v1 and v2:")
+        print(result)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -21,14 +21,15 @@ class Orthogonality:
         return abs(inner_product) < 1e-10 
 
 # Example:
-v1 = [1, 0, 0]
-v2 = [0, 1, 0]
+if __name__ == "__main__":
+    v1 = [1, 0, 0]
+    v2 = [0, 1, 0]
 
-try:
-    checker = Orthogonality()
-    result = checker.is_orthogonal(v1, v2)
-    print("Are v1 and v2 orthogonal?")
-    print("Yes" if result else "No")
+    try:
+        checker = Orthogonality()
+        result = checker.is_orthogonal(v1, v2)
+        print("Are v1 and v2 orthogonal?")
+        print("Yes" if result else "No")
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
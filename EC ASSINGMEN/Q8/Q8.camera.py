@@ -1,11 +1,29 @@
+import operator
+
 class GramSchmidt:
     @staticmethod
-    def gram_schmidt(S):
+    def inner_product(v1, v2):
+        """Compute the inner product of two vectors."""
+        return sum(map(operator.mul, v1, v2))
+
+    @staticmethod
+    def subtract_scaled(scalar, x, y):
+        """Return y - scalar * x."""
+        return [b - scalar * a for a, b in zip(x, y)]
+
+    @staticmethod
+    def gram_schmidt(S, modified=False, normalize=False, reorthogonalize=False, tolerance=1e-10):
         """
         Perform Gram-Schmidt orthogonalisation on a set of vectors.
 
         Args:
         S (list of lists): Set of vectors.
+        modified (bool): If True, use modified Gram-Schmidt, projecting out each
+        basis vector from the running remainder instead of from the original vector.
+        normalize (bool): If True, return an orthonormal set.
+        reorthogonalize (bool): If True, run a second projection pass whenever the
+        remainder has lost more than half of its norm to cancellation.
+        tolerance (float): Norm below which a remainder is treated as zero.
 
         Returns:
         list of lists: The orthogonalised set of vectors.
@@ -13,47 +31,114 @@ class GramSchmidt:
         Raises:
         ValueError: If the input vectors are not linearly independent.
         """
-        def inner_product(v1, v2):
-            """Compute the inner product of two vectors."""
-            return sum(v1[i] * v2[i] for i in range(len(v1)))
-
-        def scalar_multiply(scalar, vector):
-            """Multiply a vector by a scalar."""
-            return [scalar * x for x in vector]
-
-        def vector_subtract(v1, v2):
-            """Subtract one vector from another."""
-            return [v1[i] - v2[i] for i in range(len(v1))]
+        inner_product = GramSchmidt.inner_product
+        subtract_scaled = GramSchmidt.subtract_scaled
 
         orthogonal_set = []
+        norms_squared = []
+
+        def project(w):
+            if modified:
+                for u, nu in zip(orthogonal_set, norms_squared):
+                    w = subtract_scaled(inner_product(w, u) / nu, u, w)
+                return w
+            coeffs = [inner_product(w, u) / nu for u, nu in zip(orthogonal_set, norms_squared)]
+            for c, u in zip(coeffs, orthogonal_set):
+                w = subtract_scaled(c, u, w)
+            return w
 
         for v in S:
-            projection = [0] * len(v)  
-            for u in orthogonal_set:
-                proj_coeff = inner_product(v, u) / inner_product(u, u)
-                projection = vector_subtract(projection, scalar_multiply(proj_coeff, u))
-            u = vector_subtract(v, projection)
-            if all(abs(x) < 1e-10 for x in u):  
+            u = project(list(v))
+            norm_u = inner_product(u, u) ** 0.5
+            if reorthogonalize and orthogonal_set and norm_u < 0.5 * inner_product(v, v) ** 0.5:
+                u = project(u)
+                norm_u = inner_product(u, u) ** 0.5
+            if norm_u < tolerance:
                 raise ValueError("The vectors in S are not linearly independent.")
+            if normalize:
+                u = [x / norm_u for x in u]
+                norm_u = 1.0
             orthogonal_set.append(u)
+            norms_squared.append(norm_u * norm_u)
 
         return orthogonal_set
 
+    @staticmethod
+    def block_gram_schmidt(S, block_size=32, normalize=False, tolerance=1e-10):
+        """
+        Perform blocked Gram-Schmidt orthogonalisation on a set of vectors.
+
+        Each panel of block_size vectors is projected against the basis built so
+        far in two passes, then orthogonalised internally with modified
+        Gram-Schmidt and reorthogonalisation.
+
+        Args:
+        S (list of lists): Set of vectors.
+        block_size (int): The number of vectors projected per panel.
+        normalize (bool): If True, return an orthonormal set.
+        tolerance (float): Norm below which a remainder is treated as zero.
+
+        Returns:
+        list of lists: The orthogonalised set of vectors.
+
+        Raises:
+        ValueError: If the input vectors are not linearly independent.
+        """
+        inner_product = GramSchmidt.inner_product
+        subtract_scaled = GramSchmidt.subtract_scaled
+
+        Q = []
+        scales = []
+
+        for start in range(0, len(S), block_size):
+            panel = [list(v) for v in S[start:start + block_size]]
+            input_norms = [inner_product(v, v) ** 0.5 for v in panel]
+
+            if Q:
+                for _ in range(2):
+                    C = [[inner_product(q, w) for q in Q] for w in panel]
+                    for idx, coeffs in enumerate(C):
+                        w = panel[idx]
+                        for c, q in zip(coeffs, Q):
+                            w = subtract_scaled(c, q, w)
+                        panel[idx] = w
+
+            panel_q = []
+            for w, norm_v in zip(panel, input_norms):
+                for _ in range(2):
+                    for q in panel_q:
+                        w = subtract_scaled(inner_product(w, q), q, w)
+                    norm_w = inner_product(w, w) ** 0.5
+                    if norm_w >= 0.5 * norm_v:
+                        break
+                    norm_v = norm_w
+                if norm_w < tolerance:
+                    raise ValueError("The vectors in S are not linearly independent.")
+                panel_q.append([x / norm_w for x in w])
+                scales.append(norm_w)
+
+            Q.extend(panel_q)
+
+        if normalize:
+            return Q
+        return [[x * scale for x in q] for q, scale in zip(Q, scales)]
+
 
 # Example:
-S = [
-    [1, 1, 0],
-    [1, 0, 1],
-    [0, 1, 1]
-]
-
-try:
-    gram_schmidt = GramSchmidt()
-    orthogonal_vectors = gram_schmidt.gram_schmidt(S)
-
-    print("Orthogonalised set of vectors:")
-    for vector in orthogonal_vectors:
-        print(vector)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    S = [
+        [1, 1, 0],
+        [1, 0, 1],
+        [0, 1, 1]
+    ]
+
+    try:
+        gram_schmidt = GramSchmidt()
+        orthogonal_vectors = gram_schmidt.gram_schmidt(S)
+
+        print("Orthogonalised set of vectors:")
+        for vector in orthogonal_vectors:
+            print(vector)
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -1,3 +1,7 @@
+import math
+import operator
+import sys
+
 class QRFactorization:
     @staticmethod
     def qr_factorization(A):
@@ -63,25 +67,213 @@ class QRFactorization:
 
         return Q_transposed, R
 
+    @staticmethod
+    def householder_qr(A, pivoting=False):
+        """
+        Compute a Householder QR factorization of A with compactly stored reflectors.
+
+        Q is never formed. It is represented by the reflectors H_k = I - tau_k v_k v_k^T,
+        where v_k has an implicit leading 1 and only acts on rows k..m-1.
+
+        Args:
+        A (list of lists): The input m x n matrix.
+        pivoting (bool): If True, use column pivoting so that |R[k][k]| is non-increasing.
+
+        Returns:
+        tuple: V (list of reflector vectors), tau (list of scalars), R (min(m, n) x n
+        upper triangular matrix) and perm (column order, so that A[:, perm] = Q R).
+
+        Raises:
+        ValueError: If the matrix is empty or if rows have inconsistent lengths.
+        """
+        if not A or not A[0]:
+            raise ValueError("The matrix must not be empty.")
+        rows = len(A)
+        cols = len(A[0])
+        if any(len(row) != cols for row in A):
+            raise ValueError("All rows in the matrix must have the same length.")
+
+        columns = [[float(A[i][j]) for i in range(rows)] for j in range(cols)]
+        perm = list(range(cols))
+        steps = min(rows, cols)
+        V = []
+        tau = []
+
+        if pivoting:
+            norms = [math.sqrt(sum(x * x for x in col)) for col in columns]
+            original_norms = norms[:]
+
+        for k in range(steps):
+            if pivoting:
+                p = max(range(k, cols), key=lambda j: norms[j])
+                if p != k:
+                    columns[k], columns[p] = columns[p], columns[k]
+                    perm[k], perm[p] = perm[p], perm[k]
+                    norms[k], norms[p] = norms[p], norms[k]
+                    original_norms[k], original_norms[p] = original_norms[p], original_norms[k]
+
+            x = columns[k][k:]
+            alpha = x[0]
+            norm_x = math.sqrt(sum(v * v for v in x))
+
+            if norm_x == 0 or len(x) == 1:
+                V.append([1.0] + [0.0] * (len(x) - 1))
+                tau.append(0.0)
+                continue
+
+            beta = -math.copysign(norm_x, alpha)
+            scale = 1 / (alpha - beta)
+            v = [1.0] + [value * scale for value in x[1:]]
+            t = (beta - alpha) / beta
+            V.append(v)
+            tau.append(t)
+
+            columns[k][k] = beta
+            for i in range(k + 1, rows):
+                columns[k][i] = 0.0
+
+            for j in range(k + 1, cols):
+                col = columns[j]
+                tail = col[k:]
+                w = t * sum(map(operator.mul, v, tail))
+                if w != 0:
+                    col[k:] = [a - w * b for a, b in zip(tail, v)]
+
+                if pivoting:
+                    head = col[k]
+                    remaining = norms[j] * norms[j] - head * head
+                    if remaining <= (1e-8 * original_norms[j]) ** 2:
+                        remaining = sum(value * value for value in col[k + 1:])
+                        original_norms[j] = math.sqrt(remaining)
+                    norms[j] = math.sqrt(max(remaining, 0.0))
+
+        R = [[columns[j][i] if j >= i else 0.0 for j in range(cols)] for i in range(steps)]
+        return V, tau, R, perm
+
+    @staticmethod
+    def apply_q(V, tau, B, transpose=False):
+        """
+        Apply Q or Q^T from householder_qr to a vector or matrix without forming Q.
+
+        Args:
+        V (list): The reflector vectors from householder_qr.
+        tau (list): The reflector scalars from householder_qr.
+        B (list or list of lists): A vector of length m, or an m x p matrix.
+        transpose (bool): If True, apply Q^T instead of Q.
+
+        Returns:
+        list or list of lists: The product, with the same shape as B.
+        """
+        is_vector = not isinstance(B[0], (list, tuple))
+        rows = len(B)
+        columns = [list(B)] if is_vector else [[B[i][j] for i in range(rows)] for j in range(len(B[0]))]
+
+        order = range(len(V)) if transpose else range(len(V) - 1, -1, -1)
+        for col in columns:
+            for k in order:
+                t = tau[k]
+                if t == 0:
+                    continue
+                v = V[k]
+                tail = col[k:]
+                w = t * sum(map(operator.mul, v, tail))
+                if w != 0:
+                    col[k:] = [a - w * b for a, b in zip(tail, v)]
+
+        if is_vector:
+            return columns[0]
+        return [[col[i] for col in columns] for i in range(rows)]
+
+    @staticmethod
+    def form_q(V, tau, rows, economy=True):
+        """
+        Form Q explicitly from the reflectors of householder_qr.
+
+        Args:
+        V (list): The reflector vectors from householder_qr.
+        tau (list): The reflector scalars from householder_qr.
+        rows (int): The number of rows m of the factored matrix.
+        economy (bool): If True, return the thin m x k factor, otherwise the full m x m Q.
+
+        Returns:
+        list of lists: The matrix Q.
+        """
+        width = len(V) if economy else rows
+        identity = [[1.0 if i == j else 0.0 for j in range(width)] for i in range(rows)]
+        return QRFactorization.apply_q(V, tau, identity)
+
+    @staticmethod
+    def qr_householder(A, mode="economy", pivoting=False):
+        """
+        Perform QR factorization of A using Householder reflections.
+
+        Args:
+        A (list of lists): The input m x n matrix.
+        mode (str): "economy" for the thin Q, "full" for the square Q, or "r" to skip Q.
+        pivoting (bool): If True, use column pivoting and also return the permutation.
+
+        Returns:
+        tuple: Q and R (Q is None in mode "r"), followed by perm when pivoting.
+
+        Raises:
+        ValueError: If the mode is unknown or the matrix is malformed.
+        """
+        if mode not in ("economy", "full", "r"):
+            raise ValueError("Mode must be 'economy', 'full' or 'r'.")
+
+        V, tau, R, perm = QRFactorization.householder_qr(A, pivoting)
+        rows = len(A)
+        cols = len(A[0])
+
+        Q = None
+        if mode != "r":
+            Q = QRFactorization.form_q(V, tau, rows, economy=(mode == "economy"))
+            if mode == "full" and rows > cols:
+                R = R + [[0.0] * cols for _ in range(rows - cols)]
+
+        if pivoting:
+            return Q, R, perm
+        return Q, R
+
+    @staticmethod
+    def rank_revealing_qr(A, tolerance=None):
+        """
+        Compute a column-pivoted Householder QR and the numerical rank of A.
+
+        Args:
+        A (list of lists): The input m x n matrix.
+        tolerance (float, optional): Threshold on |R[k][k]|; defaults to max(m, n) * eps * |R[0][0]|.
+
+        Returns:
+        tuple: V, tau, R, perm (as in householder_qr) and the numerical rank.
+        """
+        V, tau, R, perm = QRFactorization.householder_qr(A, pivoting=True)
+        if tolerance is None:
+            tolerance = max(len(A), len(A[0])) * sys.float_info.epsilon * (abs(R[0][0]) if R else 0.0)
+
+        rank = sum(1 for k in range(len(R)) if abs(R[k][k]) > tolerance)
+        return V, tau, R, perm, rank
+
 
 # Example:
-A = [
-    [1, 1, 0],
-    [1, 0, 1],
-    [0, 1, 1]
-]
-
-try:
-    qr = QRFactorization()
-    Q, R = qr.qr_factorization(A)
-
-    print("Matrix Q (Orthogonal):")
-    for row in Q:
-        print(row)
-
-    print("\nMatrix R (Upper Triangular):")
-    for row in R:
-        print(row)
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [1, 1, 0],
+        [1, 0, 1],
+        [0, 1, 1]
+    ]
+
+    try:
+        qr = QRFactorization()
+        Q, R = qr.qr_factorization(A)
+
+        print("Matrix Q (Orthogonal):")
+        for row in Q:
+            print(row)
+
+        print("\nMatrix R (Upper Triangular):")
+        for row in R:
+            print(row)
+
+    except ValueError as e:
+        print("\nError:", e)
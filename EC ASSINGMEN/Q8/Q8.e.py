@@ -1,56 +1,80 @@
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class PseudoInverse:
     @staticmethod
-    def pseudo_inverse(S):
+    def svd_decomposition(matrix):
         """
-        Compute the Moore-Penrose pseudoinverse of a matrix using SVD.
+        Compute the thin SVD of a matrix with MatrixDecompositions.svd.
 
         Args:
-        S (list of lists): The input matrix.
+        matrix (list of lists): The input m x n matrix.
 
         Returns:
-        list of lists: The pseudoinverse of the matrix.
+        tuple: The columns of U, the singular values (descending) and the columns of V,
+        with min(m, n) entries each.
         """
-        def transpose(matrix):
-            """Transpose a matrix."""
-            return [[matrix[j][i] for j in range(len(matrix))] for i in range(len(matrix[0]))]
+        U, Sigma, V = linalg.q10_camera.MatrixDecompositions.svd(matrix, mode="thin")
+        sigma = [Sigma[k][k] for k in range(len(Sigma))]
+        return [[row[k] for row in U] for k in range(len(sigma))], sigma, V
 
-        def matrix_multiply(A, B):
-            """Multiply two matrices."""
-            return [[sum(A[i][k] * B[k][j] for k in range(len(A[0]))) for j in range(len(B[0]))] for i in range(len(A))]
+    @staticmethod
+    def pseudo_inverse(S, rcond=None, cutoff=None):
+        """
+        Compute the Moore-Penrose pseudoinverse of a matrix using SVD.
 
-        def svd_decomposition(matrix):
-            """Perform Singular Value Decomposition (placeholder for actual SVD implementation)."""
-            raise NotImplementedError("SVD decomposition needs to be implemented or imported.")
+        Args:
+        S (list of lists): The input matrix.
+        rcond (float, optional): Singular values below rcond * max(sigma) are treated
+        as zero; defaults to max(m, n) * eps.
+        cutoff (float, optional): Absolute threshold; singular values at or below it are
+        treated as zero. Overrides rcond when given.
 
-      
-        U, Sigma, V_T = svd_decomposition(S)
+        Returns:
+        list of lists: The pseudoinverse of the matrix.
+        """
+        U, sigma, V = PseudoInverse.svd_decomposition(S)
 
-       
-        Sigma_plus = [[0] * len(U) for _ in range(len(V_T))]
-        for i in range(len(Sigma)):
-            if Sigma[i][i] != 0:
-                Sigma_plus[i][i] = 1 / Sigma[i][i]
+        if cutoff is None:
+            if rcond is None:
+                rcond = max(len(S), len(S[0])) * sys.float_info.epsilon
+            cutoff = rcond * (sigma[0] if sigma else 0.0)
 
-      
-        V = transpose(V_T)
-        U_T = transpose(U)
-        pseudo_inv = matrix_multiply(matrix_multiply(V, Sigma_plus), U_T)
+        rows = len(S)
+        cols = len(S[0])
+        pseudo_inv = [[0.0] * rows for _ in range(cols)]
+        for u, value, v in zip(U, sigma, V):
+            if value <= cutoff:
+                break
+            for i in range(cols):
+                coeff = v[i] / value
+                if coeff != 0:
+                    row = pseudo_inv[i]
+                    pseudo_inv[i] = [a + coeff * b for a, b in zip(row, u)]
 
         return pseudo_inv
 
 
 # Example:
-S = [
-    [1, 2, 3],
-    [4, 5, 6],
-    [7, 8, 9]
-]
+if __name__ == "__main__":
+    S = [
+        [1, 2, 3],
+        [4, 5, 6],
+        [7, 8, 9]
+    ]
 
-try:
-    pseudo_inv = PseudoInverse.pseudo_inverse(S)
-    print("Moore-Penrose Pseudoinverse of the matrix:")
-    for row in pseudo_inv:
-        print(row)
+    try:
+        pseudo_inv = PseudoInverse.pseudo_inverse(S)
+        print("Moore-Penrose Pseudoinverse of the matrix:")
+        for row in pseudo_inv:
+            print(row)
 
-except NotImplementedError as e:
-    print("\nError:", e)
+    except NotImplementedError as e:
+        print("\nError:", e)
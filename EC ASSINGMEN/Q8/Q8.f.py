@@ -1,3 +1,15 @@
+import math
+import operator
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class LeastSquares:
     @staticmethod
     def transpose(matrix):
@@ -32,6 +44,243 @@ class LeastSquares:
 
         return [row[n:] for row in augmented]
 
+    @staticmethod
+    def triangular_condition(R):
+        """
+        Estimate the 1-norm condition number of an upper triangular matrix in O(n^2).
+
+        Args:
+        R (list of lists): The upper triangular factor, by rows.
+
+        Returns:
+        float: An estimate of ||R||_1 ||R^-1||_1 (inf if R is singular).
+        """
+        PLUSolver = linalg.q4_f.PLUSolver
+        n = len(R)
+        if any(R[i][i] == 0 for i in range(n)):
+            return math.inf
+
+        norm = max((sum(abs(R[i][j]) for i in range(j + 1)) for j in range(n)), default=0.0)
+        return norm * PLUSolver.inverse_norm_estimate(
+            lambda b: PLUSolver.triangular_solve(R, b, lower=False),
+            lambda b: PLUSolver.triangular_solve(R, b, lower=False, trans="C"), n)
+
+    @staticmethod
+    def cholesky_normal_solve(columns, B_columns):
+        """
+        Solve the normal equations A^T A X = A^T B by Cholesky factorization.
+
+        Args:
+        columns (list of lists): The columns of A.
+        B_columns (list of lists): The columns of B.
+
+        Returns:
+        tuple: The columns of X and the condition estimate of R = L^T, whose singular
+        values are those of A, or None if A^T A is not numerically positive definite.
+        """
+        n = len(columns)
+        G = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                G[i][j] = math.fsum(map(operator.mul, columns[i], columns[j]))
+
+        L = [[0.0] * n for _ in range(n)]
+        for j in range(n):
+            value = G[j][j] - sum(L[j][k] * L[j][k] for k in range(j))
+            if value <= G[j][j] * 1e-14 or value <= 0:
+                return None
+            L[j][j] = value ** 0.5
+            for i in range(j + 1, n):
+                L[i][j] = (G[i][j] - sum(L[i][k] * L[j][k] for k in range(j))) / L[j][j]
+
+        X_columns = []
+        for b in B_columns:
+            y = [math.fsum(map(operator.mul, col, b)) for col in columns]
+            for i in range(n):
+                y[i] = (y[i] - sum(L[i][k] * y[k] for k in range(i))) / L[i][i]
+            for i in range(n - 1, -1, -1):
+                y[i] = (y[i] - sum(L[k][i] * y[k] for k in range(i + 1, n))) / L[i][i]
+            X_columns.append(y)
+
+        R = [[L[j][i] for j in range(n)] for i in range(n)]
+        return X_columns, LeastSquares.triangular_condition(R)
+
+    @staticmethod
+    def qr_solve(columns, B_columns, rcond, condition=False):
+        """
+        Solve a full-rank least squares problem by column-pivoted Householder QR.
+
+        The factorization is QRFactorization.householder_qr; Q^T B is applied from
+        its reflectors without forming Q.
+
+        Args:
+        columns (list of lists): The columns of A.
+        B_columns (list of lists): The columns of B.
+        rcond (float): Relative threshold on |R[k][k]| below which A is rank deficient.
+        condition (bool): If True, also return the condition estimate of R.
+
+        Returns:
+        tuple: The columns of X and the rank of A (and the condition estimate if
+        requested), or None if A is rank deficient.
+        """
+        rows = len(columns[0])
+        n = len(columns)
+        if rows < n:
+            return None
+
+        QR = linalg.q8_d.QRFactorization
+        A = [[col[i] for col in columns] for i in range(rows)]
+        V, tau, R, perm = QR.householder_qr(A, pivoting=True)
+        if R[n - 1][n - 1] == 0 or abs(R[n - 1][n - 1]) <= rcond * abs(R[0][0]):
+            return None
+
+        Y = QR.apply_q(V, tau, [[b[i] for b in B_columns] for i in range(rows)], transpose=True)
+        Z = linalg.q4_f.PLUSolver.triangular_solve(R, Y[:n], lower=False)
+        X_columns = []
+        for c in range(len(B_columns)):
+            x = [0.0] * n
+            for i, p in enumerate(perm):
+                x[p] = Z[i][c]
+            X_columns.append(x)
+
+        if condition:
+            return X_columns, n, LeastSquares.triangular_condition(R)
+        return X_columns, n
+
+    @staticmethod
+    def svd_solve(columns, B_columns, rcond, condition=False):
+        """
+        Compute the minimum-norm least squares solution through the SVD of A.
+
+        The SVD is the thin one-sided Jacobi SVD of MatrixDecompositions.svd.
+
+        Args:
+        columns (list of lists): The columns of A.
+        B_columns (list of lists): The columns of B.
+        rcond (float): Singular values below rcond * max(sigma) are treated as zero.
+        condition (bool): If True, also return sigma_max / sigma_min (inf if A is
+        rank deficient).
+
+        Returns:
+        tuple: The columns of X and the numerical rank of A (and the condition
+        number if requested).
+        """
+        rows = len(columns[0])
+        n = len(columns)
+        A = [[col[i] for col in columns] for i in range(rows)]
+        U, Sigma, V = linalg.q10_camera.MatrixDecompositions.svd(A, mode="thin")
+        sigma = [Sigma[k][k] for k in range(len(Sigma))]
+        cutoff = rcond * (sigma[0] if sigma else 0.0)
+        rank = sum(1 for value in sigma if value > cutoff)
+
+        X_columns = []
+        for b in B_columns:
+            x = [0.0] * n
+            for k in range(rank):
+                coeff = sum(row[k] * value for row, value in zip(U, b)) / sigma[k]
+                x = [a + coeff * v for a, v in zip(x, V[k])]
+            X_columns.append(x)
+
+        if condition:
+            return X_columns, rank, sigma[0] / sigma[-1] if rank == n else math.inf
+        return X_columns, rank
+
+    @staticmethod
+    def lstsq(A, B, weights=None, method="auto", rcond=None, condition=False):
+        """
+        Solve the least squares problem min ||W^(1/2) (A X - B)|| for one or more right-hand sides.
+
+        With method "auto", the normal equations are solved by Cholesky only when the
+        condition estimate of the Cholesky factor is at most rcond^(-1/4), so that the
+        squared condition number of the normal equations costs few digits; otherwise
+        pivoted QR is used, and the SVD when A is rank deficient.
+
+        Args:
+        A (list of lists): The m x n coefficient matrix.
+        B (list or list of lists): A vector of length m, or an m x p matrix of right-hand sides.
+        weights (list, optional): Non-negative weight for each of the m equations.
+        method (str): One of "auto", "cholesky", "qr" or "svd".
+        rcond (float, optional): Relative rank threshold; defaults to max(m, n) * eps.
+        condition (bool): If True, also return an estimate of the condition number of
+        (the weighted) A: the 1-norm estimate for the triangular factor R of the
+        Cholesky or QR path, or sigma_max / sigma_min on the SVD path (inf if rank
+        deficient).
+
+        Returns:
+        tuple: The solution X (same shape as B), the residual norm of each right-hand
+        side, and the numerical rank of A, followed by the condition estimate if
+        requested.
+
+        Raises:
+        ValueError: If the dimensions do not match, the method is unknown, an entry
+        is complex, or the requested factorization fails.
+        """
+        if method not in ("auto", "cholesky", "qr", "svd"):
+            raise ValueError("Method must be 'auto', 'cholesky', 'qr' or 'svd'.")
+
+        rows = len(A)
+        cols = len(A[0])
+        if len(B) != rows:
+            raise ValueError("A and B must have the same number of rows.")
+        is_vector = not isinstance(B[0], (list, tuple))
+        entries = [x for row in A for x in row] + (list(B) if is_vector else [x for row in B for x in row])
+        if any(isinstance(x, complex) for x in entries + list(weights or [])):
+            raise ValueError("Least squares supports real matrices only.")
+
+        if weights is None:
+            scale = [1.0] * rows
+        else:
+            if len(weights) != rows or any(w < 0 for w in weights):
+                raise ValueError("Weights must be non-negative, one per equation.")
+            scale = [w ** 0.5 for w in weights]
+
+        columns = [[A[i][j] * scale[i] for i in range(rows)] for j in range(cols)]
+        if is_vector:
+            B_columns = [[B[i] * scale[i] for i in range(rows)]]
+        else:
+            B_columns = [[B[i][j] * scale[i] for i in range(rows)] for j in range(len(B[0]))]
+
+        if rcond is None:
+            rcond = max(rows, cols) * sys.float_info.epsilon
+
+        result = None
+        estimate = None
+        if method in ("auto", "cholesky"):
+            solved = LeastSquares.cholesky_normal_solve(columns, B_columns)
+            if solved is not None and (method == "cholesky" or solved[1] <= rcond ** -0.25):
+                result = (solved[0], cols)
+                estimate = solved[1]
+            elif method == "cholesky":
+                raise ValueError("A^T A is not positive definite; use method 'qr' or 'svd'.")
+
+        if result is None and method in ("auto", "qr"):
+            solved = LeastSquares.qr_solve(columns, B_columns, rcond, condition)
+            if solved is None and method == "qr":
+                raise ValueError("A is rank deficient; use method 'svd'.")
+            if solved is not None:
+                result = solved[:2]
+                estimate = solved[2] if condition else None
+
+        if result is None:
+            solved = LeastSquares.svd_solve(columns, B_columns, rcond, condition)
+            result = solved[:2]
+            estimate = solved[2] if condition else None
+
+        X_columns, rank = result
+        residual_norms = []
+        for x, b in zip(X_columns, B_columns):
+            residual = b[:]
+            for coeff, col in zip(x, columns):
+                if coeff != 0:
+                    residual = [r - coeff * a for r, a in zip(residual, col)]
+            residual_norms.append(math.sqrt(math.fsum(r * r for r in residual)))
+
+        extra = (estimate,) if condition else ()
+        if is_vector:
+            return (X_columns[0], residual_norms[0], rank) + extra
+        X = [[X_columns[j][i] for j in range(len(X_columns))] for i in range(cols)]
+        return (X, residual_norms, rank) + extra
+
     @staticmethod
     def least_squares(A, b):
         """
@@ -44,32 +293,194 @@ class LeastSquares:
         Returns:
         list: Least squares solution vector X.
         """
-        A_T = LeastSquares.transpose(A)
-        A_T_A = LeastSquares.matrix_multiply(A_T, A)
-        A_T_b = LeastSquares.matrix_multiply(A_T, [[val] for val in b])
+        X, _, _ = LeastSquares.lstsq(A, b)
+        return X
+
+
+class RecursiveLeastSquares:
+    def __init__(self, n, forgetting_factor=1.0, regularization=0.0, A=None, b=None):
+        """
+        Initialize an incremental least squares solver for n unknowns.
+
+        The solver keeps the triangular factor R of the (weighted) design matrix
+        and Q^T b, so each row update and each solve costs O(n^2).
+
+        Args:
+        n (int): The number of unknowns.
+        forgetting_factor (float): Factor in (0, 1] applied to past rows on every append.
+        regularization (float): Optional ridge term; R starts as sqrt(regularization) * I.
+        A (list of lists, optional): Initial rows of the coefficient matrix.
+        b (list, optional): Initial right-hand side values, one per row of A.
+
+        Raises:
+        ValueError: If the forgetting factor or regularization is out of range.
+        """
+        if not 0 < forgetting_factor <= 1:
+            raise ValueError("The forgetting factor must be in (0, 1].")
+        if regularization < 0:
+            raise ValueError("The regularization must be non-negative.")
+
+        self.n = n
+        self.forgetting_factor = forgetting_factor
+        root = regularization ** 0.5
+        self.R = [[root if i == j else 0.0 for j in range(n)] for i in range(n)]
+        self.z = [0.0] * n
+        self.residual_sum_of_squares = 0.0
+        self.num_rows = 0
+        self.num_appends = 0
+
+        if A is not None:
+            self.append_block(A, b)
+
+    def append(self, row, value):
+        """
+        Add one equation row . x = value using Givens rotations.
+
+        Args:
+        row (list): The new row of A, of length n.
+        value (float): The matching entry of b.
+
+        Returns:
+        int: The index of the row, needed to remove it when rows are forgotten.
+        """
+        if len(row) != self.n:
+            raise ValueError(f"The row must have {self.n} entries.")
+
+        R, z = self.R, self.z
+        if self.forgetting_factor != 1:
+            scale = self.forgetting_factor ** 0.5
+            for i in range(self.n):
+                R[i][i:] = [scale * a for a in R[i][i:]]
+                z[i] *= scale
+            self.residual_sum_of_squares *= self.forgetting_factor
+
+        x = [float(a) for a in row]
+        y = float(value)
+        for k in range(self.n):
+            if x[k] == 0:
+                continue
+            Rk = R[k]
+            r = math.hypot(Rk[k], x[k])
+            c = Rk[k] / r
+            s = x[k] / r
+            Rk[k] = r
+            for j in range(k + 1, self.n):
+                Rk[j], x[j] = c * Rk[j] + s * x[j], c * x[j] - s * Rk[j]
+            z[k], y = c * z[k] + s * y, c * y - s * z[k]
+
+        self.residual_sum_of_squares += y * y
+        self.num_rows += 1
+        self.num_appends += 1
+        return self.num_appends - 1
+
+    def append_block(self, rows, values):
+        """
+        Add a block of equations.
+
+        Args:
+        rows (list of lists): The new rows of A.
+        values (list): The matching entries of b.
+
+        Returns:
+        list: The index of each row, as returned by append.
+        """
+        if len(rows) != len(values):
+            raise ValueError("The number of rows and values must match.")
+        return [self.append(row, value) for row, value in zip(rows, values)]
 
-       
-        A_T_A_inv = LeastSquares.inverse(A_T_A)
+    def remove(self, row, value, index=None):
+        """
+        Remove a previously added equation using hyperbolic rotations.
 
-     
-        X = LeastSquares.matrix_multiply(A_T_A_inv, A_T_b)
+        With a forgetting factor below 1, a row appended age appends ago now carries
+        weight forgetting_factor**age, so it is downdated scaled by the square root
+        of that weight; its index tells how old it is.
 
-        return [x[0] for x in X]  
+        Args:
+        row (list): The row of A to remove, of length n.
+        value (float): The matching entry of b.
+        index (int, optional): The index returned by append for this row; required
+        when the forgetting factor is below 1.
+
+        Raises:
+        ValueError: If the index is missing or invalid, or removing the row would
+        leave the system rank deficient.
+        """
+        if len(row) != self.n:
+            raise ValueError(f"The row must have {self.n} entries.")
+
+        scale = 1.0
+        if self.forgetting_factor != 1:
+            if index is None:
+                raise ValueError("Removing a row with a forgetting factor needs the index returned by append.")
+            if not 0 <= index < self.num_appends:
+                raise ValueError("The row index does not refer to an appended row.")
+            scale = self.forgetting_factor ** ((self.num_appends - 1 - index) / 2)
+
+        R, z = self.R, self.z
+        x = [scale * float(a) for a in row]
+        y = scale * float(value)
+        for k in range(self.n):
+            if x[k] == 0:
+                continue
+            Rk = R[k]
+            rho_squared = Rk[k] * Rk[k] - x[k] * x[k]
+            if rho_squared <= 0:
+                raise ValueError("Removing this row would make the system rank deficient.")
+            rho = rho_squared ** 0.5
+            c = rho / Rk[k]
+            s = x[k] / Rk[k]
+            Rk[k] = rho
+            for j in range(k + 1, self.n):
+                Rk[j] = (Rk[j] - s * x[j]) / c
+                x[j] = c * x[j] - s * Rk[j]
+            z[k] = (z[k] - s * y) / c
+            y = c * y - s * z[k]
+
+        self.residual_sum_of_squares = max(self.residual_sum_of_squares - y * y, 0.0)
+        self.num_rows -= 1
+
+    def solution(self):
+        """
+        Return the current least squares solution by back substitution.
+
+        Returns:
+        list: The solution vector x.
+
+        Raises:
+        ValueError: If the rows seen so far do not determine x.
+        """
+        R, n = self.R, self.n
+        x = [0.0] * n
+        for i in range(n - 1, -1, -1):
+            if R[i][i] == 0:
+                raise ValueError("Not enough independent rows to determine the solution.")
+            x[i] = (self.z[i] - sum(R[i][j] * x[j] for j in range(i + 1, n))) / R[i][i]
+        return x
+
+    def residual_norm(self):
+        """Return the (weighted) residual norm of the current solution."""
+        return self.residual_sum_of_squares ** 0.5
 
 
 # Example:
-A = [
-    [1, 1],
-    [1, 2],
-    [1, 3]
-]
-b = [1, 2, 2]
+if __name__ == "__main__":
+    A = [
+        [1, 1],
+        [1, 2],
+        [1, 3]
+    ]
+    b = [1, 2, 2]
 
-try:
-    solver = LeastSquares()
-    solution = solver.least_squares(A, b)
-    print("Least squares solution:")
-    print(solution)
+    try:
+        solver = LeastSquares()
+        solution = solver.least_squares(A, b)
+        print("Least squares solution:")
+        print(solution)
+
+        for method in ("cholesky", "qr", "svd"):
+            x, residual, rank, kappa = solver.lstsq(A, b, method=method, condition=True)
+            print(f"Condition estimate ({method}): {kappa:.4f}")
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
@@ -1,67 +1,665 @@
+import argparse
+import array
 import cmath
+import collections
+import math
+import multiprocessing
+import sys
+import time
 
 class PolynomialRoots:
     @staticmethod
-    def poly_roots(coefficients, max_iter=100, tolerance=1e-10):
+    def normalize(coefficients):
         """
-        Find all roots of a polynomial using the Aberth method.
+        Strip leading zeros and make a polynomial monic.
+
+        Args:
+        coefficients (list of complex): Coefficients, highest degree first.
+
+        Returns:
+        list: The monic coefficients.
+
+        Raises:
+        ValueError: If the polynomial degree is less than 1.
+        """
+        start = 0
+        while start < len(coefficients) and coefficients[start] == 0:
+            start += 1
+        coefficients = coefficients[start:]
+        if len(coefficients) < 2:
+            raise ValueError("The polynomial degree must be at least 1.")
+        lead = coefficients[0]
+        return [complex(c) / lead for c in coefficients]
+
+    @staticmethod
+    def cauchy_bound(coefficients):
+        """
+        Compute the Cauchy bound: the positive root of x^d - sum |c_k| x^(d-k).
+
+        Every root of the polynomial lies in the disc of this radius.
+
+        Args:
+        coefficients (list): Monic coefficients, highest degree first.
+
+        Returns:
+        float: The Cauchy bound.
+        """
+        magnitudes = [abs(c) for c in coefficients[1:]]
+        if not any(magnitudes):
+            return 0.0
+        x = 2 * max(m ** (1 / (k + 1)) for k, m in enumerate(magnitudes))
+        for _ in range(50):
+            q = 1.0
+            dq = 0.0
+            for m in magnitudes:
+                dq = dq * x + q
+                q = q * x - m
+            if dq <= 0 or q <= 0:
+                break
+            step = q / dq
+            x -= step
+            if step <= 1e-12 * x:
+                break
+        return x
+
+    @staticmethod
+    def initial_guesses(coefficients, angles):
+        """
+        Place starting points on the circle given by the Cauchy bound of the roots.
+
+        Args:
+        coefficients (list): Monic coefficients, highest degree first.
+        angles (list): Unit complex numbers, one per root.
+
+        Returns:
+        list: The starting points.
+        """
+        radius = PolynomialRoots.cauchy_bound(coefficients) or 1.0
+        return [radius * a for a in angles]
+
+    @staticmethod
+    def aberth(coefficients, roots, max_iter, tolerance):
+        """
+        Refine root estimates with the Aberth-Ehrlich iteration.
+
+        Each root stops moving once its own correction is below tolerance or its
+        residual is at the rounding level of the Horner evaluation, so converged
+        roots cost nothing in later sweeps.
+
+        Args:
+        coefficients (list): Monic coefficients, highest degree first.
+        roots (list): Initial estimates; refined in place.
+        max_iter (int): Maximum number of sweeps.
+        tolerance (float): Convergence tolerance, relative to max(1, |root|).
+
+        Returns:
+        bool: True if every root converged.
+        """
+        degree = len(roots)
+        active = list(range(degree))
+        tail = coefficients[1:]
+
+        for _ in range(max_iter):
+            still_active = []
+            for i in active:
+                z = roots[i]
+                p = 1 + 0j
+                dp = 0j
+                bound = 1.0
+                magnitude = abs(z)
+                for c in tail:
+                    dp = dp * z + p
+                    p = p * z + c
+                    bound = bound * magnitude + abs(c)
+                if p == 0:
+                    continue
+                at_rounding_level = abs(p) <= 4 * sys.float_info.epsilon * bound
+
+                newton = p / dp if dp != 0 else p
+                repulsion = 0j
+                for j in range(degree):
+                    if j != i:
+                        diff = z - roots[j]
+                        if diff != 0:
+                            repulsion += 1 / diff
+                step = newton / (1 - newton * repulsion)
+                roots[i] = z - step
+
+                if not (at_rounding_level or abs(step) <= tolerance * max(1.0, magnitude)):
+                    still_active.append(i)
+            active = still_active
+            if not active:
+                return True
+
+        return False
+
+    @staticmethod
+    def balance(a, passes=20):
+        """
+        Balance a square matrix in place by diagonal scaling with powers of 2.
+
+        Args:
+        a (list of lists): The matrix to balance; overwritten.
+        passes (int): Maximum number of balancing sweeps.
+
+        Returns:
+        list of lists: The balanced matrix.
+        """
+        n = len(a)
+        for _ in range(passes):
+            changed = False
+            for i in range(n):
+                column = sum(abs(a[j][i]) for j in range(n) if j != i)
+                row = sum(abs(a[i][j]) for j in range(n) if j != i)
+                if column == 0 or row == 0:
+                    continue
+                f = 1.0
+                total = column + row
+                while column < row / 2:
+                    column *= 2
+                    row /= 2
+                    f *= 2
+                while column >= row * 2:
+                    column /= 2
+                    row *= 2
+                    f /= 2
+                if column + row < 0.95 * total:
+                    changed = True
+                    for j in range(n):
+                        a[i][j] /= f
+                        a[j][i] *= f
+            if not changed:
+                break
+        return a
+
+    @staticmethod
+    def hessenberg_eigenvalues(H, max_iter=60):
+        """
+        Compute the eigenvalues of an upper Hessenberg matrix with shifted QR.
+
+        Uses complex Givens rotations and Wilkinson shifts, so real and complex
+        matrices are both supported. Only the active block is updated.
+
+        Args:
+        H (list of lists): An upper Hessenberg matrix; it is overwritten.
+        max_iter (int): Maximum number of QR steps per eigenvalue.
+
+        Returns:
+        list: The complex eigenvalues.
+
+        Raises:
+        ValueError: If the iteration does not converge.
+        """
+        a = H
+        eps = sys.float_info.epsilon
+        values = []
+        hi = len(a) - 1
+        its = 0
+
+        while hi >= 0:
+            l = hi
+            while l > 0 and abs(a[l][l - 1]) > eps * (abs(a[l - 1][l - 1]) + abs(a[l][l])):
+                l -= 1
+            if l == hi:
+                values.append(a[hi][hi])
+                hi -= 1
+                its = 0
+                continue
+
+            its += 1
+            if its > max_iter:
+                raise ValueError("The Hessenberg QR iteration did not converge.")
+
+            x, y = a[hi - 1][hi - 1], a[hi - 1][hi]
+            z, w = a[hi][hi - 1], a[hi][hi]
+            half_trace = (x + w) / 2
+            disc = cmath.sqrt(half_trace * half_trace - (x * w - y * z))
+            mu1, mu2 = half_trace + disc, half_trace - disc
+            mu = mu1 if abs(mu1 - w) < abs(mu2 - w) else mu2
+            if its % 11 == 0:
+                mu = w + abs(z) * cmath.exp(1j * its)
+
+            for k in range(l, hi + 1):
+                a[k][k] -= mu
+            rotations = []
+            for k in range(l, hi):
+                p, q = a[k][k], a[k + 1][k]
+                r = math.hypot(abs(p), abs(q))
+                c, s = (p / r, q / r) if r != 0 else (1.0, 0.0)
+                cc, sc = c.conjugate(), s.conjugate()
+                row_k, row_k1 = a[k], a[k + 1]
+                for j in range(k, hi + 1):
+                    u, v = row_k[j], row_k1[j]
+                    row_k[j] = cc * u + sc * v
+                    row_k1[j] = c * v - s * u
+                rotations.append((c, s))
+            for k, (c, s) in enumerate(rotations, start=l):
+                cc, sc = c.conjugate(), s.conjugate()
+                for i in range(l, min(k + 2, hi) + 1):
+                    row = a[i]
+                    u, v = row[k], row[k + 1]
+                    row[k] = u * c + v * s
+                    row[k + 1] = v * cc - u * sc
+            for k in range(l, hi + 1):
+                a[k][k] += mu
+
+        return values[::-1]
+
+    @staticmethod
+    def newton_polish(coefficients, roots, steps=3):
+        """
+        Refine roots with a few Newton steps, keeping a step only if the residual drops.
+
+        Args:
+        coefficients (list): Monic coefficients, highest degree first.
+        roots (list): Root estimates; refined in place.
+        steps (int): Maximum Newton steps per root.
+
+        Returns:
+        list: The refined roots.
+        """
+        for i, z in enumerate(roots):
+            for _ in range(steps):
+                p = 1 + 0j
+                dp = 0j
+                for c in coefficients[1:]:
+                    dp = dp * z + p
+                    p = p * z + c
+                if p == 0 or dp == 0:
+                    break
+                candidate = z - p / dp
+                q = 1 + 0j
+                for c in coefficients[1:]:
+                    q = q * candidate + c
+                if abs(q) >= abs(p):
+                    break
+                z = candidate
+            roots[i] = z
+        return roots
+
+    @staticmethod
+    def companion_roots(coefficients, polish=True):
+        """
+        Find all roots of a polynomial as the eigenvalues of its companion matrix.
+
+        The companion matrix is already upper Hessenberg. It is balanced and then
+        reduced by shifted QR, for a predictable O(d^3) cost.
+
+        Args:
+        coefficients (list of complex): Coefficients, highest degree first.
+        polish (bool): If True, refine the roots with Newton steps on the polynomial.
+
+        Returns:
+        list: Complex roots of the polynomial.
+        """
+        coefficients = PolynomialRoots.normalize(coefficients)
+        degree = len(coefficients) - 1
+        companion = [[0j] * degree for _ in range(degree)]
+        companion[0] = [-c for c in coefficients[1:]]
+        for i in range(1, degree):
+            companion[i][i - 1] = 1 + 0j
+
+        PolynomialRoots.balance(companion)
+        roots = PolynomialRoots.hessenberg_eigenvalues(companion)
+        if polish:
+            PolynomialRoots.newton_polish(coefficients, roots)
+        return roots
+
+    @staticmethod
+    def solve(coefficients, angles, max_iter, tolerance, method, polish):
+        """
+        Find the roots of one polynomial with the requested method.
+
+        Args:
+        coefficients (list): Coefficients, highest degree first.
+        angles (list or None): Shared starting directions for Aberth, or None.
+        max_iter (int): Maximum number of Aberth iterations.
+        tolerance (float): Aberth convergence tolerance.
+        method (str): "aberth", "companion" or "auto" (Aberth, then companion if it stalls).
+        polish (bool): Newton-polish companion roots.
+
+        Returns:
+        list: The roots, or None if Aberth did not converge in "aberth" mode.
+        """
+        if method not in ("aberth", "companion", "auto"):
+            raise ValueError("Method must be 'aberth', 'companion' or 'auto'.")
+        if method == "companion":
+            return PolynomialRoots.companion_roots(coefficients, polish)
+
+        monic = PolynomialRoots.normalize(coefficients)
+        degree = len(monic) - 1
+        if angles is None or len(angles) != degree:
+            angles = [cmath.exp(1j * (2 * cmath.pi * k / degree + 0.4)) for k in range(degree)]
+        roots = PolynomialRoots.initial_guesses(monic, angles)
+        if PolynomialRoots.aberth(monic, roots, max_iter, tolerance):
+            return roots
+        if method == "auto":
+            return PolynomialRoots.companion_roots(monic, polish)
+        return None
+
+    @staticmethod
+    def poly_roots(coefficients, max_iter=100, tolerance=1e-10, method="aberth", polish=True):
+        """
+        Find all roots of a polynomial using the Aberth method or the companion matrix.
 
         Args:
         coefficients (list of complex): Coefficients of the polynomial.
         max_iter (int): Maximum number of iterations.
         tolerance (float): Convergence tolerance.
+        method (str): "aberth", "companion" or "auto" (fall back to the companion
+        matrix when Aberth does not converge).
+        polish (bool): Newton-polish roots found from the companion matrix.
 
         Returns:
         list: Complex roots of the polynomial.
         """
-        degree = len(coefficients) - 1
-        if degree <= 0:
-            raise ValueError("The polynomial degree must be at least 1.")
+        roots = PolynomialRoots.solve(coefficients, None, max_iter, tolerance, method, polish)
+        if roots is None:
+            raise ValueError("The method did not converge within the maximum number of iterations.")
+        return roots
+
+    @staticmethod
+    def poly_roots_batch(polynomials, max_iter=100, tolerance=1e-10, method="aberth", polish=True):
+        """
+        Find the roots of many polynomials of the same degree in one call.
 
+        Args:
+        polynomials (list of lists): Coefficient lists, highest degree first, all of the same length.
+        max_iter (int): Maximum number of iterations per polynomial.
+        tolerance (float): Convergence tolerance.
+        method (str): "aberth", "companion" or "auto", as in poly_roots.
+        polish (bool): Newton-polish roots found from the companion matrix.
 
-        coefficients = [c / coefficients[0] for c in coefficients]
+        Returns:
+        list of lists: The roots of each polynomial, in input order.
 
-      
-        roots = [cmath.exp(2j * cmath.pi * i / degree) for i in range(degree)]
+        Raises:
+        ValueError: If the degrees differ or any polynomial fails to converge.
+        """
+        if not polynomials:
+            return []
+        length = len(polynomials[0])
+        if any(len(poly) != length for poly in polynomials):
+            raise ValueError("All polynomials in a batch must have the same degree.")
 
-        for _ in range(max_iter):
-            new_roots = []
-            for i, root in enumerate(roots):
-               
-                f_value = sum(c * root ** (degree - k) for k, c in enumerate(coefficients))
-                f_derivative = sum(
-                    (degree - k) * c * root ** (degree - k - 1) for k, c in enumerate(coefficients[:-1])
-                )
-
-              
-                correction = f_value / f_derivative if f_derivative != 0 else 0
-                for j, other_root in enumerate(roots):
-                    if i != j:
-                        correction /= (root - other_root)
-                new_root = root - correction
-
-                new_roots.append(new_root)
-
-         
-            if all(abs(new_root - old_root) < tolerance for new_root, old_root in zip(new_roots, roots)):
-                return new_roots
-            roots = new_roots
-
-        raise ValueError("The method did not converge within the maximum number of iterations.")
-
-# Example:
-try:
-    print("Input the degree of the polynomial (n):")
-    n = int(input())
-    print(f"Input the {n+1} complex coefficients of the polynomial:")
-    coefficients = [complex(input()) for _ in range(n+1)]
-
-    solver = PolynomialRoots()
-    roots = solver.poly_roots(coefficients)
-
-    print("Roots of the polynomial:")
-    for root in roots:
-        print(root)
-
-except ValueError as e:
-    print("\nError:", e)
+        degree = length - 1
+        angles = [cmath.exp(1j * (2 * cmath.pi * k / degree + 0.4)) for k in range(degree)] if degree > 0 else []
+        results = []
+        for index, poly in enumerate(polynomials):
+            roots = PolynomialRoots.solve(poly, angles, max_iter, tolerance, method, polish)
+            if roots is None:
+                raise ValueError(f"Polynomial {index} did not converge within the maximum number of iterations.")
+            results.append(roots)
+        return results
+
+    @staticmethod
+    def parse_line(line):
+        """
+        Parse one polynomial from a text line of comma- or space-separated coefficients.
+
+        Args:
+        line (str): The line; blank lines and lines starting with '#' yield None.
+
+        Returns:
+        list or None: The complex coefficients, highest degree first.
+        """
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return None
+        return [complex(token) for token in line.replace(",", " ").split()]
+
+    @staticmethod
+    def read_polynomials(stream, binary=False, degree=None, complex_input=False):
+        """
+        Stream polynomials from a text or binary file object.
+
+        Text input has one polynomial per line. Binary input is a packed array of
+        little-endian float64 values: degree + 1 coefficients per polynomial, or
+        (real, imag) pairs when complex_input is True.
+
+        Args:
+        stream (file): A text stream, or a binary stream when binary is True.
+        binary (bool): If True, read the packed binary format.
+        degree (int, optional): Polynomial degree; required for binary input.
+        complex_input (bool): If True, binary coefficients are (real, imag) pairs.
+
+        Yields:
+        list: The coefficients of each polynomial, highest degree first.
+
+        Raises:
+        ValueError: If binary input is requested without a degree or is truncated.
+        """
+        if not binary:
+            for line in stream:
+                coefficients = PolynomialRoots.parse_line(line)
+                if coefficients is not None:
+                    yield coefficients
+            return
+
+        if degree is None or degree < 1:
+            raise ValueError("Binary input needs the polynomial degree (at least 1).")
+        width = (degree + 1) * (2 if complex_input else 1)
+        record = width * 8
+        while True:
+            chunk = stream.read(record * 1024)
+            if not chunk:
+                return
+            if len(chunk) % record:
+                raise ValueError("Binary input ends in the middle of a polynomial.")
+            values = array.array("d")
+            values.frombytes(chunk)
+            if sys.byteorder != "little":
+                values.byteswap()
+            for start in range(0, len(values), width):
+                block = values[start:start + width]
+                if complex_input:
+                    yield [complex(block[i], block[i + 1]) for i in range(0, width, 2)]
+                else:
+                    yield list(block)
+
+    @staticmethod
+    def solve_chunk(task):
+        """
+        Solve a chunk of polynomials; the unit of work sent to each worker process.
+
+        Args:
+        task (tuple): (polynomials, max_iter, tolerance, method, polish).
+
+        Returns:
+        list: For each polynomial, a (roots, status) pair, where status is "aberth",
+        "companion" or "failed" and roots is None on failure.
+        """
+        polynomials, max_iter, tolerance, method, polish = task
+        results = []
+        for poly in polynomials:
+            try:
+                if method == "companion":
+                    results.append((PolynomialRoots.companion_roots(poly, polish), "companion"))
+                    continue
+                roots = PolynomialRoots.solve(poly, None, max_iter, tolerance, "aberth", polish)
+                if roots is not None:
+                    results.append((roots, "aberth"))
+                elif method == "auto":
+                    results.append((PolynomialRoots.companion_roots(poly, polish), "companion"))
+                else:
+                    results.append((None, "failed"))
+            except (ValueError, ZeroDivisionError, OverflowError):
+                results.append((None, "failed"))
+        return results
+
+    @staticmethod
+    def solve_stream(polynomials, workers=None, chunk_size=256, max_iter=100, tolerance=1e-10,
+                     method="auto", polish=True, stats=None):
+        """
+        Solve a stream of polynomials across a process pool, yielding results in input order.
+
+        Args:
+        polynomials (iterable): Coefficient lists, highest degree first.
+        workers (int, optional): Number of worker processes; 1 solves in this process,
+        None uses one per CPU.
+        chunk_size (int): Number of polynomials sent to a worker at a time.
+        max_iter (int): Maximum number of Aberth iterations.
+        tolerance (float): Aberth convergence tolerance.
+        method (str): "aberth", "companion" or "auto".
+        polish (bool): Newton-polish roots found from the companion matrix.
+        stats (dict, optional): Updated with counts per status, "total", "seconds" and
+        "per_second".
+
+        Yields:
+        tuple: (roots, status) for each polynomial; roots is None when it failed.
+        """
+        if stats is None:
+            stats = {}
+        for key in ("total", "aberth", "companion", "failed"):
+            stats[key] = 0
+        started = time.perf_counter()
+
+        def tasks():
+            chunk = []
+            for poly in polynomials:
+                chunk.append(poly)
+                if len(chunk) == chunk_size:
+                    yield (chunk, max_iter, tolerance, method, polish)
+                    chunk = []
+            if chunk:
+                yield (chunk, max_iter, tolerance, method, polish)
+
+        def record(results):
+            for roots, status in results:
+                stats["total"] += 1
+                stats[status] += 1
+                yield roots, status
+
+        try:
+            if workers == 1:
+                for task in tasks():
+                    yield from record(PolynomialRoots.solve_chunk(task))
+            else:
+                with multiprocessing.Pool(workers) as pool:
+                    for results in pool.imap(PolynomialRoots.solve_chunk, tasks()):
+                        yield from record(results)
+        finally:
+            stats["seconds"] = time.perf_counter() - started
+            stats["per_second"] = stats["total"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+
+    @staticmethod
+    def write_roots(stream, roots, binary=False, degree=None):
+        """
+        Write the roots of one polynomial.
+
+        Text output is one line of space-separated complex numbers ("nan" on failure).
+        Binary output is degree (real, imag) float64 pairs, so every record of a
+        stream of same-degree polynomials has the same width: a failed polynomial
+        writes degree NaN pairs, and roots lost to leading zero coefficients are
+        padded with NaN pairs.
+
+        Args:
+        stream (file): A text stream, or a binary stream when binary is True.
+        roots (list or None): The roots, or None for a failed polynomial.
+        binary (bool): If True, write packed little-endian float64 pairs.
+        degree (int, optional): The degree of the polynomial as read, which sets the
+        width of a binary record; defaults to the number of roots.
+
+        Raises:
+        ValueError: If a failed polynomial is written in binary without its degree.
+        """
+        if not binary:
+            stream.write("nan\n" if roots is None else " ".join(str(complex(r)) for r in roots) + "\n")
+            return
+        roots = roots or []
+        if degree is None:
+            if not roots:
+                raise ValueError("Binary output of a failed polynomial needs its degree.")
+            degree = len(roots)
+        values = array.array("d")
+        for r in roots[:degree]:
+            values.append(r.real)
+            values.append(r.imag)
+        values.extend([math.nan] * (2 * degree - len(values)))
+        if sys.byteorder != "little":
+            values.byteswap()
+        stream.write(values.tobytes())
+
+    @staticmethod
+    def main(argv=None):
+        """
+        Command-line entry point: solve polynomials from a file or stdin.
+
+        Run without arguments from a terminal, it prompts for a single polynomial.
+
+        Args:
+        argv (list, optional): Command-line arguments; defaults to sys.argv[1:].
+
+        Returns:
+        int: Process exit status (1 if any polynomial failed).
+        """
+        parser = argparse.ArgumentParser(description="Find the roots of polynomials, one per line.")
+        parser.add_argument("input", nargs="?", default="-", help="Input file, or '-' for stdin.")
+        parser.add_argument("-o", "--output", default="-", help="Output file, or '-' for stdout.")
+        parser.add_argument("--binary", action="store_true", help="Read packed float64 coefficients.")
+        parser.add_argument("--binary-output", action="store_true", help="Write packed float64 (re, im) roots.")
+        parser.add_argument("--complex", action="store_true", help="Binary coefficients are (re, im) pairs.")
+        parser.add_argument("--degree", type=int, help="Polynomial degree (binary input).")
+        parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+        parser.add_argument("--chunk-size", type=int, default=256, help="Polynomials per work unit.")
+        parser.add_argument("--method", choices=("aberth", "companion", "auto"), default="auto")
+        parser.add_argument("--max-iter", type=int, default=100)
+        parser.add_argument("--tolerance", type=float, default=1e-10)
+        parser.add_argument("--quiet", action="store_true", help="Do not print statistics to stderr.")
+        args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+        if argv is None and len(sys.argv) == 1 and sys.stdin.isatty():
+            print("Input the degree of the polynomial (n):")
+            n = int(input())
+            print(f"Input the {n+1} complex coefficients of the polynomial:")
+            coefficients = [complex(input()) for _ in range(n + 1)]
+            print("Roots of the polynomial:")
+            for root in PolynomialRoots.poly_roots(coefficients, method=args.method):
+                print(root)
+            return 0
+
+        if args.input == "-":
+            source = sys.stdin.buffer if args.binary else sys.stdin
+        else:
+            source = open(args.input, "rb" if args.binary else "r")
+        if args.output == "-":
+            sink = sys.stdout.buffer if args.binary_output else sys.stdout
+        else:
+            sink = open(args.output, "wb" if args.binary_output else "w")
+
+        stats = {}
+        degrees = collections.deque()
+
+        def tracked(polynomials):
+            for poly in polynomials:
+                degrees.append(len(poly) - 1)
+                yield poly
+
+        try:
+            polynomials = PolynomialRoots.read_polynomials(source, args.binary, args.degree, args.complex)
+            for roots, _ in PolynomialRoots.solve_stream(
+                    tracked(polynomials), args.workers, args.chunk_size, args.max_iter,
+                    args.tolerance, args.method, stats=stats):
+                PolynomialRoots.write_roots(sink, roots, args.binary_output, degrees.popleft())
+        finally:
+            if source not in (sys.stdin, sys.stdin.buffer):
+                source.close()
+            if sink in (sys.stdout, sys.stdout.buffer):
+                sink.flush()
+            else:
+                sink.close()
+
+        if not args.quiet:
+            print(f"Solved {stats['total']} polynomials in {stats['seconds']:.3f} s "
+                  f"({stats['per_second']:.0f}/s): {stats['aberth']} by Aberth, "
+                  f"{stats['companion']} by companion matrix, {stats['failed']} failed.",
+                  file=sys.stderr)
+        return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(PolynomialRoots.main())
+    except ValueError as e:
+        print("\nError:", e)
+        sys.exit(1)
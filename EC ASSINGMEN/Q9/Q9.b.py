@@ -1,3 +1,13 @@
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixPolynomialsNoLib:
     @staticmethod
     def determinant(matrix):
@@ -64,71 +74,139 @@ class MatrixPolynomialsNoLib:
         return [[1 if i == j else 0 for j in range(size)] for i in range(size)]
 
     @staticmethod
-    def characteristic_polynomial(A):
+    def berkowitz(A):
         """
-        Compute the characteristic polynomial of a square matrix A.
+        Compute the characteristic polynomial det(lambda I - A) with Berkowitz's algorithm.
+
+        The algorithm uses no division, so integer (or Fraction) input gives exact
+        coefficients. Cost is O(n^4).
 
         Args:
         A (list of lists): The input square matrix.
 
         Returns:
-        list: Coefficients of the characteristic polynomial.
+        list: Coefficients of the monic characteristic polynomial, highest degree first.
         """
         n = len(A)
-        identity = MatrixPolynomialsNoLib.identity_matrix(n)
-        coeffs = []
+        if n == 0:
+            return [1]
 
-        for lam in range(n + 1):
-            lambda_identity = MatrixPolynomialsNoLib.scalar_multiply_matrix(identity, lam)
-            mat = MatrixPolynomialsNoLib.subtract_matrices(A, lambda_identity)
-            coeffs.append(MatrixPolynomialsNoLib.determinant(mat))
-        return coeffs
+        poly = [1, -A[0][0]]
+        for r in range(1, n):
+            M = [row[:r] for row in A[:r]]
+            R = A[r][:r]
+            C = [A[i][r] for i in range(r)]
+
+            toeplitz = [1, -A[r][r]]
+            vector = C
+            for _ in range(r):
+                toeplitz.append(-sum(x * y for x, y in zip(R, vector)))
+                vector = [sum(x * y for x, y in zip(row, vector)) for row in M]
+
+            poly = [sum(toeplitz[i - j] * poly[j] for j in range(max(0, i - r - 1), min(i, r) + 1))
+                    for i in range(r + 2)]
+        return poly
 
     @staticmethod
-    def eigenvalues(A, tolerance=1e-6, max_iter=100):
+    def hessenberg_characteristic_polynomial(A):
         """
-        Approximate eigenvalues by iteratively refining guesses.
+        Compute det(lambda I - A) by Hessenberg reduction and the Hessenberg determinant recurrence.
+
+        Cost is O(n^3) in floating point.
 
         Args:
         A (list of lists): The input square matrix.
 
         Returns:
-        list: Eigenvalues of A.
+        list: Coefficients of the monic characteristic polynomial, highest degree first.
         """
-        char_poly = MatrixPolynomialsNoLib.characteristic_polynomial(A)
-        roots = []
+        H = linalg.q9_e.MatrixDiagonalization.hessenberg(A)
+        n = len(H)
+
+        polys = [[1.0]]
+        for k in range(1, n + 1):
+            previous = polys[k - 1]
+            current = [0.0] + previous
+            diagonal = H[k - 1][k - 1]
+            for i, c in enumerate(previous):
+                current[i] -= diagonal * c
+
+            product = 1.0
+            for i in range(k - 1, 0, -1):
+                product *= H[i][i - 1]
+                if product == 0:
+                    break
+                factor = H[i - 1][k - 1] * product
+                for j, c in enumerate(polys[i - 1]):
+                    current[j] -= factor * c
+            polys.append(current)
 
-        def evaluate_poly(poly, x):
-            return sum(c * (x ** i) for i, c in enumerate(poly[::-1]))
+        return polys[n][::-1]
 
-        def derivative_poly(poly):
-            return [(i * poly[i]) for i in range(1, len(poly))]
+    @staticmethod
+    def characteristic_polynomial(A, method="auto"):
+        """
+        Compute the coefficients of the characteristic polynomial det(lambda I - A).
 
-        for guess in range(len(char_poly) - 1):
-            x = guess
-            for _ in range(max_iter):
-                fx = evaluate_poly(char_poly, x)
-                dfx = evaluate_poly(derivative_poly(char_poly), x)
-                if abs(fx) < tolerance:
-                    roots.append(x)
-                    break
-                x -= fx / dfx
-        return roots
-        
+        The result is monic and ordered highest degree first, the same layout that
+        PolynomialRoots.poly_roots takes.
 
-# Example: 
-A = [
-    [1, 2, 3],
-    [0, 1, 4],
-    [5, 6, 0]
-]
+        Args:
+        A (list of lists): The input square matrix.
+        method (str): "berkowitz" (exact, division-free), "hessenberg" (floating point,
+        O(n^3)) or "auto" (Berkowitz for integer input, Hessenberg otherwise).
+
+        Returns:
+        list: Coefficients of the characteristic polynomial.
+
+        Raises:
+        ValueError: If the matrix is not square or the method is unknown.
+        """
+        n = len(A)
+        if any(len(row) != n for row in A):
+            raise ValueError("The matrix must be square.")
+        if method == "auto":
+            exact = all(isinstance(x, int) or hasattr(x, "denominator") for row in A for x in row)
+            method = "berkowitz" if exact else "hessenberg"
+
+        if method == "berkowitz":
+            return MatrixPolynomialsNoLib.berkowitz(A)
+        if method == "hessenberg":
+            return MatrixPolynomialsNoLib.hessenberg_characteristic_polynomial(A)
+        raise ValueError("Method must be 'auto', 'berkowitz' or 'hessenberg'.")
 
-solver = MatrixPolynomialsNoLib()
+    @staticmethod
+    def eigenvalues(A):
+        """
+        Compute the eigenvalues of A, repeated by multiplicity.
 
-char_poly = solver.characteristic_polynomial(A)
-print("Characteristic Polynomial Coefficients:")
-print(char_poly)
+        The roots of the characteristic polynomial are too sensitive to rounding
+        (a double eigenvalue moves by about sqrt(eps)), so the eigenvalues come from
+        the Francis QR algorithm on the Hessenberg form instead.
 
-eigen_vals = solver.eigenvalues(A)
-print("\nEigenvalues:")
-print(eigen_vals)
+        Args:
+        A (list of lists): The input square matrix.
+
+        Returns:
+        list: Eigenvalues of A, as floats when real and complex numbers otherwise.
+        """
+        return linalg.q9_e.MatrixDiagonalization.eigenvalues(A)
+
+
+# Example: 
+if __name__ == "__main__":
+    A = [
+        [1, 2, 3],
+        [0, 1, 4],
+        [5, 6, 0]
+    ]
+
+    solver = MatrixPolynomialsNoLib()
+
+    char_poly = solver.characteristic_polynomial(A)
+    print("Characteristic Polynomial Coefficients (highest degree first):")
+    print(char_poly)
+
+    eigen_vals = solver.eigenvalues(A)
+    print("\nEigenvalues:")
+    print(eigen_vals)
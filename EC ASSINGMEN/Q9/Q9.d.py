@@ -1,3 +1,13 @@
+import os
+import sys
+
+try:
+    import linalg
+except ImportError:
+    # Run as a script: the linalg package sits next to "EC ASSINGMEN".
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    import linalg
+
 class MatrixEigenProperties:
     @staticmethod
     def determinant(matrix):
@@ -60,23 +70,48 @@ class MatrixEigenProperties:
         return matrix
 
     @staticmethod
-    def algebraic_multiplicity(A, eigenvalue):
-       
-        char_poly = MatrixEigenProperties.characteristic_polynomial(A)
-        return char_poly.count(eigenvalue)
+    def algebraic_multiplicity(A, eigenvalue, tolerance=1e-9):
+        """
+        Count how many times eigenvalue is a root of the characteristic polynomial of A.
+
+        The polynomial is deflated by (lambda - eigenvalue) with synthetic division
+        while the remainder vanishes; integer input with an integer eigenvalue is exact.
+
+        Args:
+        A (list of lists): The input square matrix.
+        eigenvalue (float): The eigenvalue.
+        tolerance (float): Relative threshold for a vanishing remainder.
+
+        Returns:
+        int: The algebraic multiplicity (0 if eigenvalue is not an eigenvalue).
+        """
+        poly = MatrixEigenProperties.characteristic_polynomial(A)
+        multiplicity = 0
+        while len(poly) > 1:
+            quotient = [poly[0]]
+            for c in poly[1:]:
+                quotient.append(c + eigenvalue * quotient[-1])
+            remainder = quotient.pop()
+            scale = max(abs(c) * max(1, abs(eigenvalue)) ** (len(poly) - 1 - i) for i, c in enumerate(poly))
+            if abs(remainder) > tolerance * scale:
+                break
+            multiplicity += 1
+            poly = quotient
+        return multiplicity
 
     @staticmethod
     def characteristic_polynomial(A):
-        n = len(A)
-        identity = MatrixEigenProperties.identity_matrix(n)
-        coeffs = []
+        """
+        Compute det(lambda I - A) with MatrixPolynomialsNoLib.berkowitz, division-free in O(n^4).
 
-        for lam in range(n + 1):
-            lambda_identity = MatrixEigenProperties.scalar_multiply_matrix(identity, lam)
-            mat = MatrixEigenProperties.subtract_matrices(A, lambda_identity)
-            coeffs.append(MatrixEigenProperties.determinant(mat))
+        Args:
+        A (list of lists): The input square matrix.
 
-        return coeffs
+        Returns:
+        list: Coefficients of the monic characteristic polynomial, highest degree first;
+        exact for integer input.
+        """
+        return linalg.q9_b.MatrixPolynomialsNoLib.berkowitz(A)
 
     @staticmethod
     def geometric_multiplicity(A, eigenvalue):
@@ -102,26 +137,27 @@ class MatrixEigenProperties:
 
 
 # Example:
-A = [
-    [6, 2],
-    [2, 3]
-]
+if __name__ == "__main__":
+    A = [
+        [6, 2],
+        [2, 3]
+    ]
 
-eigenvalue = 5
+    eigenvalue = 5
 
-try:
-    solver = MatrixEigenProperties()
+    try:
+        solver = MatrixEigenProperties()
 
-    alg_mul = solver.algebraic_multiplicity(A, eigenvalue)
-    print("Algebraic Multiplicity:", alg_mul)
+        alg_mul = solver.algebraic_multiplicity(A, eigenvalue)
+        print("Algebraic Multiplicity:", alg_mul)
 
-    geo_mul = solver.geometric_multiplicity(A, eigenvalue)
-    print("Geometric Multiplicity:", geo_mul)
+        geo_mul = solver.geometric_multiplicity(A, eigenvalue)
+        print("Geometric Multiplicity:", geo_mul)
 
-    eigen_basis = solver.eigen_basis(A, eigenvalue)
-    print("Eigenbasis:")
-    for vec in eigen_basis:
-        print(vec)
+        eigen_basis = solver.eigen_basis(A, eigenvalue)
+        print("Eigenbasis:")
+        for vec in eigen_basis:
+            print(vec)
 
-except ValueError as e:
-    print("\nError:", e)
+    except ValueError as e:
+        print("\nError:", e)
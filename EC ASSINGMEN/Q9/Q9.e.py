@@ -1,3 +1,6 @@
+import math
+import operator
+
 class MatrixDiagonalization:
     @staticmethod
     def determinant(matrix):
@@ -22,16 +25,53 @@ class MatrixDiagonalization:
         return [[A[i][j] - B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
 
     @staticmethod
-    def solve_homogeneous_system(matrix):
-        n = len(matrix)
-        rref = MatrixDiagonalization.row_reduce(matrix)
-        basis_vectors = []
+    def solve_homogeneous_system(matrix, tolerance=1e-10):
+        """
+        Compute a basis of the null space of a (possibly complex) matrix.
+
+        The input is not modified. Pivots whose magnitude is at most
+        tolerance * max(1, max |entry|) are treated as zero.
 
-        for i, row in enumerate(rref):
-            if all(abs(x) < 1e-10 for x in row):
-                vector = [0] * n
-                vector[i] = 1
-                basis_vectors.append(vector)
+        Args:
+        matrix (list of lists): The input matrix.
+        tolerance (float): Relative pivot threshold.
+
+        Returns:
+        list of lists: Unit vectors spanning the null space.
+        """
+        rows = len(matrix)
+        cols = len(matrix[0])
+        work = [list(row) for row in matrix]
+        threshold = tolerance * max(1.0, max(abs(x) for row in work for x in row))
+
+        pivot_cols = []
+        r = 0
+        for c in range(cols):
+            if r == rows:
+                break
+            pivot_row = max(range(r, rows), key=lambda i: abs(work[i][c]))
+            if abs(work[pivot_row][c]) <= threshold:
+                continue
+            work[r], work[pivot_row] = work[pivot_row], work[r]
+            pivot = work[r][c]
+            work[r] = [x / pivot for x in work[r]]
+            for i in range(rows):
+                if i != r and work[i][c] != 0:
+                    factor = work[i][c]
+                    work[i] = [a - factor * b for a, b in zip(work[i], work[r])]
+            pivot_cols.append(c)
+            r += 1
+
+        basis_vectors = []
+        for free in range(cols):
+            if free in pivot_cols:
+                continue
+            vector = [0.0] * cols
+            vector[free] = 1.0
+            for i, c in enumerate(pivot_cols):
+                vector[c] = -work[i][free]
+            norm = sum(abs(x) ** 2 for x in vector) ** 0.5
+            basis_vectors.append([x / norm for x in vector])
 
         return basis_vectors
 
@@ -61,54 +101,311 @@ class MatrixDiagonalization:
         return matrix
 
     @staticmethod
-    def eigenvalues(A):
+    def hessenberg(A):
+        """
+        Reduce a real square matrix to upper Hessenberg form with Householder reflections.
+
+        Args:
+        A (list of lists): The input square matrix (not modified).
+
+        Returns:
+        list of lists: An upper Hessenberg matrix similar to A.
+        """
         n = len(A)
-        identity = MatrixDiagonalization.identity_matrix(n)
-        eigenvalues = []
+        H = [[float(x) for x in row] for row in A]
 
-        for i in range(n):
-            shifted_matrix = MatrixDiagonalization.subtract_matrices(A, MatrixDiagonalization.scalar_multiply_matrix(identity, i))
-            if abs(MatrixDiagonalization.determinant(shifted_matrix)) < 1e-10:
-                eigenvalues.append(i)
+        for k in range(n - 2):
+            x = [H[i][k] for i in range(k + 1, n)]
+            norm_x = math.sqrt(sum(v * v for v in x))
+            if norm_x == 0 or norm_x == abs(x[0]):
+                continue
+            beta = -math.copysign(norm_x, x[0])
+            x[0] -= beta
+            scale = math.sqrt(2) / math.sqrt(sum(v * v for v in x))
+            u = [v * scale for v in x]
 
-        return eigenvalues
+            for j in range(k, n):
+                w = sum(u[r] * H[k + 1 + r][j] for r in range(n - k - 1))
+                if w != 0:
+                    for r in range(n - k - 1):
+                        H[k + 1 + r][j] -= w * u[r]
+            for row in H:
+                w = sum(map(operator.mul, row[k + 1:], u))
+                if w != 0:
+                    row[k + 1:] = [a - w * b for a, b in zip(row[k + 1:], u)]
+            for i in range(k + 2, n):
+                H[i][k] = 0.0
+
+        return H
 
     @staticmethod
-    def eigenvectors(A, eigenvalue):
-       
-        n = len(A)
-        identity = MatrixDiagonalization.identity_matrix(n)
-        lambda_identity = MatrixDiagonalization.scalar_multiply_matrix(identity, eigenvalue)
-        shifted_matrix = MatrixDiagonalization.subtract_matrices(A, lambda_identity)
-        return MatrixDiagonalization.solve_homogeneous_system(shifted_matrix)
+    def hessenberg_qr(H, max_iter=60):
+        """
+        Compute all eigenvalues of an upper Hessenberg matrix with the Francis double-shift QR.
+
+        Args:
+        H (list of lists): An upper Hessenberg matrix; it is overwritten.
+        max_iter (int): Maximum number of iterations per eigenvalue.
+
+        Returns:
+        list: The eigenvalues, as floats when real and complex numbers otherwise.
+
+        Raises:
+        ValueError: If the iteration does not converge.
+        """
+        a = H
+        n = len(a)
+        wr = [0.0] * n
+        wi = [0.0] * n
+        anorm = sum(abs(a[i][j]) for i in range(n) for j in range(max(i - 1, 0), n))
+        nn = n - 1
+        t = 0.0
+
+        while nn >= 0:
+            its = 0
+            while True:
+                l = nn
+                while l >= 1:
+                    s = abs(a[l - 1][l - 1]) + abs(a[l][l])
+                    if s == 0:
+                        s = anorm
+                    if abs(a[l][l - 1]) + s == s:
+                        a[l][l - 1] = 0.0
+                        break
+                    l -= 1
+
+                x = a[nn][nn]
+                if l == nn:
+                    wr[nn] = x + t
+                    wi[nn] = 0.0
+                    nn -= 1
+                    break
+
+                y = a[nn - 1][nn - 1]
+                w = a[nn][nn - 1] * a[nn - 1][nn]
+                if l == nn - 1:
+                    p = 0.5 * (y - x)
+                    q = p * p + w
+                    z = math.sqrt(abs(q))
+                    x += t
+                    if q >= 0:
+                        z = p + math.copysign(z, p)
+                        wr[nn - 1] = wr[nn] = x + z
+                        if z != 0:
+                            wr[nn] = x - w / z
+                        wi[nn - 1] = wi[nn] = 0.0
+                    else:
+                        wr[nn - 1] = wr[nn] = x + p
+                        wi[nn - 1] = -z
+                        wi[nn] = z
+                    nn -= 2
+                    break
+
+                if its == max_iter:
+                    raise ValueError("The Hessenberg QR iteration did not converge.")
+                if its and its % 10 == 0:
+                    t += x
+                    for i in range(nn + 1):
+                        a[i][i] -= x
+                    s = abs(a[nn][nn - 1]) + abs(a[nn - 1][nn - 2])
+                    y = x = 0.75 * s
+                    w = -0.4375 * s * s
+                its += 1
+
+                m = nn - 2
+                while m >= l:
+                    z = a[m][m]
+                    r = x - z
+                    s = y - z
+                    p = (r * s - w) / a[m + 1][m] + a[m][m + 1]
+                    q = a[m + 1][m + 1] - z - r - s
+                    r = a[m + 2][m + 1]
+                    s = abs(p) + abs(q) + abs(r)
+                    p /= s
+                    q /= s
+                    r /= s
+                    if m == l:
+                        break
+                    u = abs(a[m][m - 1]) * (abs(q) + abs(r))
+                    v = abs(p) * (abs(a[m - 1][m - 1]) + abs(z) + abs(a[m + 1][m + 1]))
+                    if u + v == v:
+                        break
+                    m -= 1
+
+                for i in range(m + 2, nn + 1):
+                    a[i][i - 2] = 0.0
+                    if i != m + 2:
+                        a[i][i - 3] = 0.0
+
+                for k in range(m, nn):
+                    if k != m:
+                        p = a[k][k - 1]
+                        q = a[k + 1][k - 1]
+                        r = a[k + 2][k - 1] if k != nn - 1 else 0.0
+                        x = abs(p) + abs(q) + abs(r)
+                        if x != 0:
+                            p /= x
+                            q /= x
+                            r /= x
+                    s = math.copysign(math.sqrt(p * p + q * q + r * r), p)
+                    if s == 0:
+                        continue
+                    if k == m:
+                        if l != m:
+                            a[k][k - 1] = -a[k][k - 1]
+                    else:
+                        a[k][k - 1] = -s * x
+                    p += s
+                    x = p / s
+                    y = q / s
+                    z = r / s
+                    q /= p
+                    r /= p
+                    for j in range(k, nn + 1):
+                        p = a[k][j] + q * a[k + 1][j]
+                        if k != nn - 1:
+                            p += r * a[k + 2][j]
+                            a[k + 2][j] -= p * z
+                        a[k + 1][j] -= p * y
+                        a[k][j] -= p * x
+                    for i in range(l, min(nn, k + 3) + 1):
+                        p = x * a[i][k] + y * a[i][k + 1]
+                        if k != nn - 1:
+                            p += z * a[i][k + 2]
+                            a[i][k + 2] -= p * r
+                        a[i][k + 1] -= p * q
+                        a[i][k] -= p
+
+        return [complex(re, im) if im != 0 else re for re, im in zip(wr, wi)]
 
     @staticmethod
-    def is_diagonalizable(A):
-      
-        eigenvalues = MatrixDiagonalization.eigenvalues(A)
-        dimension = len(A)
-        total_geo_multiplicity = 0
+    def eigenvalues(A):
+        """
+        Compute all eigenvalues of a real square matrix, repeated by multiplicity.
 
-        for eigenvalue in eigenvalues:
-            geo_multiplicity = len(MatrixDiagonalization.eigenvectors(A, eigenvalue))
-            total_geo_multiplicity += geo_multiplicity
+        Args:
+        A (list of lists): The input square matrix.
 
-        return total_geo_multiplicity == dimension
+        Returns:
+        list: The eigenvalues sorted by real then imaginary part, as floats when real
+        and complex numbers otherwise.
+        """
+        if any(len(row) != len(A) for row in A):
+            raise ValueError("The matrix must be square.")
+        H = MatrixDiagonalization.hessenberg(A)
+        values = MatrixDiagonalization.hessenberg_qr(H)
+        return sorted(values, key=lambda v: (v.real, v.imag))
 
     @staticmethod
-    def change_of_basis_to_diagonal(A):
-      
-        if not MatrixDiagonalization.is_diagonalizable(A):
-            raise ValueError("Matrix is not diagonalizable.")
+    def distinct_eigenvalues(A, tolerance=1e-6):
+        """
+        Group the eigenvalues of A into distinct values with their algebraic multiplicities.
+
+        Computed copies of a repeated eigenvalue scatter around it, so eigenvalues
+        within tolerance * max(1, max |a_ij|) of a group's mean join that group,
+        and the group is represented by its mean.
+
+        Args:
+        A (list of lists): The input square matrix.
+        tolerance (float): Relative clustering threshold.
+
+        Returns:
+        list: (eigenvalue, algebraic multiplicity) pairs.
+        """
+        scale = max(1.0, max(abs(x) for row in A for x in row))
+        groups = []
+        for value in MatrixDiagonalization.eigenvalues(A):
+            for group in groups:
+                if abs(value - sum(group) / len(group)) <= tolerance * scale:
+                    group.append(value)
+                    break
+            else:
+                groups.append([value])
+
+        result = []
+        for group in groups:
+            mean = sum(group) / len(group)
+            if isinstance(mean, complex) and abs(mean.imag) <= tolerance * scale:
+                mean = mean.real
+            result.append((mean, len(group)))
+        return result
+
+    @staticmethod
+    def eigen(A, vectors=False, tolerance=1e-6):
+        """
+        Compute the eigenvalues of A and, optionally, a basis of each eigenspace.
+
+        Args:
+        A (list of lists): The input square matrix.
+        vectors (bool): If True, also return the eigenvectors.
+        tolerance (float): Relative clustering threshold for repeated eigenvalues.
+
+        Returns:
+        list or tuple: The eigenvalues, or the distinct eigenvalues and, for each,
+        a list of eigenvectors spanning its eigenspace.
+        """
+        if not vectors:
+            return MatrixDiagonalization.eigenvalues(A)
+        distinct = MatrixDiagonalization.distinct_eigenvalues(A, tolerance)
+        values = [value for value, _ in distinct]
+        return values, [MatrixDiagonalization.eigenvectors(A, value) for value in values]
+
+    @staticmethod
+    def algebraic_multiplicity(A, eigenvalue, tolerance=1e-6):
+        """Return how many times eigenvalue is a root of the characteristic polynomial of A."""
+        scale = max(1.0, max(abs(x) for row in A for x in row))
+        for value, multiplicity in MatrixDiagonalization.distinct_eigenvalues(A, tolerance):
+            if abs(value - eigenvalue) <= tolerance * scale:
+                return multiplicity
+        return 0
+
+    @staticmethod
+    def geometric_multiplicity(A, eigenvalue):
+        """Return the dimension of the eigenspace of A for eigenvalue."""
+        return len(MatrixDiagonalization.eigenvectors(A, eigenvalue))
 
-        eigenvalues = MatrixDiagonalization.eigenvalues(A)
-        P = []
+    @staticmethod
+    def eigenvectors(A, eigenvalue, tolerance=1e-9):
+        """
+        Compute a basis of the eigenspace of A for eigenvalue.
+
+        Args:
+        A (list of lists): The input square matrix.
+        eigenvalue (float or complex): The eigenvalue.
+        tolerance (float): Relative pivot threshold for the null space.
+
+        Returns:
+        list of lists: Unit vectors spanning the eigenspace.
+        """
+        n = len(A)
+        shifted_matrix = [[A[i][j] - (eigenvalue if i == j else 0) for j in range(n)] for i in range(n)]
+        return MatrixDiagonalization.solve_homogeneous_system(shifted_matrix, tolerance)
+
+    @staticmethod
+    def is_diagonalizable(A):
+        """Check whether every eigenvalue of A has equal algebraic and geometric multiplicity."""
+        for eigenvalue, multiplicity in MatrixDiagonalization.distinct_eigenvalues(A):
+            if len(MatrixDiagonalization.eigenvectors(A, eigenvalue)) != multiplicity:
+                return False
+        return True
 
-        for eigenvalue in eigenvalues:
-            eigenvectors = MatrixDiagonalization.eigenvectors(A, eigenvalue)
-            P.extend(eigenvectors)
+    @staticmethod
+    def change_of_basis_to_diagonal(A):
+        """
+        Compute P whose columns are eigenvectors of A, so that P^-1 A P is diagonal.
 
-        return P
+        Raises:
+        ValueError: If the matrix is not diagonalizable.
+        """
+        columns = []
+        for eigenvalue, multiplicity in MatrixDiagonalization.distinct_eigenvalues(A):
+            vectors = MatrixDiagonalization.eigenvectors(A, eigenvalue)
+            if len(vectors) != multiplicity:
+                raise ValueError("Matrix is not diagonalizable.")
+            columns.extend(vectors)
+
+        n = len(A)
+        return [[columns[j][i] for j in range(n)] for i in range(n)]
 
     @staticmethod
     def scalar_multiply_matrix(matrix, scalar):
@@ -116,21 +413,22 @@ class MatrixDiagonalization:
 
 
 # Example:
-A = [
-    [4, 1],
-    [2, 3]
-]
-
-try:
-    diagonalization_solver = MatrixDiagonalization()
-
-    if diagonalization_solver.is_diagonalizable(A):
-        P = diagonalization_solver.change_of_basis_to_diagonal(A)
-        print("Change of Basis Matrix P (to diagonalize A):")
-        for row in P:
-            print(row)
-    else:
-        print("Matrix A is not diagonalizable.")
-
-except ValueError as e:
-    print("\nError:", e)
+if __name__ == "__main__":
+    A = [
+        [4, 1],
+        [2, 3]
+    ]
+
+    try:
+        diagonalization_solver = MatrixDiagonalization()
+
+        if diagonalization_solver.is_diagonalizable(A):
+            P = diagonalization_solver.change_of_basis_to_diagonal(A)
+            print("Change of Basis Matrix P (to diagonalize A):")
+            for row in P:
+                print(row)
+        else:
+            print("Matrix A is not diagonalizable.")
+
+    except ValueError as e:
+        print("\nError:", e)
@@ -0,0 +1,59 @@
+"""
+Run the example at the bottom of each source file.
+
+The examples sit behind `if __name__ == "__main__":` guards so that importing a
+module has no side effects; this runner executes them on demand.
+
+Usage:
+python -m linalg.examples            # every non-interactive example
+python -m linalg.examples Q4.F q8_d  # selected examples
+"""
+
+import runpy
+import sys
+
+from linalg import MODULES, load
+
+# Examples that read from stdin; they only run when named explicitly.
+INTERACTIVE = {"q9_apple"}
+
+
+def run_example(name):
+    """
+    Execute one file's example as if the file were run as a script.
+
+    Args:
+    name (str): Submodule name or original file stem, e.g. "q4_f" or "Q4.F".
+    """
+    module = load(name)
+    path = module.__file__
+    saved_argv = sys.argv
+    sys.argv = [path]
+    try:
+        runpy.run_path(path, run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+
+
+def main(argv=None):
+    """
+    Run the requested examples, or all non-interactive ones.
+
+    Args:
+    argv (list, optional): Example names; defaults to sys.argv[1:].
+
+    Returns:
+    int: Process exit status.
+    """
+    names = sys.argv[1:] if argv is None else argv
+    if not names:
+        names = [name for name in MODULES if name not in INTERACTIVE]
+    for name in names:
+        print(f"===== {name} =====")
+        run_example(name)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Measure the cold-import time of the library.
+
+Every measurement runs in a fresh interpreter so nothing is cached in
+sys.modules, and reports the median over several runs.
+
+Usage:
+python -m linalg.import_benchmark [--repeat N] [--per-module]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from linalg import MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import linalg
+loaded = time.perf_counter()
+for name in {names!r}:
+    linalg.load(name)
+print(loaded - start, time.perf_counter() - loaded)
+"""
+
+
+def time_import(names, repeat):
+    """
+    Time importing linalg and loading the given submodules in fresh interpreters.
+
+    Args:
+    names (list): Submodule names to load after importing the package.
+    repeat (int): Number of interpreter runs.
+
+    Returns:
+    tuple: (median seconds to import the package, median seconds to load the submodules).
+
+    Raises:
+    ValueError: If a run fails or writes anything besides the timing.
+    """
+    package, modules = [], []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", SNIPPET.format(names=list(names))],
+                                cwd=ROOT, capture_output=True, text=True)
+        lines = result.stdout.split()
+        if result.returncode != 0 or len(lines) != 2:
+            raise ValueError(f"Import of {list(names)} was not clean:\n{result.stdout}{result.stderr}")
+        package.append(float(lines[0]))
+        modules.append(float(lines[1]))
+    return statistics.median(package), statistics.median(modules)
+
+
+def main(argv=None):
+    """
+    Report cold-import times for the package, the whole library and, optionally, each module.
+
+    Args:
+    argv (list, optional): Command-line arguments; defaults to sys.argv[1:].
+
+    Returns:
+    int: Process exit status.
+    """
+    parser = argparse.ArgumentParser(description="Cold-import benchmark for linalg.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per measurement.")
+    parser.add_argument("--per-module", action="store_true", help="Also time each module on its own.")
+    args = parser.parse_args(argv)
+
+    package, library = time_import(list(MODULES), args.repeat)
+    print(f"import linalg:              {package * 1e3:8.2f} ms")
+    print(f"load all {len(MODULES):2d} modules:        {library * 1e3:8.2f} ms")
+    print(f"total:                      {(package + library) * 1e3:8.2f} ms")
+    if args.per_module:
+        for name in MODULES:
+            _, seconds = time_import([name], args.repeat)
+            print(f"  {name:<24}{seconds * 1e3:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
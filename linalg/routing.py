@@ -0,0 +1,27 @@
+"""
+Structure-aware entry points that pick an implementation from the input's properties.
+"""
+
+import linalg
+
+
+def solve(matrix, b):
+    """
+    Solve A x = b, routing banded matrices to the banded solvers.
+
+    The bandwidth is read with MatrixProperties. When the band (lower + upper + 1)
+    covers at most a quarter of the columns, the system is solved in banded storage
+    in O(n * bandwidth^2); otherwise it goes to the dense PLU solver.
+
+    Args:
+    matrix (list of lists): The square coefficient matrix.
+    b (list): The right-hand side.
+
+    Returns:
+    list: The solution vector.
+    """
+    n = len(matrix)
+    lower, upper = linalg.MatrixProperties(matrix).bandwidth()
+    if 4 * (lower + upper + 1) <= n:
+        return linalg.BandedMatrix.from_dense(matrix, lower, upper).solve(b)
+    return linalg.q4_f.PLUSolver.solve_plu(matrix, b)